@@ -0,0 +1,69 @@
+""" The main module of the batch subtitles analysis."""
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+from video_summary.context.subtitles_context import SubtitlesContext
+from video_summary.processes.subtitles_analysis_process import build_corpus, read_options, \
+    read_phrases_options
+from video_summary.subtitles.batch import analyse_batch
+from video_summary.subtitles.corpus import load
+
+# Logger
+LOGGER_NAME = 'Batch'
+LOGGER_LEVEL = logging.INFO
+LOGGER_FORMAT = '%(asctime)s %(levelname)-8s %(module)s: %(message)s'
+LOGGER_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+logging.basicConfig(stream=sys.stdout, level=LOGGER_LEVEL,
+                    format=LOGGER_FORMAT, datefmt=LOGGER_DATE_FORMAT)
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Name of the summary report
+REPORT_NAME = 'report.json'
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Analyse a batch of subtitles files with the subtitles configuration.')
+    parser.add_argument('output', help='the directory of the results and the report')
+    parser.add_argument('paths', nargs='+', help='the subtitles files')
+    parser.add_argument('-w', '--workers', type=int, default=0,
+                        help='the number of processes (0 for the number of CPUs)')
+    parser.add_argument('-c', '--corpus', help='the corpus model which weights the phrases')
+    parser.add_argument('-b', '--build-corpus', action='store_true',
+                        help='add the subtitles files to the corpus model before the analysis')
+    arguments = parser.parse_args()
+
+    with SubtitlesContext(read_only=True) as manager:
+        options = read_options(manager)
+        phrases_options = read_phrases_options(manager)
+        corpus_path = arguments.corpus or manager.corpus_path
+
+    corpus = None
+    if arguments.build_corpus:
+        if not corpus_path:
+            sys.exit('--build-corpus needs a corpus model path')
+        try:
+            corpus = build_corpus(arguments.paths, corpus_path, options, phrases_options)
+        except ValueError as error:
+            sys.exit(str(error))
+    elif corpus_path:
+        corpus = load(corpus_path)
+        if corpus.options != phrases_options:
+            sys.exit('{} was built with other options'.format(corpus_path))
+
+    report = analyse_batch(arguments.paths, arguments.output, options, corpus,
+                           arguments.workers)
+    for result in report['files']:
+        LOG.info('%-40s %6d phrases %8.3f s %s', os.path.basename(result['path']),
+                 result['phrases'], result['seconds'], result['error'] or '')
+    LOG.info('%d files analysed by %d processes in %.3f s', len(report['files']),
+             report['workers'], report['seconds'])
+
+    report_path = os.path.join(arguments.output, REPORT_NAME)
+    with open(report_path, 'w') as json_file:
+        json_file.write(json.dumps(report, indent=4))
+    LOG.info('report written at %s', report_path)
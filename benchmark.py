@@ -0,0 +1,32 @@
+""" The main module of the app's benchmarks."""
+
+import logging
+import sys
+
+from video_summary.benchmark import intervals_benchmark, snapping_benchmark, \
+    stemming_benchmark, summarizers_benchmark, vectorizers_benchmark
+
+# Logger
+LOGGER_NAME = 'Benchmark'
+LOGGER_LEVEL = logging.INFO
+LOGGER_FORMAT = '%(asctime)s %(levelname)-8s %(module)s: %(message)s'
+LOGGER_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+logging.basicConfig(stream=sys.stdout, level=LOGGER_LEVEL,
+                    format=LOGGER_FORMAT, datefmt=LOGGER_DATE_FORMAT)
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Benchmarks
+BENCHMARKS = {
+    'intervals': intervals_benchmark.run,
+    'snapping': snapping_benchmark.run,
+    'stemming': stemming_benchmark.run,
+    'summarizers': summarizers_benchmark.run,
+    'vectorizers': vectorizers_benchmark.run
+}
+
+if __name__ == '__main__':
+    for name in sys.argv[1:] or BENCHMARKS:
+        LOG.info('starting %s benchmark', name)
+        BENCHMARKS[name]()
+        LOG.info('ending %s benchmark', name)
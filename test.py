@@ -4,8 +4,32 @@ import logging
 import sys
 import unittest
 
+from video_summary.test.assembler_test import AssemblerTest
+from video_summary.test.batch_test import BatchTest
+from video_summary.test.cache_test import CacheTest
+from video_summary.test.cascade_test import CascadeTest
 from video_summary.test.contexts_test import ContextTest
+from video_summary.test.corpus_test import CorpusTest
+from video_summary.test.detections_store_test import DetectionsStoreTest
+from video_summary.test.duplicates_test import DuplicatesTest
+from video_summary.test.embedded_test import EmbeddedTest
+from video_summary.test.frame_ring_test import FrameRingTest
+from video_summary.test.incremental_test import IncrementalTest
+from video_summary.test.inference_service_test import InferenceServiceTest
+from video_summary.test.interval_set_test import IntervalSetTest
+from video_summary.test.lsa_test import LsaTest
+from video_summary.test.normalizer_test import NormalizerTest
+from video_summary.test.objects_timeline_test import ObjectsTimelineTest
+from video_summary.test.parser_test import ParserTest
+from video_summary.test.resume_test import ResumeTest
+from video_summary.test.scene_index_test import SceneIndexTest
+from video_summary.test.scoring_test import ScoringTest
+from video_summary.test.stop_words_test import StopWordsTest
+from video_summary.test.subtitle_table_test import SubtitleTableTest
+from video_summary.test.summarizers_test import SummarizersTest
+from video_summary.test.term_counts_test import TermCountsTest
 from video_summary.test.utils_test import UtilsTest
+from video_summary.test.vectorizers_test import VectorizersTest
 
 # Logger
 LOGGER_NAME = 'Test'
@@ -24,5 +48,29 @@ LOG.addHandler(SH)
 if __name__ == '__main__':
     unittest.main()
 
+    AssemblerTest()
+    BatchTest()
+    CacheTest()
+    CascadeTest()
     ContextTest()
+    CorpusTest()
+    DetectionsStoreTest()
+    DuplicatesTest()
+    EmbeddedTest()
+    FrameRingTest()
+    IncrementalTest()
+    InferenceServiceTest()
+    IntervalSetTest()
+    LsaTest()
+    NormalizerTest()
+    ObjectsTimelineTest()
+    ParserTest()
+    ResumeTest()
+    SceneIndexTest()
+    ScoringTest()
+    StopWordsTest()
+    SubtitleTableTest()
+    SummarizersTest()
+    TermCountsTest()
     UtilsTest()
+    VectorizersTest()
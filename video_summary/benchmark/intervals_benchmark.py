@@ -0,0 +1,110 @@
+"""Benchmark of the normalization of the resume times."""
+
+import logging
+
+import numpy as np
+
+from video_summary.benchmark.vectorizers_benchmark import measure
+from video_summary.objects.interval_set import from_times
+
+# Logger
+LOGGER_NAME = 'Benchmark.Intervals'
+LOG = logging.getLogger(LOGGER_NAME)
+
+
+def synthetic_times(intervals, duration, seed=0):
+    """
+    Method to get random overlapping times of a video.
+
+    ...
+
+    Parameters
+    ----------
+    intervals : int
+        the number of times
+    duration : int
+        the duration of the video in milliseconds
+    seed : int
+        the seed of the random generator
+
+    Returns
+    -------
+    list
+        a list of int pairs (start, end) with the times in milliseconds, sorted by their start
+
+    """
+
+    generator = np.random.default_rng(seed)
+    starts = np.sort(generator.integers(0, duration - 5000, intervals))
+    return np.stack([starts, starts + generator.integers(500, 5000, intervals)],
+                    axis=1).tolist()
+
+
+def loop_times(times):
+    """
+    Method to merge the sorted times with a loop over every time.
+
+    ...
+
+    Parameters
+    ----------
+    times : list
+        a sorted list of int pairs (start, end) with the times in milliseconds
+
+    Returns
+    -------
+    list
+        the merged times
+
+    """
+
+    result = []
+    last = -99
+    for time in times:
+        if time is not None:
+            if last + 1 < time[0]:
+                result.append(time)
+            else:
+                last = max(last, time[1])
+                result[-1][1] = last
+            last = result[-1][1]
+    return result
+
+
+def run(intervals=1000000, duration=10 * 60 * 60 * 1000):
+    """
+    Method to compare the loop over the times with the interval set.
+
+    ...
+
+    Parameters
+    ----------
+    intervals : int
+        the number of times
+    duration : int
+        the duration of the video in milliseconds
+
+    Returns
+    -------
+    list
+        a list of (name, seconds, MiB) results
+
+    """
+
+    times = synthetic_times(intervals, duration)
+    other = from_times(synthetic_times(intervals, duration, seed=1))
+    intervals_set = from_times(times)
+
+    candidates = {
+        'loop over the times': lambda: loop_times([list(time) for time in times]),
+        'interval set union': lambda: from_times(times).union(gap=1),
+        'interval set intersection': lambda: intervals_set.intersection(other),
+        'interval set subtract': lambda: intervals_set.subtract(other),
+        'interval set duration': intervals_set.duration
+    }
+    results = []
+    for name, function in candidates.items():
+        seconds, memory = measure(function)
+        results.append((name, seconds, memory))
+        LOG.info('%7d times %-26s %8.3f s %9.1f MiB', intervals, name, seconds, memory)
+    return results
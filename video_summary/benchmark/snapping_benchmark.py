@@ -0,0 +1,108 @@
+"""Benchmark of the snapping of the resume times to the scenes."""
+
+import logging
+
+import numpy as np
+
+from video_summary.benchmark.vectorizers_benchmark import measure
+from video_summary.context.general_context import SnapPolicy
+from video_summary.objects.scene_index import from_scenes
+
+# Logger
+LOGGER_NAME = 'Benchmark.Snapping'
+LOG = logging.getLogger(LOGGER_NAME)
+
+
+def synthetic_scenes(scenes, duration, seed=0):
+    """
+    Method to get random consecutive scenes of a video.
+
+    ...
+
+    Parameters
+    ----------
+    scenes : int
+        the maximum number of scenes
+    duration : int
+        the duration of the video in milliseconds
+    seed : int
+        the seed of the random generator
+
+    Returns
+    -------
+    list
+        a list of int pairs (start, end) with the scenes in milliseconds
+
+    """
+
+    generator = np.random.default_rng(seed)
+    bounds = np.unique(generator.integers(1, duration, scenes - 1))
+    return np.stack([np.concatenate([[0], bounds + 1]),
+                     np.concatenate([bounds, [duration]])], axis=1).tolist()
+
+
+def scan_scenes(scenes_list, times):
+    """
+    Method to snap the times with the scan of the scenes of every time.
+
+    ...
+
+    Parameters
+    ----------
+    scenes_list : list
+        a list of int pairs (start, end) with the scenes in milliseconds
+    times : list
+        a list of int pairs (start, end) with the times in milliseconds
+
+    Returns
+    -------
+    list
+        the times expanded to their scenes
+
+    """
+
+    for index, time in enumerate(times):
+        times[index][0] = [s for s in scenes_list if time[0] <= s[1]][0][0]
+        times[index][1] = [s for s in scenes_list if time[1] <= s[1]][0][1]
+    return times
+
+
+def run(intervals=20000, scenes=2000, duration=2 * 60 * 60 * 1000):
+    """
+    Method to compare the scan of the scenes with the scene index.
+
+    ...
+
+    Parameters
+    ----------
+    intervals : int
+        the number of resume times
+    scenes : int
+        the maximum number of scenes
+    duration : int
+        the duration of the video in milliseconds
+
+    Returns
+    -------
+    list
+        a list of (name, seconds, MiB) results
+
+    """
+
+    scenes_list = synthetic_scenes(scenes, duration)
+    generator = np.random.default_rng(1)
+    starts = generator.integers(0, duration - 20, intervals)
+    times = np.stack([starts, starts + 20], axis=1).tolist()
+
+    candidates = {
+        'scan of the scenes': lambda: scan_scenes(scenes_list, [list(time) for time in times]),
+        'scene index': lambda: from_scenes(scenes_list).snap(times),
+        'scene index nearest': lambda: from_scenes(scenes_list).snap(times, SnapPolicy.NEAREST)
+    }
+    results = []
+    for name, function in candidates.items():
+        seconds, memory = measure(function)
+        results.append((name, seconds, memory))
+        LOG.info('%6d times %5d scenes %-20s %8.3f s %9.1f MiB', intervals, len(scenes_list),
+                 name, seconds, memory)
+    return results
@@ -0,0 +1,93 @@
+"""Benchmark of the stemming of the subtitles words."""
+
+import logging
+import random
+import time
+
+from video_summary.context.subtitles_context import Languages
+from video_summary.subtitles.normalizer import TextNormalizer
+from video_summary.subtitles.stemmer import get_stemmer
+from video_summary.subtitles.term_counts import TermCounts
+
+# Logger
+LOGGER_NAME = 'Benchmark.Stemming'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Inflections of the synthetic words
+SYLLABLES = ('ba', 'ko', 'ri', 'tu', 'me', 'sa', 'lo', 'pe', 'ni', 'da', 'gu', 'fe')
+SUFFIXES = ('', 's', 'ed', 'ing', 'er', 'ers', 'ly', 'ness', 'ment', 'ments')
+
+
+def inflected_phrases(phrases, words_per_phrase=12, stems=5000, seed=0):
+    """
+    Method to get a transcript of random phrases of inflected words with a Zipf-like stem
+    distribution.
+
+    ...
+
+    Parameters
+    ----------
+    phrases : int
+        the number of phrases
+    words_per_phrase : int
+        the number of words of every phrase
+    stems : int
+        the number of different stems
+    seed : int
+        the seed of the random generator
+
+    Returns
+    -------
+    list
+        a list of strings with the phrases
+
+    """
+
+    generator = random.Random(seed)
+    words = [''.join(generator.choices(SYLLABLES, k=3)) for _ in range(stems)]
+    weights = [1 / (rank + 1) for rank in range(stems)]
+    return [' '.join(word + generator.choice(SUFFIXES)
+                     for word in generator.choices(words, weights, k=words_per_phrase))
+            for _ in range(phrases)]
+
+
+def run(phrases=(2000, 20000), language=Languages.ENGLISH):
+    """
+    Method to compare the vocabulary and the cleaning time with and without stemming.
+
+    The time is measured without tracing the memory, whose overhead on every call would hide
+    the cost of the memoized stems.
+
+    ...
+
+    Parameters
+    ----------
+    phrases : tuple
+        the numbers of phrases of the transcripts
+    language : int
+        the language of the stemming (class Languages)
+
+    Returns
+    -------
+    list
+        a list of (phrases, name, seconds, terms) results
+
+    """
+
+    results = []
+    for num_phrases in phrases:
+        texts = inflected_phrases(num_phrases)
+        get_stemmer.cache_clear()
+        candidates = {
+            'without stemming': TextNormalizer(lowercase=True),
+            'stemming cold memo': TextNormalizer(lowercase=True, stemmer=get_stemmer(language)),
+            'stemming warm memo': TextNormalizer(lowercase=True, stemmer=get_stemmer(language))
+        }
+        for name, normalizer in candidates.items():
+            start = time.perf_counter()
+            cleaned = normalizer.normalize_all(texts)
+            seconds = time.perf_counter() - start
+            terms = TermCounts(cleaned).counts.shape[1]
+            results.append((num_phrases, name, seconds, terms))
+            LOG.info('%6d phrases %-20s %8.3f s %8d terms', num_phrases, name, seconds, terms)
+    return results
@@ -0,0 +1,76 @@
+"""Benchmark of the summarizers of the subtitles against the LSA."""
+
+import logging
+
+import numpy as np
+
+from video_summary.benchmark.vectorizers_benchmark import measure, synthetic_phrases
+from video_summary.context.subtitles_context import SummarizerType, VectoringType
+from video_summary.subtitles.summarizers import build_summarizer
+from video_summary.subtitles.term_counts import TermCounts
+
+# Logger
+LOGGER_NAME = 'Benchmark.Summarizers'
+LOG = logging.getLogger(LOGGER_NAME)
+
+
+def top_phrases(scores, resume_percentage):
+    """
+    Method to get the phrases of the resume of some scores.
+
+    ...
+
+    Parameters
+    ----------
+    scores : array
+        a float numpy array with the score of every phrase
+    resume_percentage : float
+        the resume percentage of the phrases (0 - 100)
+
+    Returns
+    -------
+    set
+        a set with the indexes of the best phrases
+
+    """
+
+    count = int(len(scores) * resume_percentage / 100)
+    return set(np.argsort(-scores, kind='stable')[:count].tolist())
+
+
+def run(phrases=(500, 2000), resume_percentage=30):
+    """
+    Method to compare the runtime of the summarizers and the overlap of their resumes.
+
+    ...
+
+    Parameters
+    ----------
+    phrases : tuple
+        the numbers of phrases of the transcripts
+    resume_percentage : float
+        the resume percentage of the phrases (0 - 100)
+
+    Returns
+    -------
+    list
+        a list of (phrases, summarizer type, seconds, MiB, overlap with the LSA) results
+
+    """
+
+    results = []
+    for size in phrases:
+        matrix = TermCounts(synthetic_phrases(size)).weighting(
+            VectoringType.TF_IDF_WITH_SMOOTHING_IDF_AND_NORMALIZATION_L2)
+        resumes = {}
+        for summarizer_type in SummarizerType:
+            summarizer = build_summarizer(summarizer_type, resume_percentage)
+            scores = []
+            seconds, memory = measure(lambda: scores.append(summarizer.score(matrix)))
+            resumes[summarizer_type] = top_phrases(scores[0], resume_percentage)
+            overlap = len(resumes[summarizer_type] & resumes[SummarizerType.LSA]) / max(
+                1, len(resumes[SummarizerType.LSA]))
+            results.append((size, summarizer_type, seconds, memory, overlap))
+            LOG.info('%6d phrases %-10s %8.3f s %9.1f MiB %6.1f%% overlap', size,
+                     summarizer_type.name, seconds, memory, overlap * 100)
+    return results
@@ -0,0 +1,119 @@
+"""Benchmark of the dictionary and the hashing vectorizers of the subtitles."""
+
+import logging
+import random
+import time
+import tracemalloc
+
+from video_summary.context.subtitles_context import VectoringType
+from video_summary.subtitles.term_counts import TermCounts
+from video_summary.subtitles.vectorizers import build_vectorizer
+
+# Logger
+LOGGER_NAME = 'Benchmark.Vectorizers'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Benchmarked vectoring types
+VECTORING_TYPES = (VectoringType.COUNTERS, VectoringType.N_GRAM_COUNTERS,
+                   VectoringType.TF_IDF_WITH_SMOOTHING_IDF_AND_NORMALIZATION_L2)
+
+
+def synthetic_phrases(phrases, words_per_phrase=12, vocabulary=50000, seed=0):
+    """
+    Method to get a transcript of random phrases with a Zipf-like word distribution.
+
+    ...
+
+    Parameters
+    ----------
+    phrases : int
+        the number of phrases
+    words_per_phrase : int
+        the number of words of every phrase
+    vocabulary : int
+        the number of different words
+    seed : int
+        the seed of the random generator
+
+    Returns
+    -------
+    list
+        a list of strings with the phrases
+
+    """
+
+    generator = random.Random(seed)
+    words = ['w{}'.format(index) for index in range(vocabulary)]
+    weights = [1 / (rank + 1) for rank in range(vocabulary)]
+    return [' '.join(generator.choices(words, weights, k=words_per_phrase))
+            for _ in range(phrases)]
+
+
+def measure(function):
+    """
+    Method to measure the time and the peak of memory of a function.
+
+    ...
+
+    Parameters
+    ----------
+    function : callable
+        the function without arguments
+
+    Returns
+    -------
+    float
+        the seconds of the call
+    float
+        the peak of allocated memory in MiB
+
+    """
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak / 2 ** 20
+
+
+def run(phrases=20000, features=2 ** 18):
+    """
+    Method to compare the dictionary and the hashing vectorizers.
+
+    ...
+
+    Parameters
+    ----------
+    phrases : int
+        the number of phrases of the transcript
+    features : int
+        the number of hashed features
+
+    Returns
+    -------
+    list
+        a list of (name, vectoring type, seconds, MiB) results
+
+    """
+
+    texts = synthetic_phrases(phrases)
+    results = []
+    for vectoring_type in VECTORING_TYPES:
+        candidates = {
+            'scikit-learn dictionary':
+                lambda: build_vectorizer(vectoring_type).fit_transform(texts),
+            'scikit-learn hashing':
+                lambda: build_vectorizer(vectoring_type, features).fit_transform(texts),
+            'term counts dictionary':
+                lambda: TermCounts(texts).weighting(vectoring_type),
+            'term counts hashing':
+                lambda: TermCounts(texts, features).weighting(vectoring_type)
+        }
+        for name, function in candidates.items():
+            seconds, memory = measure(function)
+            results.append((name, vectoring_type, seconds, memory))
+            LOG.info('%-24s %-48s %8.3f s %9.1f MiB', name, vectoring_type.name, seconds,
+                     memory)
+    return results
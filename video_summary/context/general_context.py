@@ -19,6 +19,8 @@ RESUME_MODE = "resumeMode"
 DETECT_SCENES = "detectScenes"
 SCENES_DIFFERENCE = "scenesDifference"
 RESUME_TIMES = "resumeTimes"
+SNAP_POLICY = "snapPolicy"
+MAX_SNAP_EXTENSION = "maxSnapExtension"
 
 # Logger
 LOGGER_NAME = 'App.Context.General'
@@ -33,6 +35,13 @@ class ResumeMode(int, Enum):
     SUBTITLES_AND_OBJECTS = 2
 
 
+class SnapPolicy(int, Enum):
+    """ Parametrization for the snapping of the resume times to the scenes."""
+    EXPAND = 0
+    NEAREST = 1
+    LIMITED_EXPAND = 2
+
+
 class GeneralContext:
     """
     A class used to represent the application general context.
@@ -57,6 +66,11 @@ class GeneralContext:
         a boolean to activate the scene detection
     scenes_difference : float
         the difference percentage between scenes
+    snap_policy : int
+        the snapping of the resume times to the scenes (class SnapPolicy)
+    max_snap_extension : int
+        the maximum milliseconds which a resume time is moved to its scene by the
+        LIMITED_EXPAND snap policy
     resume_times : list
         a list of pair of ints (start, end) in milliseconds
     path : string
@@ -73,6 +87,8 @@ class GeneralContext:
         self.resume_mode = None
         self.detect_scenes = None
         self.scenes_difference = None
+        self.snap_policy = None
+        self.max_snap_extension = None
         self.resume_times = None
         if test:
             self.path = CONFIG_PATH_TEST
@@ -105,6 +121,8 @@ class GeneralContext:
         self.resume_mode = self.config.get(RESUME_MODE)
         self.detect_scenes = self.config.get(DETECT_SCENES)
         self.scenes_difference = self.config.get(SCENES_DIFFERENCE)
+        self.snap_policy = self.config.get(SNAP_POLICY, SnapPolicy.EXPAND)
+        self.max_snap_extension = self.config.get(MAX_SNAP_EXTENSION, 5000)
         self.resume_times = self.config.get(RESUME_TIMES)
         LOG.debug('general context loaded')
 
@@ -118,6 +136,8 @@ class GeneralContext:
             self.config[RESUME_MODE] = self.resume_mode
             self.config[DETECT_SCENES] = self.detect_scenes
             self.config[SCENES_DIFFERENCE] = self.scenes_difference
+            self.config[SNAP_POLICY] = self.snap_policy
+            self.config[MAX_SNAP_EXTENSION] = self.max_snap_extension
             self.config[RESUME_TIMES] = self.resume_times
             LOG.debug('general context saved')
 
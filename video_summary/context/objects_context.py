@@ -4,11 +4,19 @@ import json
 import logging
 import os
 
+from video_summary.objects.detections_store import DetectionsStore
+from video_summary.objects.detections_store import load as load_detections
+from video_summary.objects.objects_timeline import ObjectsTimeline, from_dict, load
+
 # Paths
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__)) + '/conf/'
 CONFIG_PATH = os.path.join(ROOT_DIR, 'ObjectsConfig.conf')
 CONFIG_PATH_DEFAULT = os.path.join(ROOT_DIR, 'ObjectsConfigDefault.conf')
 CONFIG_PATH_TEST = os.path.join(ROOT_DIR, 'ObjectsConfigTest.conf')
+TIMELINE_PATH = os.path.join(ROOT_DIR, 'ObjectsTimeline.npz')
+TIMELINE_PATH_TEST = os.path.join(ROOT_DIR, 'ObjectsTimelineTest.npz')
+DETECTIONS_PATH = os.path.join(ROOT_DIR, 'ObjectsDetections.npz')
+DETECTIONS_PATH_TEST = os.path.join(ROOT_DIR, 'ObjectsDetectionsTest.npz')
 
 # Strings for JSON
 OBJECTS_DICT = "objectsDict"
@@ -19,6 +27,17 @@ SCENES_PERIODICITY = "scenesPeriodicity"
 YOLO_WEIGHTS_PATH = "yoloWeightsPath"
 YOLO_CFG_PATH = "yoloCfgPath"
 YOLO_NAMES_PATH = "yoloNamesPath"
+MIN_CONFIDENCE = "minConfidence"
+MIN_AREA = "minArea"
+CASCADE = "cascade"
+SCREEN_WEIGHTS_PATH = "screenWeightsPath"
+SCREEN_CFG_PATH = "screenCfgPath"
+SCREEN_THRESHOLD = "screenThreshold"
+SHARED_INFERENCE = "sharedInference"
+INFERENCE_BATCH = "inferenceBatch"
+INFERENCE_LATENCY = "inferenceLatency"
+DECODER_WORKERS = "decoderWorkers"
+RING_SLOTS = "ringSlots"
 
 # Logger
 LOGGER_NAME = 'App.Context.Objects'
@@ -39,8 +58,14 @@ class ObjectsContext:
         a boolean to activate the testing mode
     config : dict
         a dict with all the general settings
+    objects_timeline : ObjectsTimeline
+        the compact index with all the objects appearances times in milliseconds
     objects_dict : dict
-        a dict with all the objects appearances times in milliseconds
+        a dict with all the objects appearances times in milliseconds (built from the
+        objects timeline on demand)
+    detections_store : DetectionsStore
+        the columnar store with the class, confidence and box of every detection (read from
+        its binary file on demand)
     objects_list : list
         a string list with objects to search
     optimization : bool
@@ -55,8 +80,36 @@ class ObjectsContext:
         the Yolo's cfg path
     yolo_names_path : str
         the Yolo's names path
+    min_confidence : float
+        the minimum confidence of the detections to resume (0.0 - 1.0), read from the
+        detections store, which only keeps the detections with a confidence of 0.05 or more
+    min_area : float
+        the minimum normalized area of the detections to resume (0.0 - 1.0), read from the
+        detections store like the minimum confidence
+    cascade : bool
+        a boolean to activate the screening of the frames with a small model
+    screen_weights_path : str
+        the screen model's weights path
+    screen_cfg_path : str
+        the screen model's cfg path
+    screen_threshold : float
+        the minimum screen confidence to run the full model (0.0 - 1.0)
+    shared_inference : bool
+        a boolean to activate the inference service shared between the analyses
+    inference_batch : int
+        the maximum number of frames per batch of the inference service
+    inference_latency : int
+        the maximum milliseconds that a frame waits for its batch to fill
+    decoder_workers : int
+        the number of processes which decode the frames (0 to decode in the analysis)
+    ring_slots : int
+        the number of frame slots shared between the decoders and the detector
     path : string
         the path for the configuration file
+    timeline_path : string
+        the path for the objects timeline binary file
+    detections_path : string
+        the path for the detections store binary file
 
     """
 
@@ -64,7 +117,9 @@ class ObjectsContext:
         LOG.debug('starting objects context')
         self.read_only = read_only
         self.config = None
-        self.objects_dict = None
+        self._objects_timeline = None
+        self._objects_dict = None
+        self._detections_store = None
         self.objects_list = None
         self.optimization = None
         self.milliseconds_periodicity = None
@@ -72,12 +127,66 @@ class ObjectsContext:
         self.yolo_weights_path = None
         self.yolo_cfg_path = None
         self.yolo_names_path = None
+        self.min_confidence = None
+        self.min_area = None
+        self.cascade = None
+        self.screen_weights_path = None
+        self.screen_cfg_path = None
+        self.screen_threshold = None
+        self.shared_inference = None
+        self.inference_batch = None
+        self.inference_latency = None
+        self.decoder_workers = None
+        self.ring_slots = None
         if test:
             self.path = CONFIG_PATH_TEST
+            self.timeline_path = TIMELINE_PATH_TEST
+            self.detections_path = DETECTIONS_PATH_TEST
         else:
             self.path = CONFIG_PATH
+            self.timeline_path = TIMELINE_PATH
+            self.detections_path = DETECTIONS_PATH
         LOG.debug('objects context started')
 
+    @property
+    def objects_timeline(self):
+        """ The compact index with all the objects appearances times."""
+        if self._objects_dict is not None:
+            self._objects_timeline = from_dict(self._objects_dict)
+            self._objects_dict = None
+        return self._objects_timeline
+
+    @objects_timeline.setter
+    def objects_timeline(self, value):
+        self._objects_timeline = value
+        self._objects_dict = None
+
+    @property
+    def objects_dict(self):
+        """ The dict with all the objects appearances times, built on demand."""
+        if self._objects_dict is None and self._objects_timeline is not None:
+            self._objects_dict = self._objects_timeline.to_dict()
+        return self._objects_dict
+
+    @objects_dict.setter
+    def objects_dict(self, value):
+        self._objects_dict = value
+
+    @property
+    def detections_store(self):
+        """ The columnar store with all the detections, read on demand."""
+        if self._detections_store is None:
+            if os.path.exists(self.detections_path):
+                self._detections_store = load_detections(self.detections_path)
+                LOG.info('detections store read from %s', self.detections_path)
+            else:
+                self._detections_store = DetectionsStore()
+        return self._detections_store
+
+    @detections_store.setter
+    def detections_store(self, value):
+        self._detections_store = value
+
     def __enter__(self):
         try:
             LOG.debug('reading objects context')
@@ -98,7 +207,14 @@ class ObjectsContext:
             LOG.debug('default objects objects read')
 
         LOG.debug('loading objects context')
-        self.objects_dict = self.config.get(OBJECTS_DICT)
+        if os.path.exists(self.timeline_path):
+            self.objects_timeline = load(self.timeline_path)
+            LOG.info('objects timeline read from %s', self.timeline_path)
+        elif self.config.get(OBJECTS_DICT) is not None:
+            LOG.debug('migrating objects dict to objects timeline')
+            self.objects_timeline = from_dict(self.config.get(OBJECTS_DICT))
+        else:
+            self.objects_timeline = ObjectsTimeline()
         self.objects_list = self.config.get(OBJECTS_LIST)
         self.optimization = self.config.get(OPTIMIZATION)
         self.milliseconds_periodicity = self.config.get(MILLISECONDS_PERIODICITY)
@@ -106,6 +222,17 @@ class ObjectsContext:
         self.yolo_weights_path = self.config.get(YOLO_WEIGHTS_PATH)
         self.yolo_cfg_path = self.config.get(YOLO_CFG_PATH)
         self.yolo_names_path = self.config.get(YOLO_NAMES_PATH)
+        self.min_confidence = self.config.get(MIN_CONFIDENCE, 0.0)
+        self.min_area = self.config.get(MIN_AREA, 0.0)
+        self.cascade = self.config.get(CASCADE, False)
+        self.screen_weights_path = self.config.get(SCREEN_WEIGHTS_PATH)
+        self.screen_cfg_path = self.config.get(SCREEN_CFG_PATH)
+        self.screen_threshold = self.config.get(SCREEN_THRESHOLD, 0.2)
+        self.shared_inference = self.config.get(SHARED_INFERENCE, False)
+        self.inference_batch = self.config.get(INFERENCE_BATCH, 8)
+        self.inference_latency = self.config.get(INFERENCE_LATENCY, 20)
+        self.decoder_workers = self.config.get(DECODER_WORKERS, 0)
+        self.ring_slots = self.config.get(RING_SLOTS, 16)
         LOG.debug('objects context loaded')
 
         return self
@@ -113,7 +240,7 @@ class ObjectsContext:
     def __exit__(self, exc_type, exc_val, exc_tb):
         if not self.read_only:
             LOG.debug('saving objects context')
-            self.config[OBJECTS_DICT] = self.objects_dict
+            self.config.pop(OBJECTS_DICT, None)
             self.config[OBJECTS_LIST] = self.objects_list
             self.config[OPTIMIZATION] = self.optimization
             self.config[MILLISECONDS_PERIODICITY] = self.milliseconds_periodicity
@@ -121,6 +248,17 @@ class ObjectsContext:
             self.config[YOLO_WEIGHTS_PATH] = self.yolo_weights_path
             self.config[YOLO_CFG_PATH] = self.yolo_cfg_path
             self.config[YOLO_NAMES_PATH] = self.yolo_names_path
+            self.config[MIN_CONFIDENCE] = self.min_confidence
+            self.config[MIN_AREA] = self.min_area
+            self.config[CASCADE] = self.cascade
+            self.config[SCREEN_WEIGHTS_PATH] = self.screen_weights_path
+            self.config[SCREEN_CFG_PATH] = self.screen_cfg_path
+            self.config[SCREEN_THRESHOLD] = self.screen_threshold
+            self.config[SHARED_INFERENCE] = self.shared_inference
+            self.config[INFERENCE_BATCH] = self.inference_batch
+            self.config[INFERENCE_LATENCY] = self.inference_latency
+            self.config[DECODER_WORKERS] = self.decoder_workers
+            self.config[RING_SLOTS] = self.ring_slots
             LOG.debug('objects context saved')
 
             LOG.debug('writing objects context')
@@ -131,3 +269,15 @@ class ObjectsContext:
 
             json_file.close()
             LOG.info('objects context written at %s', self.path)
+
+            LOG.debug('writing objects timeline')
+            if self.objects_timeline is not None:
+                self.objects_timeline.save(self.timeline_path)
+            elif os.path.exists(self.timeline_path):
+                os.remove(self.timeline_path)
+            LOG.info('objects timeline written at %s', self.timeline_path)
+
+            if self._detections_store is not None:
+                LOG.debug('writing detections store')
+                self._detections_store.save(self.detections_path)
+                LOG.info('detections store written at %s', self.detections_path)
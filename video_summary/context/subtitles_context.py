@@ -4,17 +4,20 @@ import logging
 import os
 from enum import Enum
 
-from video_summary.objects.subtitle import from_dict_list, to_dict_list
+from video_summary.objects.subtitle_table import SubtitleTable, as_table, from_dict_list, load
 
 # Paths
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__)) + '/conf/'
 CONFIG_PATH = os.path.join(ROOT_DIR, 'SubtitlesConfig.conf')
 CONFIG_PATH_DEFAULT = os.path.join(ROOT_DIR, 'SubtitlesConfigDefault.conf')
 CONFIG_PATH_TEST = os.path.join(ROOT_DIR, 'SubtitlesConfigTest.conf')
+TABLE_PATH = os.path.join(ROOT_DIR, 'SubtitlesTable.npz')
+TABLE_PATH_TEST = os.path.join(ROOT_DIR, 'SubtitlesTableTest.npz')
 
 # Strings for JSON
 SUBTITLES_PATH = "subtitlesPath"
 SUBTITLES_LIST = "subtitlesList"
+STREAM_LANGUAGE = "streamLanguage"
 RESUME_PERCENTAGE = "resumePercentage"
 VECTORING_TYPE = "vectoringType"
 REMOVE_PUNCTUATION = "removePunctuation"
@@ -22,7 +25,19 @@ PUNCTUATION_SIGNS = "punctuationSigns"
 REMOVE_STOP_WORDS = "removeStopWords"
 REMOVE_CAPITAL_LETTERS = "removeCapitalLetters"
 REMOVE_ACCENTS = "removeAccents"
+STEM_WORDS = "stemWords"
 LANGUAGE = "language"
+CONCEPTS = "concepts"
+PHRASES_PER_CONCEPT = "phrasesPerConcept"
+MAX_SENTENCE_LENGTH = "maxSentenceLength"
+MAX_SENTENCE_DURATION = "maxSentenceDuration"
+HASHING_FEATURES = "hashingFeatures"
+CACHE_SIZE = "cacheSize"
+INCREMENTAL_ANALYSIS = "incrementalAnalysis"
+SUMMARIZER = "summarizer"
+DUPLICATE_THRESHOLD = "duplicateThreshold"
+CORPUS_PATH = "corpusPath"
+UPDATE_CORPUS = "updateCorpus"
 
 # Logger
 LOGGER_NAME = 'App.Context.Subtitles'
@@ -43,6 +58,13 @@ class VectoringType(int, Enum):
     TF_IDF_WITH_SMOOTHING_IDF_AND_NORMALIZATION_L2 = 8
 
 
+class SummarizerType(int, Enum):
+    """ Parametrization for the summarizer type."""
+    LSA = 0
+    CENTROID = 1
+    TEXT_RANK = 2
+
+
 class Languages(int, Enum):
     """ Parametrization for the vectoring type."""
     ARABIC = 0
@@ -84,12 +106,17 @@ class SubtitlesContext:
         a dict with all the general settings
     subtitles_path : str
         the subtitles path
-    subtitles_list : list
-        a list of Subtitles objects
+    stream_language : str
+        the language tag of the subtitles stream when the subtitles path is a video container,
+        like "eng" (None for the first text stream)
+    subtitles_list : SubtitleTable
+        the table of the subtitles (a list of Subtitles is also accepted and saved as a table)
     resume_percentage : float
-        the resume percentage of the subtitles (0.0 - 1.0)
+        the resume percentage of the subtitles, without the repetitions (0.0 - 1.0)
     vectoring_type : int
         the vectoring type (class VectoringType)
+    summarizer : int
+        the summarizer type which scores the subtitles (class SummarizerType)
     remove_punctuation : bool
         a boolean to activate the punctuation remove
     punctuation_signs : list
@@ -100,10 +127,36 @@ class SubtitlesContext:
         a boolean to activate the capital letters remove
     remove_accents : bool
         a boolean to activate the accents remove
+    stem_words : bool
+        a boolean to replace the words with their stems in the subtitles language
     language : int
          the subtitles language (class Language)
+    concepts : int
+        the number of concepts of the LSA (0 to derive it from the resume percentage)
+    phrases_per_concept : int
+        the number of best phrases selected from every concept
+    max_sentence_length : int
+        the maximum number of characters of a joined phrase (0 for no limit)
+    max_sentence_duration : int
+        the maximum duration in milliseconds of a joined phrase (0 for no limit)
+    duplicate_threshold : float
+        the minimum similarity (0.0 - 1.0) of the repeated phrases which are scored once (0 to
+        score every phrase, 1 for the exact repetitions)
+    hashing_features : int
+        the number of hashed features of the vectoring (0 to build a vocabulary)
+    cache_size : int
+        the maximum size in MiB of the cached analysis results (0 to disable the cache)
+    incremental_analysis : bool
+        a boolean to update the analysis with the new subtitles when the subtitles file grows
+    corpus_path : str
+        the path of the corpus model of the series, whose statistics weight the phrases of the
+        IDF vectoring types (None to weight them with the statistics of the subtitles)
+    update_corpus : bool
+        a boolean to add the analysed subtitles to the corpus model
     path : string
         the path for the configuration file
+    table_path : string
+        the path for the subtitles table binary file
 
     """
 
@@ -112,19 +165,34 @@ class SubtitlesContext:
         self.read_only = read_only
         self.config = None
         self.subtitles_path = None
+        self.stream_language = None
         self.subtitles_list = None
         self.resume_percentage = None
         self.vectoring_type = None
+        self.summarizer = None
         self.remove_punctuation = None
         self.punctuation_signs = None
         self.remove_stop_words = None
         self.remove_capital_letters = None
         self.remove_accents = None
+        self.stem_words = None
         self.language = None
+        self.concepts = None
+        self.phrases_per_concept = None
+        self.max_sentence_length = None
+        self.max_sentence_duration = None
+        self.duplicate_threshold = None
+        self.hashing_features = None
+        self.cache_size = None
+        self.incremental_analysis = None
+        self.corpus_path = None
+        self.update_corpus = None
         if test:
             self.path = CONFIG_PATH_TEST
+            self.table_path = TABLE_PATH_TEST
         else:
             self.path = CONFIG_PATH
+            self.table_path = TABLE_PATH
         LOG.debug('subtitles context started')
 
     def __enter__(self):
@@ -148,15 +216,35 @@ class SubtitlesContext:
 
         LOG.debug('loading subtitles context')
         self.subtitles_path = self.config.get(SUBTITLES_PATH)
-        self.subtitles_list = from_dict_list(self.config.get(SUBTITLES_LIST))
+        self.stream_language = self.config.get(STREAM_LANGUAGE)
+        if os.path.exists(self.table_path):
+            self.subtitles_list = load(self.table_path)
+            LOG.info('subtitles table read from %s', self.table_path)
+        elif self.config.get(SUBTITLES_LIST) is not None:
+            LOG.debug('migrating subtitles list to subtitles table')
+            self.subtitles_list = from_dict_list(self.config.get(SUBTITLES_LIST))
+        else:
+            self.subtitles_list = SubtitleTable()
         self.resume_percentage = self.config.get(RESUME_PERCENTAGE)
         self.vectoring_type = self.config.get(VECTORING_TYPE)
+        self.summarizer = self.config.get(SUMMARIZER, SummarizerType.LSA)
         self.remove_punctuation = self.config.get(REMOVE_PUNCTUATION)
         self.punctuation_signs = self.config.get(PUNCTUATION_SIGNS)
         self.remove_stop_words = self.config.get(REMOVE_STOP_WORDS)
         self.remove_capital_letters = self.config.get(REMOVE_CAPITAL_LETTERS)
         self.remove_accents = self.config.get(REMOVE_ACCENTS)
+        self.stem_words = self.config.get(STEM_WORDS, False)
         self.language = self.config.get(LANGUAGE)
+        self.concepts = self.config.get(CONCEPTS, 0)
+        self.phrases_per_concept = self.config.get(PHRASES_PER_CONCEPT, 1)
+        self.max_sentence_length = self.config.get(MAX_SENTENCE_LENGTH, 0)
+        self.max_sentence_duration = self.config.get(MAX_SENTENCE_DURATION, 0)
+        self.duplicate_threshold = self.config.get(DUPLICATE_THRESHOLD, 0)
+        self.hashing_features = self.config.get(HASHING_FEATURES, 0)
+        self.cache_size = self.config.get(CACHE_SIZE, 64)
+        self.incremental_analysis = self.config.get(INCREMENTAL_ANALYSIS, False)
+        self.corpus_path = self.config.get(CORPUS_PATH)
+        self.update_corpus = self.config.get(UPDATE_CORPUS, False)
         LOG.debug('subtitles context loaded')
 
         return self
@@ -165,15 +253,28 @@ class SubtitlesContext:
         if not self.read_only:
             LOG.debug('saving subtitles context')
             self.config[SUBTITLES_PATH] = self.subtitles_path
-            self.config[SUBTITLES_LIST] = to_dict_list(self.subtitles_list)
+            self.config[STREAM_LANGUAGE] = self.stream_language
+            self.config.pop(SUBTITLES_LIST, None)
             self.config[RESUME_PERCENTAGE] = self.resume_percentage
             self.config[VECTORING_TYPE] = self.vectoring_type
+            self.config[SUMMARIZER] = self.summarizer
             self.config[REMOVE_PUNCTUATION] = self.remove_punctuation
             self.config[PUNCTUATION_SIGNS] = self.punctuation_signs
             self.config[REMOVE_STOP_WORDS] = self.remove_stop_words
             self.config[REMOVE_CAPITAL_LETTERS] = self.remove_capital_letters
             self.config[REMOVE_ACCENTS] = self.remove_accents
+            self.config[STEM_WORDS] = self.stem_words
             self.config[LANGUAGE] = self.language
+            self.config[CONCEPTS] = self.concepts
+            self.config[PHRASES_PER_CONCEPT] = self.phrases_per_concept
+            self.config[MAX_SENTENCE_LENGTH] = self.max_sentence_length
+            self.config[MAX_SENTENCE_DURATION] = self.max_sentence_duration
+            self.config[DUPLICATE_THRESHOLD] = self.duplicate_threshold
+            self.config[HASHING_FEATURES] = self.hashing_features
+            self.config[CACHE_SIZE] = self.cache_size
+            self.config[INCREMENTAL_ANALYSIS] = self.incremental_analysis
+            self.config[CORPUS_PATH] = self.corpus_path
+            self.config[UPDATE_CORPUS] = self.update_corpus
             LOG.debug('subtitles context saved')
 
             LOG.debug('writing subtitles context')
@@ -184,3 +285,11 @@ class SubtitlesContext:
 
             json_file.close()
             LOG.info('subtitles context written at %s', self.path)
+
+            LOG.debug('writing subtitles table')
+            subtitles_table = as_table(self.subtitles_list)
+            if subtitles_table is not None:
+                subtitles_table.save(self.table_path)
+            elif os.path.exists(self.table_path):
+                os.remove(self.table_path)
+            LOG.info('subtitles table written at %s', self.table_path)
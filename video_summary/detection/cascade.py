@@ -0,0 +1,122 @@
+"""The module for the two-tier objects detection cascade."""
+
+import logging
+
+import numpy as np
+
+# Logger
+LOGGER_NAME = 'App.Detection.Cascade'
+LOG = logging.getLogger(LOGGER_NAME)
+
+
+def empty_detections():
+    """
+    Method to get the detections of a frame without objects.
+
+    ...
+
+    Returns
+    -------
+    tuple
+        the empty (class_ids, confidences, boxes) arrays
+
+    """
+
+    return (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32),
+            np.zeros((0, 4), dtype=np.float32))
+
+
+class DetectionCascade:
+    """
+    The class for the two-tier objects detection cascade.
+
+    A small and fast model screens every frame, and the full model only runs on the frames
+    where the screen reports a requested class above the screen threshold.
+
+    ...
+
+    Attributes
+    ----------
+    screen : callable
+        the screen detector, which returns the (class_ids, confidences, boxes) of a frame
+    full : callable
+        the full detector, which returns the (class_ids, confidences, boxes) of a frame
+    requested_ids : array
+        an int numpy array with the ids of the requested classes
+    threshold : float
+        the minimum screen confidence to run the full detector (0.0 - 1.0)
+    hits : int
+        the number of frames sent to the full detector
+    misses : int
+        the number of frames discarded by the screen detector
+    confirmed : int
+        the number of hits where the full detector found a requested class
+
+    Methods
+    -------
+    detect(frame)
+        detect the objects in a frame
+    log_statistics()
+        log the hit and miss statistics of the cascade
+    """
+
+    def __init__(self, screen, full, requested_ids, threshold):
+        self.screen = screen
+        self.full = full
+        self.requested_ids = np.asarray(requested_ids, dtype=np.int64)
+        self.threshold = threshold
+        self.hits = 0
+        self.misses = 0
+        self.confirmed = 0
+
+    def has_requested(self, detections):
+        """
+        The method to check if the detections have a requested class above the threshold.
+
+        Parameters
+        ----------
+        detections : tuple
+            the (class_ids, confidences, boxes) arrays of a frame
+
+        Returns
+        -------
+        bool
+            True if any requested class is above the threshold
+        """
+
+        class_ids, confidences, _ = detections
+        return bool(np.any(np.isin(class_ids, self.requested_ids)
+                           & (confidences >= self.threshold)))
+
+    def detect(self, frame):
+        """
+        The method to detect the objects in a frame.
+
+        Parameters
+        ----------
+        frame : array
+            a numpy array representing the RGB picture of the clip
+
+        Returns
+        -------
+        tuple
+            the (class_ids, confidences, boxes) arrays of the full detector, or empty arrays
+            if the screen detector discards the frame
+        """
+
+        if not self.has_requested(self.screen(frame)):
+            self.misses += 1
+            return empty_detections()
+
+        self.hits += 1
+        detections = self.full(frame)
+        if self.has_requested(detections):
+            self.confirmed += 1
+        return detections
+
+    def log_statistics(self):
+        """ The method to log the hit and miss statistics of the cascade."""
+        total = self.hits + self.misses
+        LOG.info('cascade screened %d frames: %d hits (%.1f%%), %d misses, %d confirmed',
+                 total, self.hits, self.hits / total * 100 if total else 0, self.misses,
+                 self.confirmed)
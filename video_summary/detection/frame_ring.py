@@ -0,0 +1,365 @@
+"""The module for the shared memory ring of frames between the decoders and the detector."""
+
+import logging
+import multiprocessing
+import queue
+import time
+from multiprocessing import shared_memory
+
+import cv2
+import numpy as np
+
+from video_summary.utils import DETECTOR_INPUT_SIZE, load_video
+
+# Logger
+LOGGER_NAME = 'App.Detection.FrameRing'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Multiprocessing context (the analyses run in Qt threads, so the workers are not forked)
+CONTEXT = multiprocessing.get_context('spawn')
+
+# Detector input
+FRAME_SHAPE = (DETECTOR_INPUT_SIZE[1], DETECTOR_INPUT_SIZE[0], 3)
+
+# Seconds between the checks of the stop of the ring
+POLL_SECONDS = 0.1
+
+
+def attach_memory(name):
+    """
+    Method to attach to an existing shared memory block without owning it.
+
+    ...
+
+    Parameters
+    ----------
+    name : str
+        the shared memory block's name
+
+    Returns
+    -------
+    SharedMemory
+        the attached shared memory block
+
+    """
+
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # The workers share the owner's resource tracker, which already tracks the block
+        return shared_memory.SharedMemory(name=name)
+
+
+class FrameRing:
+    """
+    A class used to represent a ring of fixed-size frame slots in shared memory.
+
+    The slots are numpy views over one shared memory block, so the decoders write the frames
+    in place and the detector reads them without copying. Only the slot indexes travel through
+    the queues: a writer acquires a free slot, fills it and publishes it, and the reader
+    receives it, uses it and releases it back to the free slots. The owner stops the writers
+    with an event instead of terminating them, so the queues are never left half written.
+
+    ...
+
+    Attributes
+    ----------
+    slots : int
+        the number of frame slots
+    shape : tuple
+        the shape of every frame slot
+    memory : SharedMemory
+        the shared memory block with the frame slots
+    frames : array
+        a numpy view (slots x shape) over the shared memory block
+    free : Queue
+        the queue with the indexes of the free slots
+    ready : Queue
+        the queue with the (index, position) of the published slots
+    stopping : Event
+        the event which tells the writers to stop
+    owner : bool
+        a boolean to indicate that this instance created the shared memory block
+
+    Methods
+    -------
+    acquire()
+        get the index of a free slot to write
+    publish(index, position)
+        send a written slot to the reader
+    stop()
+        tell the writers to stop
+    is_stopped()
+        check if the writers must stop
+    receive()
+        get the (index, position) of a published slot
+    release(index)
+        give back a read slot to the writers
+    close()
+        detach from the shared memory block, and free it if this instance is the owner
+    """
+
+    def __init__(self, slots, shape=FRAME_SHAPE, name=None, free=None, ready=None,
+                 stopping=None):
+        self.slots = slots
+        self.shape = tuple(shape)
+        self.owner = name is None
+        if self.owner:
+            size = slots * int(np.prod(self.shape))
+            self.memory = shared_memory.SharedMemory(create=True, size=size)
+            self.free = CONTEXT.Queue()
+            self.ready = CONTEXT.Queue()
+            self.stopping = CONTEXT.Event()
+            for index in range(slots):
+                self.free.put(index)
+            LOG.debug('frame ring of %d slots created at %s', slots, self.memory.name)
+        else:
+            self.memory = attach_memory(name)
+            self.free = free
+            self.ready = ready
+            self.stopping = stopping
+        self.frames = np.ndarray((slots,) + self.shape, dtype=np.uint8, buffer=self.memory.buf)
+
+    def __getstate__(self):
+        return {'slots': self.slots, 'shape': self.shape, 'name': self.memory.name,
+                'free': self.free, 'ready': self.ready, 'stopping': self.stopping}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def acquire(self, timeout=None):
+        """
+        The method to get the index of a free slot to write.
+
+        Parameters
+        ----------
+        timeout : float
+            the maximum seconds to wait for a free slot
+
+        Returns
+        -------
+        int
+            the index of the slot, or None if the ring is stopped
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.is_stopped():
+            wait = POLL_SECONDS if deadline is None else min(
+                POLL_SECONDS, max(0.0, deadline - time.monotonic()))
+            try:
+                return self.free.get(timeout=wait)
+            except queue.Empty:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise
+        return None
+
+    def publish(self, index, position):
+        """
+        The method to send a written slot to the reader.
+
+        Parameters
+        ----------
+        index : int
+            the index of the slot
+        position : int
+            the position of the frame in the writer's work
+        """
+
+        self.ready.put((index, position))
+
+    def stop(self):
+        """ The method to tell the writers to stop."""
+        self.stopping.set()
+
+    def is_stopped(self):
+        """
+        The method to check if the writers must stop.
+
+        Returns
+        -------
+        bool
+            True if the ring is stopped
+        """
+
+        return self.stopping.is_set()
+
+    def receive(self, timeout=None):
+        """
+        The method to get the (index, position) of a published slot.
+
+        Parameters
+        ----------
+        timeout : float
+            the maximum seconds to wait for a published slot
+
+        Returns
+        -------
+        tuple
+            the (index, position) of the slot
+        """
+
+        return self.ready.get(timeout=timeout)
+
+    def release(self, index):
+        """
+        The method to give back a read slot to the writers.
+
+        Parameters
+        ----------
+        index : int
+            the index of the slot
+        """
+
+        self.free.put(index)
+
+    def close(self):
+        """ The method to detach from the shared memory block, freeing it if it is owned."""
+        del self.frames
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+            LOG.debug('frame ring %s freed', self.memory.name)
+
+
+def decode_frames(ring, video_path, positions, milli_secs):
+    """
+    Method to decode the frames of a video into the ring, to run in a decoder process.
+
+    ...
+
+    Parameters
+    ----------
+    ring : FrameRing
+        the ring of frames
+    video_path : str
+        the video's path
+    positions : list
+        a list with the position of every frame in the analysis
+    milli_secs : list
+        a list with the time in milliseconds of every frame
+
+    """
+
+    clip = load_video(video_path)
+    try:
+        for position, milli_sec in zip(positions, milli_secs):
+            index = ring.acquire()
+            if index is None:
+                break
+            cv2.resize(clip.get_frame(milli_sec / 1000), DETECTOR_INPUT_SIZE,
+                       dst=ring.frames[index])
+            ring.publish(index, position)
+    finally:
+        clip.close()
+        ring.close()
+
+
+def start_decoders(ring, video_path, milli_secs, workers):
+    """
+    Method to start the decoder processes which fill the ring with the frames of a video.
+
+    ...
+
+    Parameters
+    ----------
+    ring : FrameRing
+        the ring of frames
+    video_path : str
+        the video's path
+    milli_secs : list
+        a list with the time in milliseconds of every frame
+    workers : int
+        the number of decoder processes
+
+    Returns
+    -------
+    list
+        a list with the started processes
+
+    """
+
+    processes = []
+    for worker in range(workers):
+        positions = list(range(worker, len(milli_secs), workers))
+        process = CONTEXT.Process(
+            target=decode_frames, name='FrameDecoder-{}'.format(worker), daemon=True,
+            args=(ring, video_path, positions, [milli_secs[i] for i in positions]))
+        process.start()
+        processes.append(process)
+    LOG.debug('%d frame decoders started', workers)
+    return processes
+
+
+def receive_frames(ring, total, decoders, timeout=1.0):
+    """
+    Method to iterate over the frames published by the decoder processes.
+
+    ...
+
+    Parameters
+    ----------
+    ring : FrameRing
+        the ring of frames
+    total : int
+        the number of frames to receive
+    decoders : list
+        a list with the decoder processes
+    timeout : float
+        the seconds between the checks of the decoder processes
+
+    Yields
+    ------
+    tuple
+        the (index, position) of every published slot, which must be released after its use
+
+    """
+
+    received = 0
+    while received < total:
+        try:
+            index, position = ring.receive(timeout=timeout)
+        except queue.Empty:
+            failed = [decoder.name for decoder in decoders if decoder.exitcode]
+            if failed:
+                LOG.error('frame decoders failed: %s', ', '.join(failed))
+                raise RuntimeError('frame decoders failed: {}'.format(', '.join(failed)))
+            continue
+        received += 1
+        yield index, position
+
+
+def stop_decoders(ring, decoders, timeout=10.0):
+    """
+    Method to stop the decoder processes and wait for them.
+
+    The decoders are told to stop, and the published slots are drained while they finish, so
+    no decoder waits for a free slot or for the flush of its queue. Only the decoders which are
+    still running after the timeout are terminated.
+
+    ...
+
+    Parameters
+    ----------
+    ring : FrameRing
+        the ring of frames
+    decoders : list
+        a list with the decoder processes
+    timeout : float
+        the maximum seconds to wait for the decoder processes
+
+    """
+
+    ring.stop()
+    deadline = time.monotonic() + timeout
+    while any(decoder.is_alive() for decoder in decoders) and time.monotonic() < deadline:
+        try:
+            index, _ = ring.receive(timeout=POLL_SECONDS)
+        except queue.Empty:
+            continue
+        ring.release(index)
+    for decoder in decoders:
+        decoder.join(timeout=max(0.0, deadline - time.monotonic()))
+        if decoder.is_alive():
+            LOG.warning('frame decoder %s not stopped, terminating it', decoder.name)
+            decoder.terminate()
+            decoder.join()
@@ -0,0 +1,277 @@
+"""The module for the shared objects inference service."""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+from video_summary.utils import load_yolo, prepare_frame, read_detections, blob_from_frames
+
+# Logger
+LOGGER_NAME = 'App.Detection.InferenceService'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Loaded services
+SERVICES = {}
+SERVICES_LOCK = threading.Lock()
+
+
+class InferenceService:
+    """
+    The class for the shared objects inference service.
+
+    The service owns a loaded net and serves the frames requested by any number of concurrent
+    jobs. The requests are collected into batches until the batch is full or the oldest request
+    reaches the maximum latency, and every job gets back the detections of its frame.
+
+    ...
+
+    Attributes
+    ----------
+    net : net
+        the Yolo's net
+    output_layers : list
+        a list of strings with the layers names
+    classes : list
+        a list of strings with the classes names
+    max_batch : int
+        the maximum number of frames per batch
+    max_latency : float
+        the maximum seconds that a request waits for the batch to fill
+    batches : int
+        the number of batches run
+    frames : int
+        the number of frames served
+    users : int
+        the number of jobs which got the service and did not release it yet
+
+    Methods
+    -------
+    submit(frame, prepared)
+        request the detections of a frame
+    detect(frame, prepared)
+        detect the objects in a frame, waiting for the result
+    close()
+        stop the service
+    """
+
+    def __init__(self, net, output_layers, classes, max_batch=8, max_latency=0.02):
+        LOG.debug('starting inference service')
+        self.net = net
+        self.output_layers = output_layers
+        self.classes = classes
+        self.max_batch = max_batch
+        self.max_latency = max_latency
+        self.batches = 0
+        self.frames = 0
+        self.users = 0
+        self.requests = queue.Queue()
+        self.thread = threading.Thread(target=self.serve, name='InferenceService', daemon=True)
+        self.thread.start()
+        LOG.info('inference service started')
+
+    def submit(self, frame, prepared=False):
+        """
+        The method to request the detections of a frame.
+
+        Parameters
+        ----------
+        frame : array
+            a numpy array representing the RGB picture of the clip
+        prepared : bool
+            a boolean to indicate that the frame is already reduced
+
+        Returns
+        -------
+        Future
+            the future with the (class_ids, confidences, boxes) arrays of the frame
+        """
+
+        future = Future()
+        self.requests.put((frame if prepared else prepare_frame(frame), future))
+        return future
+
+    def detect(self, frame, prepared=False):
+        """
+        The method to detect the objects in a frame, waiting for the result.
+
+        Parameters
+        ----------
+        frame : array
+            a numpy array representing the RGB picture of the clip
+        prepared : bool
+            a boolean to indicate that the frame is already reduced
+
+        Returns
+        -------
+        tuple
+            the (class_ids, confidences, boxes) arrays of the frame
+        """
+
+        return self.submit(frame, prepared).result()
+
+    def close(self):
+        """ The method to stop the service."""
+        self.requests.put(None)
+        self.thread.join()
+        LOG.info('inference service closed after %d frames in %d batches',
+                 self.frames, self.batches)
+
+    def next_batch(self):
+        """
+        The method to collect the next batch of requests.
+
+        Returns
+        -------
+        list
+            a list of (frame, future) requests, or None if the service is closed
+        """
+
+        request = self.requests.get()
+        if request is None:
+            return None
+
+        batch = [request]
+        deadline = time.monotonic() + self.max_latency
+        while len(batch) < self.max_batch:
+            try:
+                request = self.requests.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if request is None:
+                self.requests.put(None)
+                break
+            batch.append(request)
+        return batch
+
+    def serve(self):
+        """
+        The method to run the batches of requests until the service is closed.
+
+        A failed batch or frame fails the futures of its requests, and the service keeps serving
+        the next ones, so no job waits forever for a result.
+        """
+        while True:
+            batch = self.next_batch()
+            if batch is None:
+                break
+
+            frames = [frame for frame, _ in batch]
+            futures = [future for _, future in batch]
+            try:
+                self.net.setInput(blob_from_frames(frames))
+                outputs = self.net.forward(self.output_layers)
+            except Exception as error:
+                LOG.error('inference batch failed: %s', error)
+                for future in futures:
+                    future.set_exception(error)
+                continue
+
+            for index, future in enumerate(futures):
+                try:
+                    future.set_result(read_detections(
+                        [split_output(output, index, len(futures)) for output in outputs]))
+                except Exception as error:
+                    LOG.error('inference result of the frame %d failed: %s', index, error)
+                    future.set_exception(error)
+            self.batches += 1
+            self.frames += len(futures)
+            LOG.debug('inference batch of %d frames served', len(futures))
+
+
+def split_output(output, index, batch_size):
+    """
+    Method to get the output of a frame from the output of a batch.
+
+    ...
+
+    Parameters
+    ----------
+    output : array
+        a numpy array with the output layer's result of the batch
+    index : int
+        the index of the frame in the batch
+    batch_size : int
+        the number of frames in the batch
+
+    Returns
+    -------
+    array
+        a numpy matrix with the output layer's result of the frame
+
+    """
+
+    if output.ndim == 3:
+        return output[index]
+    return np.array_split(output, batch_size)[index]
+
+
+def get_service(weights_path, cfg_path, names_path, max_batch=8, max_latency=0.02):
+    """
+    Method to get the shared service of a Yolo's net, loading it on the first request.
+
+    A loaded service takes the batching options of the last request, and it is stopped when
+    every job which got it releases it with release_service.
+
+    ...
+
+    Parameters
+    ----------
+    weights_path : str
+        the Yolo's weights path
+    cfg_path : str
+        the Yolo's cfg path
+    names_path : str
+        the Yolo's names path
+    max_batch : int
+        the maximum number of frames per batch
+    max_latency : float
+        the maximum seconds that a request waits for the batch to fill
+
+    Returns
+    -------
+    InferenceService
+        the shared service
+
+    """
+
+    key = (weights_path, cfg_path, names_path)
+    with SERVICES_LOCK:
+        if key not in SERVICES:
+            LOG.debug('loading Yolo\'s darknet for the inference service')
+            net, classes, output_layers = load_yolo(weights_path, cfg_path, names_path)
+            SERVICES[key] = InferenceService(net, output_layers, classes, max_batch, max_latency)
+        service = SERVICES[key]
+        if (service.max_batch, service.max_latency) != (max_batch, max_latency):
+            LOG.info('inference service batches changed to %d frames and %.3f seconds',
+                     max_batch, max_latency)
+            service.max_batch = max_batch
+            service.max_latency = max_latency
+        service.users += 1
+        return service
+
+
+def release_service(service):
+    """
+    Method to release a shared service, stopping it when no job uses it.
+
+    ...
+
+    Parameters
+    ----------
+    service : InferenceService
+        the shared service, got with get_service
+
+    """
+
+    with SERVICES_LOCK:
+        service.users -= 1
+        if service.users > 0:
+            return
+        for key, loaded in list(SERVICES.items()):
+            if loaded is service:
+                del SERVICES[key]
+    service.close()
@@ -10,6 +10,7 @@ from video_summary.context.general_context import GeneralContext, ResumeMode
 from video_summary.context.subtitles_context import SubtitlesContext, VectoringType, Languages
 from video_summary.controller.processes_controller import ProcessesController
 from video_summary.models.model_interface import ModelInterface
+from video_summary.subtitles.embedded import CONTAINER_EXTENSIONS, SUBTITLES_EXTENSIONS
 from video_summary.utils import TRANSLATE_VECTORING, TRANSLATE_LANGUAGE
 
 # Paths
@@ -18,6 +19,9 @@ TEMPLATE_PATH = os.path.join(ROOT_DIR, '../templates/', 'SubtitlesOptions.ui')
 
 # Window
 WINDOW_TITLE = "Subtitles options"
+FILE_FILTER = "Subtitle files ({});;Video files with subtitles ({})".format(
+    " ".join("*" + extension for extension in SUBTITLES_EXTENSIONS),
+    " ".join("*" + extension for extension in CONTAINER_EXTENSIONS))
 
 # Logger
 LOGGER_NAME = 'App.Models.SubtitlesOptions'
@@ -132,8 +136,8 @@ class SubtitlesOptions(QtWidgets.QMainWindow, ModelInterface):
         if self.path == "":
             LOG.info('incorrect data (path is empty)')
             return False
-        if not self.path.endswith('.srt'):
-            LOG.info('incorrect data (selected subtitle is not srt format)')
+        if not self.path.lower().endswith(SUBTITLES_EXTENSIONS + CONTAINER_EXTENSIONS):
+            LOG.info('incorrect data (selected subtitle is not srt, vtt or a video container)')
             return False
         LOG.info('checked data: OK')
         return True
@@ -144,7 +148,7 @@ class SubtitlesOptions(QtWidgets.QMainWindow, ModelInterface):
 
         LOG.debug('opening file dialog')
         self.path = QFileDialog.getOpenFileName(self, 'Load file', '',
-                                                "Subtitle files (*.srt)").__getitem__(0)
+                                                FILE_FILTER).__getitem__(0)
         LOG.debug('file dialog closed')
 
         self.reload_conditional_format()
@@ -0,0 +1,178 @@
+"""The module which represents the store of the objects detections."""
+
+import numpy as np
+
+# Strings for the binary file
+DETECTIONS_TIMES = "times"
+DETECTIONS_CLASS_IDS = "classIds"
+DETECTIONS_CONFIDENCES = "confidences"
+DETECTIONS_BOXES = "boxes"
+DETECTIONS_CLASSES = "classes"
+
+
+class DetectionsStore:
+    """
+    A class used to represent the columnar store of the objects detections.
+
+    Every detection is a row spread over the columns, so the queries are answered in bulk
+    without touching the video or the net again.
+
+    ...
+
+    Attributes
+    ----------
+    times : array
+        an int32 numpy array with the time in milliseconds of every detection
+    class_ids : array
+        an int16 numpy array with the class id of every detection
+    confidences : array
+        a float32 numpy array with the confidence of every detection
+    boxes : array
+        a float32 numpy matrix (detections x 4) with the normalized boxes (x, y, width, height)
+        centered in the detection
+    classes : list
+        a list of strings with the classes names
+
+    Methods
+    -------
+    mask_of(class_names, min_confidence, min_area)
+        get a boolean mask over the detections which pass the filters
+    times_of(class_names, min_confidence, min_area)
+        get the times with any detection which pass the filters
+    save(path)
+        write the store in a binary file
+    """
+
+    def __init__(self, times=None, class_ids=None, confidences=None, boxes=None, classes=None):
+        self.times = np.zeros(0, dtype=np.int32) if times is None else times
+        self.class_ids = np.zeros(0, dtype=np.int16) if class_ids is None else class_ids
+        self.confidences = np.zeros(0, dtype=np.float32) if confidences is None else confidences
+        self.boxes = np.zeros((0, 4), dtype=np.float32) if boxes is None else boxes
+        self.classes = [] if classes is None else classes
+
+    def __len__(self):
+        return len(self.times)
+
+    def mask_of(self, class_names, min_confidence=0.0, min_area=0.0):
+        """
+        The method to get a boolean mask over the detections which pass the filters.
+
+        Parameters
+        ----------
+        class_names : list
+            a list of strings with the classes names
+        min_confidence : float
+            the minimum confidence of the detections (0.0 - 1.0)
+        min_area : float
+            the minimum normalized area of the boxes (0.0 - 1.0)
+
+        Returns
+        -------
+        array
+            a boolean numpy array with one value per detection
+        """
+
+        class_names = set(class_names)
+        ids = [index for index, name in enumerate(self.classes) if name in class_names]
+        mask = np.isin(self.class_ids, ids)
+        if min_confidence > 0:
+            mask &= self.confidences >= min_confidence
+        if min_area > 0:
+            mask &= self.boxes[:, 2] * self.boxes[:, 3] >= min_area
+        return mask
+
+    def times_of(self, class_names, min_confidence=0.0, min_area=0.0):
+        """
+        The method to get the times with any detection which pass the filters.
+
+        Parameters
+        ----------
+        class_names : list
+            a list of strings with the classes names
+        min_confidence : float
+            the minimum confidence of the detections (0.0 - 1.0)
+        min_area : float
+            the minimum normalized area of the boxes (0.0 - 1.0)
+
+        Returns
+        -------
+        array
+            a sorted int32 numpy array with the times in milliseconds
+        """
+
+        return np.unique(self.times[self.mask_of(class_names, min_confidence, min_area)])
+
+    def save(self, path):
+        """
+        The method to write the store in a binary file.
+
+        Parameters
+        ----------
+        path : str
+            the path of the binary file
+        """
+
+        with open(path, 'wb') as file:
+            np.savez_compressed(file, **{DETECTIONS_TIMES: self.times,
+                                         DETECTIONS_CLASS_IDS: self.class_ids,
+                                         DETECTIONS_CONFIDENCES: self.confidences,
+                                         DETECTIONS_BOXES: self.boxes,
+                                         DETECTIONS_CLASSES: np.array(self.classes, dtype=str)})
+
+
+def from_samples(times, detections_list, classes, min_confidence=0.0):
+    """
+    The method to build a store from the detections of every sample.
+
+    Parameters
+    ----------
+    times : list
+        a list with the sampled times in milliseconds
+    detections_list : list
+        a list with the (class_ids, confidences, boxes) arrays of every sample
+    classes : list
+        a list of strings with the classes names
+    min_confidence : float
+        the minimum confidence of the detections to store (0.0 - 1.0)
+
+    Returns
+    -------
+    DetectionsStore
+        the store with the confident detections
+    """
+
+    if not detections_list:
+        return DetectionsStore(classes=list(classes))
+
+    times = np.rint(np.asarray(times, dtype=np.float64)).astype(np.int32)
+    counts = [len(class_ids) for class_ids, _, _ in detections_list]
+    class_ids = np.concatenate([ids for ids, _, _ in detections_list]).astype(np.int16)
+    confidences = np.concatenate([conf for _, conf, _ in detections_list]).astype(np.float32)
+    boxes = np.concatenate([box.reshape(-1, 4) for _, _, box in detections_list]).astype(
+        np.float32)
+    all_times = np.repeat(times[:len(counts)], counts)
+
+    mask = confidences >= min_confidence
+    return DetectionsStore(all_times[mask], class_ids[mask], confidences[mask], boxes[mask],
+                           list(classes))
+
+
+def load(path):
+    """
+    The method to read a store from a binary file.
+
+    Parameters
+    ----------
+    path : str
+        the path of the binary file
+
+    Returns
+    -------
+    DetectionsStore
+        the store with the file data
+    """
+
+    with np.load(path) as data:
+        return DetectionsStore(data[DETECTIONS_TIMES], data[DETECTIONS_CLASS_IDS],
+                               data[DETECTIONS_CONFIDENCES], data[DETECTIONS_BOXES],
+                               data[DETECTIONS_CLASSES].tolist())
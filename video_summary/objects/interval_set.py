@@ -0,0 +1,237 @@
+"""The module which represents a set of time intervals."""
+
+import numpy as np
+
+# Coverage codes of the overlay of two sets
+FIRST = 1
+SECOND = 2
+BOTH = FIRST | SECOND
+
+
+class IntervalSet:
+    """
+    A class used to represent a set of time intervals.
+
+    The intervals are kept in two int64 arrays, and every operation works on all of them at
+    once with sorting, cumulative sums and reductions. An interval (start, end) spans the time
+    between its start and its end, so its duration is end - start.
+
+    ...
+
+    Attributes
+    ----------
+    starts : array
+        an int64 numpy array with the start of every interval in milliseconds
+    ends : array
+        an int64 numpy array with the end of every interval in milliseconds
+
+    Methods
+    -------
+    sorted()
+        get the intervals sorted by their start
+    union(other, gap)
+        get the merged intervals of both sets
+    intersection(other)
+        get the time covered by both sets
+    subtract(other)
+        get the time covered by this set and not by the other
+    duration()
+        get the total time covered by the set
+    to_list()
+        get a list with the int pair of every interval
+    """
+
+    def __init__(self, starts=None, ends=None):
+        self.starts = np.zeros(0, dtype=np.int64) if starts is None else starts
+        self.ends = np.zeros(0, dtype=np.int64) if ends is None else ends
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def sorted(self):
+        """
+        The method to get the intervals sorted by their start.
+
+        Returns
+        -------
+        IntervalSet
+            a new set with the intervals sorted by their start and their end
+        """
+
+        order = np.lexsort((self.ends, self.starts))
+        return IntervalSet(self.starts[order], self.ends[order])
+
+    def union(self, other=None, gap=0):
+        """
+        The method to get the merged intervals of both sets.
+
+        Parameters
+        ----------
+        other : IntervalSet
+            the other set (None to merge the intervals of this set)
+        gap : int
+            the maximum milliseconds between two intervals which are merged
+
+        Returns
+        -------
+        IntervalSet
+            a new set with the sorted and disjoint intervals
+        """
+
+        intervals = self if other is None else concatenate(self, other)
+        if not len(intervals):
+            return IntervalSet()
+        intervals = intervals.sorted()
+        reach = np.maximum.accumulate(intervals.ends)
+        first = np.ones(len(intervals), dtype=bool)
+        first[1:] = intervals.starts[1:] > reach[:-1] + gap
+        firsts = np.flatnonzero(first)
+        return IntervalSet(intervals.starts[firsts], np.maximum.reduceat(intervals.ends, firsts))
+
+    def intersection(self, other):
+        """
+        The method to get the time covered by both sets.
+
+        Parameters
+        ----------
+        other : IntervalSet
+            the other set
+
+        Returns
+        -------
+        IntervalSet
+            a new set with the sorted and disjoint intervals of the common time
+        """
+
+        return overlay(self, other, BOTH)
+
+    def subtract(self, other):
+        """
+        The method to get the time covered by this set and not by the other.
+
+        Parameters
+        ----------
+        other : IntervalSet
+            the other set
+
+        Returns
+        -------
+        IntervalSet
+            a new set with the sorted and disjoint intervals of the remaining time
+        """
+
+        return overlay(self, other, FIRST)
+
+    def duration(self):
+        """
+        The method to get the total time covered by the set.
+
+        Returns
+        -------
+        int
+            the milliseconds covered by any interval, counting the overlaps once
+        """
+
+        merged = self.union()
+        return int(np.sum(merged.ends - merged.starts))
+
+    def to_list(self):
+        """
+        The method to get a list with the int pair of every interval.
+
+        Returns
+        -------
+        list
+            a list of int pairs (start, end)
+        """
+
+        return np.stack([self.starts, self.ends], axis=1).tolist()
+
+
+def concatenate(first, second):
+    """
+    Method to join the intervals of two sets.
+
+    ...
+
+    Parameters
+    ----------
+    first : IntervalSet
+        the first set
+    second : IntervalSet
+        the second set
+
+    Returns
+    -------
+    IntervalSet
+        a new set with the intervals of the first set followed by the ones of the second
+
+    """
+
+    return IntervalSet(np.concatenate([first.starts, second.starts]),
+                       np.concatenate([first.ends, second.ends]))
+
+
+def overlay(first, second, coverage):
+    """
+    Method to get the time with a coverage of two sets.
+
+    Every set is merged, so its intervals add its code to the coverage of their time, and the
+    coverage between every pair of consecutive boundaries is the cumulative sum of the codes.
+
+    ...
+
+    Parameters
+    ----------
+    first : IntervalSet
+        the first set
+    second : IntervalSet
+        the second set
+    coverage : int
+        the coverage of the kept time (FIRST, SECOND or BOTH)
+
+    Returns
+    -------
+    IntervalSet
+        a new set with the sorted and disjoint intervals of the time with the coverage
+
+    """
+
+    first = first.union()
+    second = second.union()
+    points = np.concatenate([first.starts, first.ends, second.starts, second.ends])
+    codes = np.concatenate([np.full(len(first), FIRST), np.full(len(first), -FIRST),
+                            np.full(len(second), SECOND), np.full(len(second), -SECOND)])
+    order = np.argsort(points, kind='stable')
+    points = points[order]
+    covered = np.flatnonzero(np.cumsum(codes[order])[:-1] == coverage)
+    covered = covered[points[covered] < points[covered + 1]]
+    return IntervalSet(points[covered], points[covered + 1]).union()
+
+
+def from_times(times):
+    """
+    Method to build the set of a list of times.
+
+    ...
+
+    Parameters
+    ----------
+    times : list
+        a list of int pairs (start, end) in milliseconds, which may contain None, or an int
+        numpy matrix (intervals x 2)
+
+    Returns
+    -------
+    IntervalSet
+        the set of the intervals
+
+    """
+
+    if not isinstance(times, np.ndarray):
+        times = [time for time in times or [] if time is not None]
+    times = np.asarray(times, dtype=np.int64).reshape(-1, 2)
+    return IntervalSet(times[:, 0].copy(), times[:, 1].copy())
@@ -0,0 +1,193 @@
+"""The module which represents the objects detection timeline."""
+
+import numpy as np
+
+# Strings for the binary file
+TIMELINE_TIMES = "times"
+TIMELINE_CLASSES = "classes"
+TIMELINE_PRESENCE = "presence"
+
+
+class ObjectsTimeline:
+    """
+    A class used to represent the compact index of the detected objects.
+
+    The sampled times are kept in one sorted int32 array and the presence of every class is
+    kept as a bitset over those samples, one packed row per class.
+
+    ...
+
+    Attributes
+    ----------
+    times : array
+        a sorted int32 numpy array with the sampled times in milliseconds
+    classes : list
+        a list of strings with the names of the detected classes
+    presence : array
+        a uint8 numpy matrix (classes x samples / 8) with the packed presence bits
+
+    Methods
+    -------
+    mask_of(class_names)
+        get a boolean mask over the samples where any of the classes is present
+    times_of(class_names)
+        get the times where any of the classes is present
+    to_dict()
+        get a dict with the times of every class
+    save(path)
+        write the timeline in a binary file
+    """
+
+    def __init__(self, times=None, classes=None, presence=None):
+        self.times = np.zeros(0, dtype=np.int32) if times is None else times
+        self.classes = [] if classes is None else classes
+        if presence is None:
+            presence = np.zeros((len(self.classes), (len(self.times) + 7) // 8), dtype=np.uint8)
+        self.presence = presence
+
+    def __len__(self):
+        return len(self.times)
+
+    def mask_of(self, class_names):
+        """
+        The method to get a boolean mask over the samples where any of the classes is present.
+
+        Parameters
+        ----------
+        class_names : list
+            a list of strings with the classes names
+
+        Returns
+        -------
+        array
+            a boolean numpy array with one value per sample
+        """
+
+        class_names = set(class_names)
+        rows = [index for index, name in enumerate(self.classes) if name in class_names]
+        if not rows:
+            return np.zeros(len(self.times), dtype=bool)
+        packed = np.bitwise_or.reduce(self.presence[rows], axis=0)
+        return np.unpackbits(packed, count=len(self.times)).astype(bool)
+
+    def times_of(self, class_names):
+        """
+        The method to get the times where any of the classes is present.
+
+        Parameters
+        ----------
+        class_names : list
+            a list of strings with the classes names
+
+        Returns
+        -------
+        array
+            a sorted int32 numpy array with the times in milliseconds
+        """
+
+        return self.times[self.mask_of(class_names)]
+
+    def to_dict(self):
+        """
+        The method to get a dict with the times of every class.
+
+        Returns
+        -------
+        dict
+            a dict with the list of times in milliseconds of every class
+        """
+
+        return {name: self.times_of([name]).tolist() for name in self.classes}
+
+    def save(self, path):
+        """
+        The method to write the timeline in a binary file.
+
+        Parameters
+        ----------
+        path : str
+            the path of the binary file
+        """
+
+        with open(path, 'wb') as file:
+            np.savez_compressed(file, **{TIMELINE_TIMES: self.times,
+                                         TIMELINE_CLASSES: np.array(self.classes, dtype=str),
+                                         TIMELINE_PRESENCE: self.presence})
+
+
+def from_samples(times, objects_list):
+    """
+    The method to build a timeline from the detections of every sample.
+
+    Parameters
+    ----------
+    times : list
+        a list with the sampled times in milliseconds
+    objects_list : list
+        a list with the set of detected objects names of every sample
+
+    Returns
+    -------
+    ObjectsTimeline
+        the timeline with the samples
+    """
+
+    times = np.rint(np.asarray(times, dtype=np.float64)).astype(np.int32)
+    classes = sorted({name for objects in objects_list for name in objects})
+    class_ids = {name: index for index, name in enumerate(classes)}
+
+    rows = [class_ids[name] for objects in objects_list for name in objects]
+    columns = [index for index, objects in enumerate(objects_list) for _ in objects]
+    matrix = np.zeros((len(classes), len(times)), dtype=bool)
+    matrix[rows, columns] = True
+
+    order = np.argsort(times, kind='stable')
+    return ObjectsTimeline(times[order], classes, np.packbits(matrix[:, order], axis=1))
+
+
+def from_dict(dictionary):
+    """
+    The method to build a timeline from a dict with the times of every class.
+
+    Parameters
+    ----------
+    dictionary : dict
+        a dict with the list of times in milliseconds of every class
+
+    Returns
+    -------
+    ObjectsTimeline
+        the timeline with the dict data
+    """
+
+    if dictionary is None:
+        return None
+
+    classes = sorted(dictionary.keys())
+    all_times = [np.asarray(dictionary[name], dtype=np.float64) for name in classes]
+    times = np.unique(np.rint(np.concatenate(all_times + [np.zeros(0)])).astype(np.int32))
+
+    matrix = np.zeros((len(classes), len(times)), dtype=bool)
+    for row, class_times in enumerate(all_times):
+        matrix[row, np.searchsorted(times, np.rint(class_times).astype(np.int32))] = True
+    return ObjectsTimeline(times, classes, np.packbits(matrix, axis=1))
+
+
+def load(path):
+    """
+    The method to read a timeline from a binary file.
+
+    Parameters
+    ----------
+    path : str
+        the path of the binary file
+
+    Returns
+    -------
+    ObjectsTimeline
+        the timeline with the file data
+    """
+
+    with np.load(path) as data:
+        return ObjectsTimeline(data[TIMELINE_TIMES], data[TIMELINE_CLASSES].tolist(),
+                               data[TIMELINE_PRESENCE])
@@ -0,0 +1,146 @@
+"""The module which represents the index of the detected scenes."""
+
+import numpy as np
+
+from video_summary.context.general_context import SnapPolicy
+
+
+def nearest_boundaries(boundaries, times):
+    """
+    Method to get the nearest boundary of every time.
+
+    ...
+
+    Parameters
+    ----------
+    boundaries : array
+        a sorted int64 numpy array with the boundaries
+    times : array
+        an int64 numpy array with the times
+
+    Returns
+    -------
+    array
+        an int64 numpy array with the nearest boundary of every time (the earlier one on ties)
+
+    """
+
+    indexes = np.searchsorted(boundaries, times)
+    before = boundaries[np.maximum(indexes - 1, 0)]
+    after = boundaries[np.minimum(indexes, len(boundaries) - 1)]
+    return np.where(times - before <= after - times, before, after)
+
+
+class SceneIndex:
+    """
+    A class used to represent the index of the detected scenes.
+
+    The scenes are kept sorted in two int64 arrays, so the intervals are snapped to the scenes
+    with binary searches over all of them at once.
+
+    ...
+
+    Attributes
+    ----------
+    starts : array
+        a sorted int64 numpy array with the start of every scene in milliseconds
+    ends : array
+        a sorted int64 numpy array with the end of every scene in milliseconds
+
+    Methods
+    -------
+    expand(times)
+        get the intervals expanded to their scenes
+    snap(times, policy, max_extension)
+        get the intervals snapped to the scenes with a snapping policy
+    """
+
+    def __init__(self, starts=None, ends=None):
+        self.starts = np.zeros(0, dtype=np.int64) if starts is None else starts
+        self.ends = np.zeros(0, dtype=np.int64) if ends is None else ends
+
+    def __len__(self):
+        return len(self.starts)
+
+    def expand(self, times):
+        """
+        The method to get the intervals expanded to their scenes.
+
+        Parameters
+        ----------
+        times : array
+            an int64 numpy matrix (intervals x 2) with the start and the end of every interval
+
+        Returns
+        -------
+        array
+            an int64 numpy matrix (intervals x 2) with the start of the scene of every start and
+            the end of the scene of every end (the scene which ends at or after the time), or
+            the time itself after the last scene
+        """
+
+        indexes = np.searchsorted(self.ends, times)
+        after_last = indexes == len(self)
+        indexes[after_last] = len(self) - 1
+        expanded = np.stack([self.starts[indexes[:, 0]], self.ends[indexes[:, 1]]], axis=1)
+        return np.where(after_last, times, expanded)
+
+    def snap(self, times, policy=SnapPolicy.EXPAND, max_extension=0):
+        """
+        The method to get the intervals snapped to the scenes with a snapping policy.
+
+        Parameters
+        ----------
+        times : list
+            a list of int pairs (start, end) with the intervals in milliseconds
+        policy : int
+            the snapping policy (class SnapPolicy)
+        max_extension : int
+            the maximum milliseconds which a time is moved by the LIMITED_EXPAND policy
+
+        Returns
+        -------
+        array
+            an int64 numpy matrix (intervals x 2) with the snapped intervals, where the times
+            after the last scene are kept
+        """
+
+        times = np.asarray(times, dtype=np.int64).reshape(-1, 2)
+        if not len(self) or not len(times):
+            return times.copy()
+
+        policy = SnapPolicy(policy)
+        expanded = self.expand(times)
+        if policy == SnapPolicy.NEAREST:
+            nearest = np.stack([nearest_boundaries(self.starts, times[:, 0]),
+                                nearest_boundaries(self.ends, times[:, 1])], axis=1)
+            nearest = np.where(times > self.ends[-1], times, nearest)
+            inverted = nearest[:, 0] > nearest[:, 1]  # the start snapped after the end
+            nearest[inverted] = expanded[inverted]
+            return nearest
+        if policy == SnapPolicy.LIMITED_EXPAND:
+            return np.where(np.abs(expanded - times) <= max_extension, expanded, times)
+        return expanded
+
+
+def from_scenes(scenes_list):
+    """
+    Method to build the index of a scenes list.
+
+    ...
+
+    Parameters
+    ----------
+    scenes_list : list
+        a list of int pairs (start, end) with the scenes in milliseconds, which may be None
+
+    Returns
+    -------
+    SceneIndex
+        the index of the scenes
+
+    """
+
+    scenes = np.asarray(scenes_list or [], dtype=np.int64).reshape(-1, 2)
+    scenes = scenes[np.argsort(scenes[:, 0], kind='stable')]
+    return SceneIndex(scenes[:, 0].copy(), scenes[:, 1].copy())
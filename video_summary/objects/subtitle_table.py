@@ -0,0 +1,506 @@
+"""The module which represents the columnar table of the subtitles."""
+
+import numpy as np
+
+from video_summary.objects.subtitle import Subtitle, from_dict
+
+# Strings for the binary file
+TABLE_STARTS = "starts"
+TABLE_ENDS = "ends"
+TABLE_SCORES = "scores"
+TABLE_TEXT_BUFFER = "textBuffer"
+TABLE_TEXT_OFFSETS = "textOffsets"
+TABLE_TEXT_MISSING = "textMissing"
+
+# Value of the missing times (the missing scores are NaN)
+MISSING_TIME = np.iinfo(np.int64).min
+
+# Sortable columns
+COLUMNS = ('starts', 'ends', 'scores')
+
+
+class SubtitleRow:
+    """
+    A class used to represent a view of one row of a SubtitleTable.
+
+    The view has the attributes and the methods of a Subtitle, and reads and writes the
+    columns of the table, so it costs two references instead of a Subtitle object.
+
+    ...
+
+    Attributes
+    ----------
+    table : SubtitleTable
+        the table of the row
+    index : int
+        the index of the row in the table
+
+    Methods
+    -------
+    set_times(start, end)
+        set start and end times to the row
+    get_times()
+        get start and end times like a list [start, end]
+    to_subtitle()
+        get a Subtitle with the row data
+    """
+
+    __slots__ = ('table', 'index')
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    @property
+    def text(self):
+        """ The subtitle text."""
+        return self.table.texts[self.index]
+
+    @text.setter
+    def text(self, value):
+        self.table.texts[self.index] = value
+
+    @property
+    def start(self):
+        """ The start time in milliseconds."""
+        return to_time(self.table.starts[self.index])
+
+    @start.setter
+    def start(self, value):
+        self.table.starts[self.index] = from_time(value)
+
+    @property
+    def end(self):
+        """ The end time in milliseconds."""
+        return to_time(self.table.ends[self.index])
+
+    @end.setter
+    def end(self, value):
+        self.table.ends[self.index] = from_time(value)
+
+    @property
+    def score(self):
+        """ The subtitle importance score."""
+        score = self.table.scores[self.index]
+        return None if np.isnan(score) else float(score)
+
+    @score.setter
+    def score(self, value):
+        self.table.scores[self.index] = np.nan if value is None else value
+
+    def set_times(self, start, end):
+        """
+        The method to set start and end times to the row.
+
+        Parameters
+        ----------
+        start : int
+            the start time in milliseconds
+        end : int
+            the end time in milliseconds
+        """
+
+        self.start = start
+        self.end = end
+
+    def get_times(self):
+        """
+        The method to get start and end times like a list [start, end].
+
+        Returns
+        -------
+        list
+            a list with the start and the end in milliseconds
+        """
+
+        return [self.start, self.end]
+
+    def to_subtitle(self):
+        """
+        The method to get a Subtitle with the row data.
+
+        Returns
+        -------
+        Subtitle
+            a new Subtitle detached from the table
+        """
+
+        return Subtitle(self.text, self.start, self.end, self.score)
+
+
+class SubtitleTable:
+    """
+    A class used to represent the subtitles as columns.
+
+    The times and the scores are numpy arrays, so the table is sorted, sliced and filtered in
+    bulk, and the rows are views with the Subtitle interface. In the binary file, the texts
+    are one UTF-8 buffer with the offsets of every text.
+
+    ...
+
+    Attributes
+    ----------
+    texts : list
+        a list with the text of every subtitle, which may be None
+    starts : array
+        an int64 numpy array with the start of every subtitle in milliseconds
+    ends : array
+        an int64 numpy array with the end of every subtitle in milliseconds
+    scores : array
+        a float64 numpy array with the score of every subtitle (NaN if it has no score)
+
+    Methods
+    -------
+    take(indices)
+        get a new table with some rows
+    filter(mask)
+        get a new table with the rows of a boolean mask
+    sorted_by(column, reverse)
+        get a new table sorted by a column
+    times()
+        get the [start, end] of every row
+    append(subtitle)
+        add a subtitle at the end of the table
+    extend(subtitles)
+        add the rows of another table at the end of the table
+    pop(index)
+        remove a row and get it as a Subtitle
+    to_subtitles()
+        get a list of Subtitles with the table data
+    save(path)
+        write the table in a binary file
+    write(file)
+        write the table in an open binary file
+    """
+
+    def __init__(self, texts=None, starts=None, ends=None, scores=None):
+        self.texts = [] if texts is None else list(texts)
+        size = len(self.texts)
+        self.starts = np.full(size, MISSING_TIME, dtype=np.int64) if starts is None else \
+            np.asarray(starts, dtype=np.int64)
+        self.ends = np.full(size, MISSING_TIME, dtype=np.int64) if ends is None else \
+            np.asarray(ends, dtype=np.int64)
+        self.scores = np.full(size, np.nan) if scores is None else \
+            np.asarray(scores, dtype=np.float64)
+
+    def __len__(self):
+        return len(self.texts)
+
+    def __iter__(self):
+        return (SubtitleRow(self, index) for index in range(len(self)))
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            if not -len(self) <= key < len(self):
+                raise IndexError('subtitle table index out of range')
+            return SubtitleRow(self, int(key) % len(self))
+        if isinstance(key, slice):
+            return self.take(np.arange(len(self))[key])
+        key = np.asarray(key)
+        if key.dtype == bool:
+            return self.filter(key)
+        return self.take(key)
+
+    def take(self, indices):
+        """
+        The method to get a new table with some rows.
+
+        Parameters
+        ----------
+        indices : array
+            an int numpy array with the indexes of the rows
+
+        Returns
+        -------
+        SubtitleTable
+            a new table with the rows in the order of the indexes
+        """
+
+        indices = np.asarray(indices, dtype=np.int64)
+        texts = self.texts
+        return SubtitleTable([texts[index] for index in indices.tolist()],
+                             self.starts[indices], self.ends[indices], self.scores[indices])
+
+    def filter(self, mask):
+        """
+        The method to get a new table with the rows of a boolean mask.
+
+        Parameters
+        ----------
+        mask : array
+            a boolean numpy array with one value per row
+
+        Returns
+        -------
+        SubtitleTable
+            a new table with the rows where the mask is True
+        """
+
+        return self.take(np.flatnonzero(mask))
+
+    def sorted_by(self, column, reverse=False):
+        """
+        The method to get a new table sorted by a column.
+
+        Parameters
+        ----------
+        column : str
+            the column's name ('starts', 'ends' or 'scores')
+        reverse : bool
+            a boolean to sort from the greatest to the lowest value
+
+        Returns
+        -------
+        SubtitleTable
+            a new table with the rows sorted, keeping the order of the equal values and
+            leaving the missing scores at the end
+        """
+
+        if column not in COLUMNS:
+            raise ValueError('{} is not a sortable column'.format(column))
+        values = getattr(self, column)
+        return self.take(np.argsort(-values if reverse else values, kind='stable'))
+
+    def times(self):
+        """
+        The method to get the [start, end] of every row.
+
+        Returns
+        -------
+        array
+            an int64 numpy matrix (rows x 2) with the times in milliseconds
+        """
+
+        return np.stack([self.starts, self.ends], axis=1)
+
+    def append(self, subtitle):
+        """
+        The method to add a subtitle at the end of the table.
+
+        Parameters
+        ----------
+        subtitle : Subtitle
+            the subtitle, or a row of any table
+        """
+
+        self.texts.append(subtitle.text)
+        self.starts = np.append(self.starts, from_time(subtitle.start))
+        self.ends = np.append(self.ends, from_time(subtitle.end))
+        self.scores = np.append(self.scores, np.nan if subtitle.score is None else
+                                subtitle.score)
+
+    def extend(self, subtitles):
+        """
+        The method to add the rows of another table at the end of the table.
+
+        Parameters
+        ----------
+        subtitles : SubtitleTable
+            the other table, or a list of Subtitles
+        """
+
+        table = as_table(subtitles)
+        self.texts.extend(table.texts)
+        self.starts = np.concatenate([self.starts, table.starts])
+        self.ends = np.concatenate([self.ends, table.ends])
+        self.scores = np.concatenate([self.scores, table.scores])
+
+    def pop(self, index=-1):
+        """
+        The method to remove a row and get it as a Subtitle.
+
+        Parameters
+        ----------
+        index : int
+            the index of the row
+
+        Returns
+        -------
+        Subtitle
+            the removed row
+        """
+
+        subtitle = self[index].to_subtitle()
+        index = index % len(self)
+        del self.texts[index]
+        self.starts = np.delete(self.starts, index)
+        self.ends = np.delete(self.ends, index)
+        self.scores = np.delete(self.scores, index)
+        return subtitle
+
+    def to_subtitles(self):
+        """
+        The method to get a list of Subtitles with the table data.
+
+        Returns
+        -------
+        list
+            a list of new Subtitles
+        """
+
+        return [row.to_subtitle() for row in self]
+
+    def save(self, path):
+        """
+        The method to write the table in a binary file.
+
+        Parameters
+        ----------
+        path : str
+            the path of the binary file
+        """
+
+        with open(path, 'wb') as file:
+            self.write(file)
+
+    def write(self, file):
+        """
+        The method to write the table in an open binary file.
+
+        Parameters
+        ----------
+        file : file
+            the binary file, open for writing
+        """
+
+        encoded = [(text or '').encode('utf-8') for text in self.texts]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(text) for text in encoded], out=offsets[1:])
+        np.savez_compressed(file, **{
+            TABLE_STARTS: self.starts,
+            TABLE_ENDS: self.ends,
+            TABLE_SCORES: self.scores,
+            TABLE_TEXT_BUFFER: np.frombuffer(b''.join(encoded), dtype=np.uint8),
+            TABLE_TEXT_OFFSETS: offsets,
+            TABLE_TEXT_MISSING: np.array([text is None for text in self.texts], dtype=bool)})
+
+
+def to_time(value):
+    """
+    Method to get a time of a column as a Subtitle time.
+
+    ...
+
+    Parameters
+    ----------
+    value : int
+        the time in the column
+
+    Returns
+    -------
+    int
+        the time in milliseconds, or None if it is missing
+
+    """
+
+    return None if value == MISSING_TIME else int(value)
+
+
+def from_time(value):
+    """
+    Method to get a Subtitle time as a time of a column.
+
+    ...
+
+    Parameters
+    ----------
+    value : int
+        the time in milliseconds, or None
+
+    Returns
+    -------
+    int
+        the time in the column
+
+    """
+
+    return MISSING_TIME if value is None else int(value)
+
+
+def from_subtitles(subtitles_list):
+    """
+    The method to build a table from a list of Subtitles.
+
+    Parameters
+    ----------
+    subtitles_list : list
+        a list of Subtitles or rows, without None values
+
+    Returns
+    -------
+    SubtitleTable
+        the table with the subtitles data
+    """
+
+    return SubtitleTable(
+        [sub.text for sub in subtitles_list],
+        np.fromiter((from_time(sub.start) for sub in subtitles_list), dtype=np.int64,
+                    count=len(subtitles_list)),
+        np.fromiter((from_time(sub.end) for sub in subtitles_list), dtype=np.int64,
+                    count=len(subtitles_list)),
+        np.fromiter((np.nan if sub.score is None else sub.score for sub in subtitles_list),
+                    dtype=np.float64, count=len(subtitles_list)))
+
+
+def as_table(subtitles):
+    """
+    The method to get the subtitles as a table.
+
+    Parameters
+    ----------
+    subtitles : SubtitleTable
+        a table, a list of Subtitles or None
+
+    Returns
+    -------
+    SubtitleTable
+        the same table, a new table with the list data, or None
+    """
+
+    if subtitles is None or isinstance(subtitles, SubtitleTable):
+        return subtitles
+    return from_subtitles([sub for sub in subtitles if sub is not None])
+
+
+def from_dict_list(dictionary_list):
+    """
+    The method to build a table from a list of dictionaries.
+
+    Parameters
+    ----------
+    dictionary_list : list
+        the list of dictionaries with the Subtitles data
+
+    Returns
+    -------
+    SubtitleTable
+        the table with the dictionaries data
+    """
+
+    return from_subtitles([from_dict(dictionary) for dictionary in dictionary_list
+                           if dictionary is not None])
+
+
+def load(path):
+    """
+    The method to read a table from a binary file.
+
+    Parameters
+    ----------
+    path : str
+        the path of the binary file
+
+    Returns
+    -------
+    SubtitleTable
+        the table with the file data
+    """
+
+    with np.load(path) as data:
+        buffer = data[TABLE_TEXT_BUFFER].tobytes()
+        offsets = data[TABLE_TEXT_OFFSETS].tolist()
+        missing = data[TABLE_TEXT_MISSING].tolist()
+        texts = [None if missing[index] else
+                 buffer[offsets[index]:offsets[index + 1]].decode('utf-8')
+                 for index in range(len(missing))]
+        return SubtitleTable(texts, data[TABLE_STARTS], data[TABLE_ENDS], data[TABLE_SCORES])
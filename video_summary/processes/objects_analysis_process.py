@@ -2,15 +2,21 @@
 
 import logging
 import os
-from collections import defaultdict
+from functools import partial
 
+import numpy as np
 from PyQt5 import QtCore
 from PyQt5.QtCore import QThread
 
 from video_summary.context.general_context import GeneralContext
 from video_summary.context.objects_context import ObjectsContext
 from video_summary.context.scenes_context import ScenesContext
-from video_summary.utils import load_video, load_yolo, detect_objects
+from video_summary.detection.cascade import DetectionCascade
+from video_summary.detection.frame_ring import FrameRing, start_decoders, receive_frames, \
+    stop_decoders
+from video_summary.detection.inference_service import get_service, release_service
+from video_summary.objects import detections_store, objects_timeline
+from video_summary.utils import load_video, load_yolo, locate_objects
 
 # Paths
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -19,6 +25,9 @@ ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 LOGGER_NAME = 'App.Processes.ObjectsAnalysis'
 LOG = logging.getLogger(LOGGER_NAME)
 
+# Minimum confidence of the detections kept in the detections store
+STORE_MIN_CONFIDENCE = 0.05
+
 
 class ObjectsAnalysis(QThread):
     """
@@ -32,9 +41,17 @@ class ObjectsAnalysis(QThread):
         the signal to change the progress bar
     scenes_process : process
         the process of the scene analysis
+    services : list
+        a list with the shared inference services of the loaded detectors
 
     Methods
     -------
+    detect_decoded(path, milli_secs, detector, workers, slots)
+        detect the objects of the frames decoded by other processes
+    load_detector(manager, weights_path, cfg_path, prepared)
+        load a Yolo's net, or get its shared inference service
+    release_detectors()
+        release the shared inference services of the loaded detectors
     restart_process()
         restart the objects analysis process
     activate_process()
@@ -56,10 +73,11 @@ class ObjectsAnalysis(QThread):
         self.active = True
         self.restart = False
         self.scenes_process = scenes_process
+        self.services = []
         LOG.info('objects analysis process initialized')
 
     def run(self):
-        """ Method that analysis the objects and save the objects dict in the ObjectsContext."""
+        """ Method that analysis the objects and save the objects timeline in the ObjectsContext."""
         while True:
             LOG.debug('starting objects analysis')
             self.active = True
@@ -89,10 +107,30 @@ class ObjectsAnalysis(QThread):
                 # Load yolo
                 if self.active:
                     LOG.debug('loading Yolo\'s darknet')
-                    model, classes, output_layers = load_yolo(
-                        manager.yolo_weights_path, manager.yolo_cfg_path, manager.yolo_names_path)
+                    decoder_workers = manager.decoder_workers
+                    ring_slots = manager.ring_slots
+                    detector, classes = self.load_detector(
+                        manager, manager.yolo_weights_path, manager.yolo_cfg_path,
+                        prepared=decoder_workers > 0)
                     LOG.debug('Yolo\'s darknet loaded')
 
+                # Load the screen of the cascade
+                cascade = None
+                if self.active and manager.cascade:
+                    if manager.screen_weights_path and manager.screen_cfg_path:
+                        LOG.debug('loading screen darknet')
+                        screen, _ = self.load_detector(
+                            manager, manager.screen_weights_path, manager.screen_cfg_path,
+                            prepared=decoder_workers > 0)
+                        cascade = DetectionCascade(
+                            screen, detector,
+                            [classes.index(obj) for obj in manager.objects_list if obj in classes],
+                            manager.screen_threshold)
+                        detector = cascade.detect
+                        LOG.debug('screen darknet loaded')
+                    else:
+                        LOG.warning('cascade without screen model paths, using only Yolo')
+
                 # Get scenes to analyse
                 if self.active:
                     if manager.optimization:
@@ -112,18 +150,36 @@ class ObjectsAnalysis(QThread):
             if self.active:
                 LOG.debug('starting objects detection')
                 with ObjectsContext() as manager:
-                    manager.objects_dict = defaultdict(list)
-                    for index, milli_sec in enumerate(milli_sec_to_analyse):
-                        if self.active:
-                            frame = clip.get_frame(milli_sec / 1000)
-                            objects = detect_objects(frame, model, output_layers, classes)
-                            for obj in objects:
-                                manager.objects_dict[obj].append(milli_sec)
-                            self.progress.emit(index / len(milli_sec_to_analyse) * 100)
-                        else:
-                            break
+                    if decoder_workers > 0:
+                        detections_list = self.detect_decoded(
+                            path, milli_sec_to_analyse, detector, decoder_workers, ring_slots)
+                    else:
+                        detections_list = []
+                        for index, milli_sec in enumerate(milli_sec_to_analyse):
+                            if self.active:
+                                frame = clip.get_frame(milli_sec / 1000)
+                                detections_list.append(detector(frame))
+                                self.progress.emit(index / len(milli_sec_to_analyse) * 100)
+                            else:
+                                break
+                    analysed = [milli_sec for milli_sec, detections
+                                in zip(milli_sec_to_analyse, detections_list)
+                                if detections is not None]
+                    detections_list = [detections for detections in detections_list
+                                       if detections is not None]
+                    objects_list = [{classes[class_id] for class_id in np.unique(detections[0])}
+                                    for detections in detections_list]
+                    manager.objects_timeline = objects_timeline.from_samples(
+                        analysed, objects_list)
+                    manager.detections_store = detections_store.from_samples(
+                        analysed, detections_list, classes, STORE_MIN_CONFIDENCE)
+                if cascade is not None:
+                    cascade.log_statistics()
                 LOG.debug('objects detection ended')
 
+            # Release the shared inference services
+            self.release_detectors()
+
             if self.active:
                 self.progress.emit(100)
 
@@ -132,6 +188,89 @@ class ObjectsAnalysis(QThread):
             if not self.restart:
                 break
 
+    def detect_decoded(self, path, milli_secs, detector, workers, slots):
+        """
+        Method that detect the objects of the frames decoded by other processes.
+
+        The decoder processes write the reduced frames into a shared memory ring, and the
+        detector reads them in place.
+
+        Parameters
+        ----------
+        path : str
+            the video's path
+        milli_secs : list
+            a list with the time in milliseconds of every frame
+        detector : callable
+            the detector, which returns the (class_ids, confidences, boxes) of a reduced frame
+        workers : int
+            the number of decoder processes
+        slots : int
+            the number of frame slots of the ring
+
+        Returns
+        -------
+        list
+            a list with the detections of every frame, or None if the frame was not analysed
+        """
+
+        ring = FrameRing(slots)
+        decoders = start_decoders(ring, path, milli_secs, workers)
+        detections_list = [None] * len(milli_secs)
+        try:
+            for count, (index, position) in enumerate(
+                    receive_frames(ring, len(milli_secs), decoders)):
+                if not self.active:
+                    ring.release(index)
+                    break
+                detections_list[position] = detector(ring.frames[index])
+                ring.release(index)
+                self.progress.emit(count / len(milli_secs) * 100)
+        finally:
+            stop_decoders(ring, decoders)
+            ring.close()
+        return detections_list
+
+    def load_detector(self, manager, weights_path, cfg_path, prepared=False):
+        """
+        Method that load a Yolo's net, or get its shared inference service.
+
+        The shared services are kept until release_detectors.
+
+        Parameters
+        ----------
+        manager : ObjectsContext
+            the objects context
+        weights_path : str
+            the Yolo's weights path
+        cfg_path : str
+            the Yolo's cfg path
+        prepared : bool
+            a boolean to indicate that the detector receives reduced frames
+
+        Returns
+        -------
+        callable
+            the detector, which returns the (class_ids, confidences, boxes) of a frame
+        list
+            a list of strings with the classes names
+        """
+
+        if manager.shared_inference:
+            service = get_service(weights_path, cfg_path, manager.yolo_names_path,
+                                  manager.inference_batch, manager.inference_latency / 1000)
+            self.services.append(service)
+            return partial(service.detect, prepared=prepared), service.classes
+
+        model, classes, output_layers = load_yolo(weights_path, cfg_path, manager.yolo_names_path)
+        return partial(locate_objects, net=model, output_layers=output_layers,
+                       prepared=prepared), classes
+
+    def release_detectors(self):
+        """ Method that release the shared inference services of the loaded detectors."""
+        while self.services:
+            release_service(self.services.pop())
+
     def restart_process(self):
         """ Method that restart the objects analysis process."""
         self.active = False
@@ -2,6 +2,7 @@
 
 import logging
 
+import numpy as np
 from PyQt5 import QtCore
 from PyQt5.QtCore import QThread
 
@@ -9,13 +10,45 @@ from video_summary.context.general_context import GeneralContext, ResumeMode
 from video_summary.context.objects_context import ObjectsContext
 from video_summary.context.scenes_context import ScenesContext
 from video_summary.context.subtitles_context import SubtitlesContext
-from video_summary.utils import normalize_times
+from video_summary.objects.interval_set import from_times
+from video_summary.objects.scene_index import from_scenes
+from video_summary.objects.subtitle_table import as_table
 
 # Logger
 LOGGER_NAME = 'App.Processes.Resume'
 LOG = logging.getLogger(LOGGER_NAME)
 
 
+def subtitles_times(subtitles_list, resume_percentage):
+    """
+    Method to get the times of the best subtitles.
+
+    The repeated subtitles have no score, so the percentage is applied to the scored ones: the
+    resume keeps the same share of the different phrases with or without repetitions.
+
+    ...
+
+    Parameters
+    ----------
+    subtitles_list : SubtitleTable
+        the table of the scored subtitles (NaN for the repetitions)
+    resume_percentage : float
+        the resume percentage of the scored subtitles (0 - 100)
+
+    Returns
+    -------
+    array
+        an int64 numpy matrix (subtitles x 2) with the times of the best subtitles in
+        milliseconds, from the best one
+
+    """
+
+    subtitles_table = as_table(subtitles_list)
+    subtitles_table = subtitles_table[~np.isnan(subtitles_table.scores)]
+    subtitles_table = subtitles_table.sorted_by('scores', reverse=True)
+    return subtitles_table[: int(len(subtitles_table) * resume_percentage / 100)].times()
+
+
 class Resume(QThread):
     """
     The resume process.
@@ -82,6 +115,8 @@ class Resume(QThread):
                 with GeneralContext(read_only=True) as manager:
                     mode = manager.resume_mode
                     detect_scenes = manager.detect_scenes
+                    snap_policy = manager.snap_policy
+                    max_snap_extension = manager.max_snap_extension
                 self.progress.emit(20)
 
             # Add the times of the subtitles
@@ -89,9 +124,8 @@ class Resume(QThread):
                 if mode in (ResumeMode.SUBTITLES, ResumeMode.SUBTITLES_AND_OBJECTS):
                     LOG.debug('adding subtitles times')
                     with SubtitlesContext(read_only=True) as manager:
-                        result = sorted(manager.subtitles_list, key=lambda x: x.score, reverse=True)
-                        result = result[: int(len(result) * manager.resume_percentage / 100)]
-                        result = [x.get_times() for x in result]
+                        result = subtitles_times(manager.subtitles_list,
+                                                 manager.resume_percentage).tolist()
                     LOG.debug('subtitles times added')
                 self.progress.emit(40)
 
@@ -100,12 +134,20 @@ class Resume(QThread):
                 if mode in (ResumeMode.OBJECTS, ResumeMode.SUBTITLES_AND_OBJECTS):
                     LOG.debug('adding objects times')
                     with ObjectsContext(read_only=True) as manager:
-                        for key in list(
-                                set(manager.objects_list).intersection(
-                                    manager.objects_dict.keys())):
-                            object_times = manager.objects_dict.get(key)
-                            for object_time in object_times:
-                                result.append([object_time - 10, object_time + 10])
+                        filtered = manager.min_confidence or manager.min_area
+                        if filtered and not len(manager.detections_store):
+                            LOG.warning('no detections store, the objects times are not '
+                                        'filtered by confidence and area')
+                            filtered = False
+                        if filtered:
+                            LOG.debug('filtering detections by confidence and area')
+                            object_times = manager.detections_store.times_of(
+                                manager.objects_list, manager.min_confidence, manager.min_area)
+                        else:
+                            object_times = manager.objects_timeline.times_of(
+                                manager.objects_list)
+                        result += np.stack([object_times - 10, object_times + 10],
+                                           axis=1).tolist()
                     LOG.debug('objects times added')
                 self.progress.emit(60)
 
@@ -114,23 +156,18 @@ class Resume(QThread):
                 if detect_scenes:
                     LOG.debug('adjusting times to scenes')
                     with ScenesContext(read_only=True) as manager:
-                        for index, time in enumerate(result):
-                            scene_ini = [s for s in manager.scenes_list if time[0] <= s[1]][0]
-                            result[index][0] = scene_ini[0]
-                            scene_fin = [s for s in manager.scenes_list if time[1] <= s[1]][0]
-                            result[index][1] = scene_fin[1]
+                        scene_index = from_scenes(manager.scenes_list)
+                    result = scene_index.snap(result, snap_policy, max_snap_extension)
                     LOG.debug('times adjusted to scenes')
                 self.progress.emit(80)
 
             # Normalize and save resume times
             if self.active:
                 LOG.debug('normalizing times')
-                result = sorted(result, key=lambda times: times[0])
-                result = normalize_times(result)
+                resume_times = from_times(result).union(gap=1)
                 with GeneralContext() as manager:
-                    manager.resume_times = []
-                    for x in result:
-                        manager.resume_times.append(x)
+                    manager.resume_times = resume_times.to_list()
+                LOG.info('%d resume times of %d ms', len(resume_times), resume_times.duration())
                 LOG.debug('times normalized')
 
             if self.active:
@@ -8,6 +8,7 @@ from moviepy.video.compositing.concatenate import concatenate_videoclips
 from proglog import TqdmProgressBarLogger
 
 from video_summary.context.general_context import GeneralContext
+from video_summary.objects.interval_set import from_times
 from video_summary.utils import load_video
 
 # Logger
@@ -148,16 +149,19 @@ class SaveVideo(QThread):
                 LOG.debug('loading the original video')
                 with GeneralContext(read_only=True) as manager:
                     path = manager.final_video_path
-                    resume_times = manager.resume_times
+                    resume_times = from_times(manager.resume_times).union(gap=1)
                     clip = load_video(manager.original_video_path)
                 LOG.debug('original video loaded')
 
             # Get and concatenate the sub clips for the final video
             if self.active:
                 LOG.debug('getting and concatenating the sub clips')
+                LOG.info('cutting %d sub clips of %d ms', len(resume_times),
+                         resume_times.duration())
                 clips = []
-                for index, sub_times in enumerate(resume_times):
-                    clips.append(clip.subclip(sub_times[0] / 1000, sub_times[1] / 1000))
+                for index, (start, end) in enumerate(zip(resume_times.starts / 1000,
+                                                         resume_times.ends / 1000)):
+                    clips.append(clip.subclip(start, end))
                     self.progress_cut.emit(index / len(resume_times) * 100)
                 final_clip = concatenate_videoclips(clips)
                 self.progress_cut.emit(100)
@@ -1,44 +1,139 @@
 """ The module for the subtitles analysis process."""
 
 import logging
+import os
 
-import nltk
-import numpy as np
 from PyQt5 import QtCore
 from PyQt5.QtCore import QThread
-from nltk.corpus import stopwords
 
-from video_summary.context.subtitles_context import SubtitlesContext, Languages
-from video_summary.utils import VECTORING_SWITCHER, load_subtitles, join_phrases, clean_phrases
+from video_summary.context.subtitles_context import SubtitlesContext, SummarizerType
+from video_summary.objects.subtitle_table import SubtitleTable, from_subtitles
+from video_summary.subtitles.assembler import SentenceAssembler
+from video_summary.subtitles.cache import FileDigest, ResultsCache, content_digest, \
+    file_tail, is_grown, results_key
+from video_summary.subtitles.corpus import CORPUS_TYPES, CorpusModel, load
+from video_summary.subtitles.embedded import is_container
+from video_summary.subtitles.incremental import IncrementalLsa
+from video_summary.subtitles.scoring import PhraseScorer
+from video_summary.subtitles.stop_words import load_stop_words
+from video_summary.utils import load_subtitle_table, load_new_subtitles, join_phrases, \
+    clean_phrases
 
 # Logger
 LOGGER_NAME = 'App.Processes.SubtitlesAnalysis'
 LOG = logging.getLogger(LOGGER_NAME)
 
-# Switcher
-SWITCHER_LANGUAGE = {
-    Languages.ARABIC: "arabic",
-    Languages.AZERBAIJANI: "azerbaijani",
-    Languages.DANISH: "danish",
-    Languages.DUTCH: "dutch",
-    Languages.ENGLISH: "english",
-    Languages.FINNISH: "finnish",
-    Languages.FRENCH: "french",
-    Languages.GERMAN: "german",
-    Languages.GREEK: "greek",
-    Languages.HUNGARIAN: "hungarian",
-    Languages.INDONESIAN: "indonesian",
-    Languages.ITALIAN: "italian",
-    Languages.KAZAKH: "kazakh",
-    Languages.NEPALI: "nepali",
-    Languages.NORWEGIAN: "norwegian",
-    Languages.PORTUGUESE: "portuguese",
-    Languages.ROMANIAN: "romanian",
-    Languages.RUSSIAN: "russian",
-    Languages.SPANISH: "spanish",
-    Languages.SWEDISH: "swedish",
-    Languages.TURKISH: "turkish"
-}
+# Version of the cached results
+CACHE_VERSION = 1
+
+
+def read_phrases_options(manager):
+    """
+    Method to get the options which change the counted phrases.
+
+    ...
+
+    Parameters
+    ----------
+    manager : SubtitlesContext
+        the open subtitles context
+
+    Returns
+    -------
+    dict
+        a dict with the joining and cleaning options
+
+    """
+
+    return {
+        'removeCapitalLetters': manager.remove_capital_letters,
+        'removeStopWords': manager.remove_stop_words,
+        'removePunctuation': manager.remove_punctuation,
+        'removeAccents': manager.remove_accents,
+        'stemWords': manager.stem_words,
+        'language': manager.language,
+        'punctuationSigns': manager.punctuation_signs,
+        'maxSentenceLength': manager.max_sentence_length,
+        'maxSentenceDuration': manager.max_sentence_duration,
+        'duplicateThreshold': manager.duplicate_threshold,
+        'hashingFeatures': manager.hashing_features}
+
+
+def read_options(manager):
+    """
+    Method to get the options of the subtitles analysis.
+
+    ...
+
+    Parameters
+    ----------
+    manager : SubtitlesContext
+        the open subtitles context
+
+    Returns
+    -------
+    dict
+        a dict with the options which change the counted phrases and their scores
+
+    """
+
+    return dict(read_phrases_options(manager),
+                streamLanguage=manager.stream_language,
+                vectoringType=manager.vectoring_type,
+                summarizer=manager.summarizer,
+                resumePercentage=manager.resume_percentage,
+                concepts=manager.concepts,
+                phrasesPerConcept=manager.phrases_per_concept,
+                incrementalAnalysis=manager.incremental_analysis,
+                version=CACHE_VERSION)
+
+
+def build_corpus(paths, corpus_path, options, phrases_options):
+    """
+    Method to add a batch of subtitles files of a series to its corpus model.
+
+    The phrases are cleaned and their repetitions collapsed like in the analysis, so the
+    document frequencies do not depend on how the model was built. The files already counted
+    by the model are skipped, so the model can be updated with the new episodes.
+
+    ...
+
+    Parameters
+    ----------
+    paths : list
+        a list with the paths of the subtitles files
+    corpus_path : str
+        the path of the corpus model, which is created if it does not exist
+    options : dict
+        the analysis options, like read_options
+    phrases_options : dict
+        the options of the counted phrases, like read_phrases_options
+
+    Returns
+    -------
+    CorpusModel
+        the updated corpus model
+
+    """
+
+    if os.path.exists(corpus_path):
+        corpus = load(corpus_path)
+        if corpus.options != phrases_options:
+            raise ValueError('{} was built with other options'.format(corpus_path))
+    else:
+        corpus = CorpusModel(phrases_options['hashingFeatures'], phrases_options)
+
+    for path in paths:
+        LOG.debug('adding %s to the corpus', path)
+        scorer = PhraseScorer(SubtitlesAnalysis.read_phrases(path, options),
+                              options['duplicateThreshold'])
+        if corpus.add(content_digest(path), scorer.phrases):
+            LOG.info('%s added to the corpus', path)
+        else:
+            LOG.info('%s already in the corpus', path)
+    corpus.save(corpus_path)
+    LOG.info('corpus of %d episodes written at %s', len(corpus), corpus_path)
+    return corpus
 
 
 class SubtitlesAnalysis(QThread):
@@ -51,6 +146,34 @@ class SubtitlesAnalysis(QThread):
     ----------
     progress : signal
         the signal to change the progress bar
+    content_key : tuple
+        the path and the modification time of the hashed subtitles file
+    content_hash : str
+        the hexadecimal digest of the hashed subtitles file
+    file_digest : FileDigest
+        the running digest of the hashed subtitles file, which hashes only the new bytes when
+        the file grows
+    phrases_key : tuple
+        the subtitles content, the subtitles stream and the cleaning options of the counted
+        phrases
+    scorer : PhraseScorer
+        the scoring of the counted subtitles, with their term counts
+    corpus_key : tuple
+        the path and the modification time of the loaded corpus model
+    corpus : CorpusModel
+        the loaded corpus model
+    incremental_key : tuple
+        the subtitles path and the options of the incremental analysis
+    incremental_content : tuple
+        the size and the last bytes of the subtitles file read by the incremental analysis
+    cues_offset : int
+        the byte offset of the subtitles file where the next incremental update starts
+    assembler : SentenceAssembler
+        the assembler of the incremental analysis, with the fragments of the next sentence
+    incremental_lsa : IncrementalLsa
+        the latent semantic analysis of the incremental analysis
+    incremental_list : SubtitleTable
+        the table of the subtitles of the incremental analysis
 
     Methods
     -------
@@ -71,6 +194,19 @@ class SubtitlesAnalysis(QThread):
         QThread.__init__(self)
         self.active = True
         self.restart = False
+        self.content_key = None
+        self.content_hash = None
+        self.file_digest = FileDigest()
+        self.phrases_key = None
+        self.scorer = None
+        self.corpus_key = None
+        self.corpus = None
+        self.incremental_key = None
+        self.incremental_content = None
+        self.cues_offset = 0
+        self.assembler = None
+        self.incremental_lsa = None
+        self.incremental_list = None
         LOG.info('subtitles analysis process initialized')
 
     def run(self):
@@ -82,73 +218,71 @@ class SubtitlesAnalysis(QThread):
             self.active = True
             self.restart = False
 
-            # Check and download stopwords if necessary
+            # Look for the results of the same subtitles with the same options
             if self.active:
-                try:
-                    nltk.data.find('corpora/stopwords.zip/stopwords')
-                except LookupError:
-                    nltk.download('stopwords')
-
-            # Load, join and clean the original subtitles
-            if self.active:
-                LOG.debug('loading and processing the original subtitles')
                 with SubtitlesContext(read_only=True) as manager:
-                    vectoring = VECTORING_SWITCHER.get(manager.vectoring_type)
-                    stop_words = stopwords.words(SWITCHER_LANGUAGE.get(manager.language))
-                    punctuation_list = list(manager.punctuation_signs)
-
-                    subtitles_list = load_subtitles(manager.subtitles_path)
-                    subtitles_list = join_phrases(subtitles_list)
-                    subtitles_list = clean_phrases(
-                        subtitles_list,
-                        remove_capital_letters=manager.remove_capital_letters,
-                        remove_stop_words=manager.remove_stop_words,
-                        remove_punctuation=manager.remove_punctuation,
-                        remove_accents=manager.remove_accents,
-                        stop_words=stop_words,
-                        punctuation_signs=punctuation_list)
-
-                LOG.debug('original subtitles loaded and processed')
-
-            # Create LSA matrix with the vectoring result
-            if self.active:
-                LOG.debug('vectoring subtitles')
-                x = vectoring.fit_transform(
-                    [sub.text for sub in subtitles_list])  # scattered matrix
-                num_rows, num_columns = x.shape
-                a = np.zeros(shape=(num_rows, num_columns))  # scattered matrix transformed
-
-                for row in range(num_rows):
-                    _, c_index = x.getrow(row).nonzero()
-                    for column in c_index:
-                        a[row, column] = x[row, column]
-                LOG.debug('subtitles vectorized')
-
-            # Run the SDV algorithm and select best phrases
-            if self.active:
+                    subtitles_path = manager.subtitles_path
+                    content_hash = self.hash_content(subtitles_path)
+                    phrases_options = read_phrases_options(manager)
+                    options = read_options(manager)
+                    corpus_path = manager.corpus_path
+                    update_corpus = manager.update_corpus
+                    cache = ResultsCache(manager.cache_size * 2 ** 20) \
+                        if manager.cache_size else None
+
+                corpus = self.load_corpus(corpus_path, phrases_options, update_corpus) \
+                    if options['vectoringType'] in CORPUS_TYPES else None
+                if corpus is not None:
+                    options.update(corpusPath=corpus_path, corpusPhrases=corpus.documents,
+                                   updateCorpus=update_corpus)
+                key = results_key(content_hash, options)
+                subtitles_list = cache.get(key) if cache is not None else None
+                cached = subtitles_list is not None
+                incremental = options['incrementalAnalysis'] and \
+                    options['summarizer'] == SummarizerType.LSA
+
+            # Append the new subtitles to the incremental analysis
+            if self.active and not cached and incremental:
+                subtitles_list, scores = self.analyse_incremental(subtitles_path, options)
+                self.progress.emit(50)
+
+            # Load, join and clean the original subtitles, unless they are already counted
+            if self.active and not cached and not incremental:
+                phrases_key = (content_hash, options['streamLanguage'], phrases_options)
+                if phrases_key != self.phrases_key:
+                    LOG.debug('loading and processing the original subtitles')
+                    self.scorer = PhraseScorer(self.read_phrases(subtitles_path, options),
+                                               options['duplicateThreshold'])
+                    self.phrases_key = phrases_key
+                    LOG.debug('original subtitles loaded and processed')
+                subtitles_list = self.scorer.subtitles_list
+
+            # Add the subtitles to the corpus model
+            if self.active and not cached and not incremental:
+                if corpus is not None and update_corpus and \
+                        corpus.add(content_hash, self.scorer.phrases):
+                    corpus.save(corpus_path)
+                    self.corpus_key = (corpus_path, os.stat(corpus_path).st_mtime_ns)
+                    LOG.info('subtitles added to the corpus at %s', corpus_path)
+
+            # Score the phrases with the vectoring result, with the statistics of the corpus
+            # model or with the statistics of the subtitles
+            if self.active and not cached and not incremental:
                 LOG.debug('analysing subtitles')
-                _, _, v = np.linalg.svd(a, full_matrices=False)  # phrase x concept matrix
-                vt = v.T  # concept x phrase matrix
-
-                best_phrases = []
-                for index, i in enumerate(vt):
-                    if self.active:
-                        best_phrase = i.tolist().index(max(i))  # TODO: Select the n maxims
-                        if best_phrase not in best_phrases:
-                            best_phrases.append(best_phrase)
-                        self.progress.emit(index / len(vt) * 100)
-                    else:
-                        break
+                self.progress.emit(50)
+                scores = self.scorer.score(options, corpus)
                 LOG.debug('subtitles analysed')
 
-            # Add subtitle punctuation and save to SubtitlesContext
-            if self.active:
+            # Add subtitle punctuation
+            if self.active and not cached:
                 LOG.debug('punctuating subtitles')
-                for index, i in enumerate(best_phrases):
-                    subtitle = subtitles_list[i]
-                    subtitle.score = len(best_phrases) - index
+                subtitles_list.scores = scores.astype(float)
+                if cache is not None:
+                    cache.put(key, subtitles_list)
                 LOG.debug('subtitles punctuated')
 
+            # Save to SubtitlesContext
+            if self.active:
                 LOG.debug('saving subtitles')
                 with SubtitlesContext() as manager:
                     manager.subtitles_list = subtitles_list
@@ -162,6 +296,205 @@ class SubtitlesAnalysis(QThread):
             if not self.restart:
                 break
 
+    def analyse_incremental(self, path, options):
+        """
+        Method to append the new subtitles of a file to the incremental analysis.
+
+        The analysis restarts unless the subtitles file only grew since the last update with
+        the same options. Only the text after the last read cue is parsed, and a cue waits for
+        the blank line after it, so the last cue of a file is not read while it is written. The
+        fragments of an unfinished sentence wait in the assembler for the next update, so the
+        analysis may have no subtitles yet. A video container is read again whole.
+
+        ...
+
+        Parameters
+        ----------
+        path : str
+            the subtitles' path
+        options : dict
+            the analysis options
+
+        Returns
+        -------
+        SubtitleTable
+            the table of all the subtitles of the incremental analysis
+        array
+            a float numpy array with the score of every subtitle
+
+        """
+
+        incremental_key = (path, options)
+        if incremental_key != self.incremental_key or not self.is_grown(path):
+            LOG.debug('starting incremental subtitles analysis')
+            self.assembler = SentenceAssembler(options['maxSentenceLength'],
+                                               options['maxSentenceDuration'])
+            self.incremental_lsa = IncrementalLsa(
+                options['vectoringType'], options['resumePercentage'], options['concepts'],
+                options['phrasesPerConcept'], options['hashingFeatures'])
+            self.incremental_list = SubtitleTable()
+            self.cues_offset = 0
+            self.incremental_key = incremental_key
+
+        LOG.debug('appending new subtitles')
+        if is_container(path):
+            subtitles_list = load_subtitle_table(path, options['streamLanguage'])
+        else:
+            subtitles_list, self.cues_offset = load_new_subtitles(path, self.cues_offset)
+            self.incremental_content = (self.cues_offset, file_tail(path, self.cues_offset))
+        subtitles_list = self.clean(from_subtitles(self.assembler.assemble(subtitles_list)),
+                                    options)
+        self.incremental_lsa.append(subtitles_list.texts)
+        self.incremental_list.extend(subtitles_list)
+        LOG.debug('%d new subtitles appended', len(subtitles_list))
+        return self.incremental_list, self.incremental_lsa.scores()
+
+    def hash_content(self, path):
+        """
+        Method to get the digest of the subtitles file, hashing only its new bytes when it grows.
+
+        ...
+
+        Parameters
+        ----------
+        path : str
+            the subtitles' path
+
+        Returns
+        -------
+        str
+            the hexadecimal digest of the content, like cache.content_digest
+
+        """
+
+        content_key = (path, os.stat(path).st_mtime_ns)
+        if content_key != self.content_key:
+            self.content_hash = content_digest(path) if is_container(path) \
+                else self.file_digest.hexdigest(path)
+            self.content_key = content_key
+        return self.content_hash
+
+    def is_grown(self, path):
+        """
+        Method to check if the subtitles file only grew since the last incremental update.
+
+        ...
+
+        Parameters
+        ----------
+        path : str
+            the subtitles' path
+
+        Returns
+        -------
+        bool
+            True if the file keeps the last bytes read by the last incremental update at the same
+            place (a video container is analysed again when it changes)
+
+        """
+
+        if is_container(path):
+            return False
+        return is_grown(path, *self.incremental_content)
+
+    def load_corpus(self, path, phrases_options, update=False):
+        """
+        Method to get the corpus model of the series, loading it only when it changes.
+
+        ...
+
+        Parameters
+        ----------
+        path : str
+            the path of the corpus model (None for no corpus model)
+        phrases_options : dict
+            the options of the counted phrases, which must be the options of the model
+        update : bool
+            a boolean to start a new model when the file does not exist
+
+        Returns
+        -------
+        CorpusModel
+            the corpus model, or None if there is no usable model
+
+        """
+
+        if not path:
+            return None
+        if not os.path.exists(path):
+            if not update:
+                LOG.warning('corpus model %s not found', path)
+                return None
+            self.corpus = CorpusModel(phrases_options['hashingFeatures'], phrases_options)
+            self.corpus_key = None
+        else:
+            corpus_key = (path, os.stat(path).st_mtime_ns)
+            if corpus_key != self.corpus_key:
+                self.corpus = load(path)
+                self.corpus_key = corpus_key
+                LOG.info('corpus model read from %s', path)
+        if self.corpus.options != phrases_options:
+            LOG.warning('corpus model %s was built with other options', path)
+            return None
+        return self.corpus
+
+    @staticmethod
+    def read_phrases(path, options):
+        """
+        Method to load, join and clean the subtitles of a file with the analysis options.
+
+        ...
+
+        Parameters
+        ----------
+        path : str
+            the subtitles' path
+        options : dict
+            the analysis options
+
+        Returns
+        -------
+        SubtitleTable
+            the table of the joined subtitles with the text cleaned
+
+        """
+
+        subtitles_list = join_phrases(load_subtitle_table(path, options.get('streamLanguage')),
+                                      options['maxSentenceLength'],
+                                      options['maxSentenceDuration'])
+        return SubtitlesAnalysis.clean(subtitles_list, options)
+
+    @staticmethod
+    def clean(subtitles_list, options):
+        """
+        Method to clean the text of the joined subtitles with the analysis options.
+
+        ...
+
+        Parameters
+        ----------
+        subtitles_list : SubtitleTable
+            the table of the joined subtitles
+        options : dict
+            the analysis options
+
+        Returns
+        -------
+        SubtitleTable
+            the table with the text of the subtitles cleaned
+
+        """
+
+        return clean_phrases(
+            subtitles_list,
+            remove_capital_letters=options['removeCapitalLetters'],
+            remove_stop_words=options['removeStopWords'],
+            remove_punctuation=options['removePunctuation'],
+            remove_accents=options['removeAccents'],
+            stop_words=load_stop_words(options['language']),
+            punctuation_signs=list(options['punctuationSigns']),
+            stemmer_language=options['language'] if options['stemWords'] else None)
+
     def restart_process(self):
         """ Method that restart the subtitles analysis process."""
         self.active = False
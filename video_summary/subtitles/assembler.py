@@ -0,0 +1,139 @@
+"""The module for the assembly of the subtitles into sentences."""
+
+from video_summary.objects.subtitle import Subtitle
+
+# Signs which end a sentence
+TERMINAL_SIGNS = frozenset('¡!.¿?')
+
+
+class SentenceAssembler:
+    """
+    A class used to represent the assembly of successive subtitles into sentences.
+
+    The fragments of the current sentence are collected and joined once when the sentence
+    ends, and the times and the score are kept as running values, so the assembly is linear in
+    the size of the subtitles. A sentence ends with a terminal sign, or when it reaches the
+    maximum length or duration.
+
+    ...
+
+    Attributes
+    ----------
+    max_length : int
+        the maximum number of characters of a sentence (0 for no limit)
+    max_duration : int
+        the maximum duration in milliseconds of a sentence (0 for no limit)
+
+    Methods
+    -------
+    add(subtitle)
+        add a subtitle to the current sentence
+    assemble(subtitles_list)
+        assemble a subtitles list into sentences
+    """
+
+    def __init__(self, max_length=0, max_duration=0):
+        self.max_length = max_length
+        self.max_duration = max_duration
+        self.first = None
+        self.fragments = 0
+        self.texts = []
+        self.length = 0
+        self.start = None
+        self.end = None
+        self.score = None
+
+    def add(self, subtitle):
+        """
+        The method to add a subtitle to the current sentence.
+
+        Parameters
+        ----------
+        subtitle : Subtitle
+            the subtitle
+
+        Returns
+        -------
+        Subtitle
+            the sentence if it ends with this subtitle, or None
+        """
+
+        if self.first is None:
+            self.first = subtitle
+        self.fragments += 1
+        if subtitle.text is not None:
+            self.length += len(subtitle.text) + (1 if self.texts else 0)
+            self.texts.append(subtitle.text)
+        if subtitle.start is not None:
+            self.start = subtitle.start if self.start is None else min(self.start, subtitle.start)
+        if subtitle.end is not None:
+            self.end = subtitle.end if self.end is None else max(self.end, subtitle.end)
+        if subtitle.score is not None:
+            self.score = subtitle.score if self.score is None else self.score + subtitle.score
+
+        if self.texts and self.texts[-1][-1:] in TERMINAL_SIGNS or self.is_full():
+            return self.sentence()
+        return None
+
+    def is_full(self):
+        """
+        The method to check if the current sentence reaches the maximum length or duration.
+
+        Returns
+        -------
+        bool
+            True if the sentence reaches any limit
+        """
+
+        if 0 < self.max_length <= self.length:
+            return True
+        return 0 < self.max_duration and self.start is not None and self.end is not None and \
+            self.end - self.start >= self.max_duration
+
+    def sentence(self):
+        """
+        The method to end the current sentence.
+
+        Returns
+        -------
+        Subtitle
+            the sentence, which is its subtitle when it has only one
+        """
+
+        if self.fragments == 1:
+            result = self.first
+        else:
+            result = Subtitle(' '.join(self.texts) if self.texts else None, self.start,
+                              self.end, self.score)
+        self.first = None
+        self.fragments = 0
+        self.texts = []
+        self.length = 0
+        self.start = None
+        self.end = None
+        self.score = None
+        return result
+
+    def assemble(self, subtitles_list):
+        """
+        The method to assemble a subtitles list into sentences.
+
+        Parameters
+        ----------
+        subtitles_list : list
+            a subtitles list
+
+        Returns
+        -------
+        list
+            a new subtitles list with the successive subtitles joined, without the last
+            fragments which do not end a sentence
+        """
+
+        result = []
+        for subtitle in subtitles_list:
+            if subtitle is not None:
+                sentence = self.add(subtitle)
+                if sentence is not None:
+                    result.append(sentence)
+        return result
@@ -0,0 +1,189 @@
+"""The module for the analysis of a batch of subtitles files."""
+
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from video_summary.processes.subtitles_analysis_process import SubtitlesAnalysis
+from video_summary.subtitles.scoring import PhraseScorer
+from video_summary.subtitles.stemmer import get_stemmer
+from video_summary.subtitles.stop_words import load_stop_words
+
+# Logger
+LOGGER_NAME = 'App.Subtitles.Batch'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Extension of the result files
+EXTENSION = '.npz'
+
+# Read only resources of the worker processes
+WORKER_RESOURCES = {'options': None, 'corpus': None}
+
+
+def score_subtitles(path, options, corpus=None):
+    """
+    Method to analyse the subtitles of a file.
+
+    ...
+
+    Parameters
+    ----------
+    path : str
+        the subtitles' path
+    options : dict
+        the analysis options
+    corpus : CorpusModel
+        the corpus model whose statistics weight the IDF vectoring types (None to weight the
+        phrases with the statistics of the subtitles)
+
+    Returns
+    -------
+    SubtitleTable
+        the table of the joined and cleaned subtitles with their scores (NaN for the
+        repetitions)
+
+    """
+
+    subtitles_list = SubtitlesAnalysis.read_phrases(path, options)
+    subtitles_list.scores = PhraseScorer(subtitles_list, options['duplicateThreshold']).score(
+        options, corpus)
+    return subtitles_list
+
+
+def start_worker(options, corpus=None):
+    """
+    Method to keep the read only resources of a worker process.
+
+    The stop words and the stemmer are loaded here, so the workers forked after the first call
+    share them with the main process, and the others load them once.
+
+    ...
+
+    Parameters
+    ----------
+    options : dict
+        the analysis options
+    corpus : CorpusModel
+        the corpus model (None to weight the phrases with the statistics of every file)
+
+    """
+
+    WORKER_RESOURCES['options'] = options
+    WORKER_RESOURCES['corpus'] = corpus
+    if options['removeStopWords']:
+        load_stop_words(options['language'])
+    if options['stemWords']:
+        get_stemmer(options['language'])
+
+
+def analyse_file(path, output):
+    """
+    Method to analyse the subtitles of a file with the resources of the worker process.
+
+    ...
+
+    Parameters
+    ----------
+    path : str
+        the subtitles' path
+    output : str
+        the path of the result file
+
+    Returns
+    -------
+    dict
+        a dict with the paths, the number of phrases, the seconds and the error (None if the
+        file was analysed) of the file, because any error of the file is reported instead of
+        raised
+
+    """
+
+    start = time.perf_counter()
+    result = {'path': path, 'output': output, 'phrases': 0, 'seconds': 0.0, 'error': None}
+    try:
+        subtitles_list = score_subtitles(path, WORKER_RESOURCES['options'],
+                                         WORKER_RESOURCES['corpus'])
+        subtitles_list.save(output)
+        result['phrases'] = len(subtitles_list)
+    except Exception as error:  # a failed file must not stop the rest of the batch
+        LOG.error('%s not analysed: %s', path, error)
+        result['output'] = None
+        result['error'] = str(error)
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def output_paths(paths, output_dir):
+    """
+    Method to get the path of the result file of every subtitles file.
+
+    ...
+
+    Parameters
+    ----------
+    paths : list
+        a list with the subtitles' paths
+    output_dir : str
+        the directory of the result files
+
+    Returns
+    -------
+    list
+        a list with the result path of every subtitles file, named after it (with a number
+        when several files have the same name)
+
+    """
+
+    outputs = []
+    used = set()
+    for path in paths:
+        name = os.path.splitext(os.path.basename(path))[0]
+        unique_name = name
+        number = 1
+        while unique_name in used:
+            unique_name = '{}-{}'.format(name, number)
+            number += 1
+        used.add(unique_name)
+        outputs.append(os.path.join(output_dir, unique_name + EXTENSION))
+    return outputs
+
+
+def analyse_batch(paths, output_dir, options, corpus=None, workers=0):
+    """
+    Method to analyse a batch of subtitles files in a pool of processes.
+
+    ...
+
+    Parameters
+    ----------
+    paths : list
+        a list with the subtitles' paths
+    output_dir : str
+        the directory of the result files, with the table of every subtitles file
+    options : dict
+        the analysis options
+    corpus : CorpusModel
+        the corpus model (None to weight the phrases with the statistics of every file)
+    workers : int
+        the number of processes (0 for the number of CPUs, 1 to analyse in this process)
+
+    Returns
+    -------
+    dict
+        a dict with the result of every file, the number of processes and the total seconds
+
+    """
+
+    start = time.perf_counter()
+    os.makedirs(output_dir, exist_ok=True)
+    outputs = output_paths(paths, output_dir)
+    workers = min(workers or os.cpu_count() or 1, max(1, len(paths)))
+    start_worker(options, corpus)
+    if workers == 1:
+        results = [analyse_file(path, output) for path, output in zip(paths, outputs)]
+    else:
+        with ProcessPoolExecutor(workers, initializer=start_worker,
+                                 initargs=(options, corpus)) as executor:
+            results = list(executor.map(analyse_file, paths, outputs))
+    return {'files': results, 'workers': workers, 'seconds': time.perf_counter() - start}
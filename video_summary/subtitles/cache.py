@@ -0,0 +1,373 @@
+"""The module for the content-addressed cache of the subtitles analysis results."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import zipfile
+
+from video_summary.objects.subtitle_table import as_table, load
+from video_summary.subtitles.embedded import is_container
+
+# Logger
+LOGGER_NAME = 'App.Subtitles.Cache'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Paths
+ROOT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        'context', 'cache')
+
+# Files
+CHUNK_SIZE = 1 << 20
+TAIL_SIZE = 4096
+EXTENSION = '.npz'
+
+
+def file_hash(path, size=None):
+    """
+    Method to get the SHA-256 of the content of a file.
+
+    ...
+
+    Parameters
+    ----------
+    path : str
+        the file's path
+    size : int
+        the number of bytes to hash from the beginning (None to hash the whole file)
+
+    Returns
+    -------
+    str
+        the hexadecimal digest of the content
+
+    """
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        hashed = 0
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b''):
+            if size is not None:
+                chunk = chunk[:size - hashed]
+                if not chunk:
+                    break
+            digest.update(chunk)
+            hashed += len(chunk)
+    return digest.hexdigest()
+
+
+def content_digest(path):
+    """
+    Method to get the digest which identifies the subtitles of a file.
+
+    The subtitles files are hashed, but the video containers, which may take gigabytes, are
+    identified by their path, size and modification time instead. The subtitles stream of a
+    container is selected by the analysis options, which are part of every key.
+
+    ...
+
+    Parameters
+    ----------
+    path : str
+        the path of the subtitles file or the video container
+
+    Returns
+    -------
+    str
+        the hexadecimal digest
+
+    """
+
+    if not is_container(path):
+        return file_hash(path)
+    stat = os.stat(path)
+    return hashlib.sha256(json.dumps([os.path.abspath(path), stat.st_size, stat.st_mtime_ns])
+                          .encode('utf-8')).hexdigest()
+
+
+def file_tail(path, size):
+    """
+    Method to get the last bytes of the beginning of a file.
+
+    ...
+
+    Parameters
+    ----------
+    path : str
+        the file's path
+    size : int
+        the number of bytes of the beginning
+
+    Returns
+    -------
+    bytes
+        the last TAIL_SIZE bytes (or less) before the size
+
+    """
+
+    start = max(size - TAIL_SIZE, 0)
+    with open(path, 'rb') as file:
+        file.seek(start)
+        return file.read(size - start)
+
+
+def is_grown(path, size, tail):
+    """
+    Method to check if a file only grew since it had a size and some last bytes.
+
+    Only the last bytes of the former content are compared, so a file which is only appended to
+    is checked without reading it again.
+
+    ...
+
+    Parameters
+    ----------
+    path : str
+        the file's path
+    size : int
+        the former size of the file
+    tail : bytes
+        the former last bytes of the file, like file_tail
+
+    Returns
+    -------
+    bool
+        True if the file is not smaller and keeps the last bytes at the same place
+
+    """
+
+    return os.path.getsize(path) >= size and file_tail(path, size) == tail
+
+
+def results_key(content_hash, options):
+    """
+    Method to get the key of the results of a content with some options.
+
+    ...
+
+    Parameters
+    ----------
+    content_hash : str
+        the hexadecimal digest of the subtitles file
+    options : dict
+        a JSON serializable dict with every option which changes the results
+
+    Returns
+    -------
+    str
+        the hexadecimal key
+
+    """
+
+    return hashlib.sha256(json.dumps([content_hash, options], sort_keys=True).encode(
+        'utf-8')).hexdigest()
+
+
+class FileDigest:
+    """
+    A class used to represent the running SHA-256 of a file which may grow.
+
+    The hash state is kept, so when the file only grew since the last digest, only its new
+    bytes are hashed. The digest is the same as file_hash.
+
+    ...
+
+    Attributes
+    ----------
+    path : str
+        the hashed file's path
+    size : int
+        the number of hashed bytes
+    tail : bytes
+        the last hashed bytes, like file_tail
+    digest : hash
+        the SHA-256 state of the hashed bytes
+
+    Methods
+    -------
+    hexdigest(path)
+        get the SHA-256 of the content of a file
+    """
+
+    def __init__(self):
+        self.path = None
+        self.size = 0
+        self.tail = b''
+        self.digest = hashlib.sha256()
+
+    def hexdigest(self, path):
+        """
+        The method to get the SHA-256 of the content of a file.
+
+        Parameters
+        ----------
+        path : str
+            the file's path
+
+        Returns
+        -------
+        str
+            the hexadecimal digest of the content
+        """
+
+        if path != self.path or not is_grown(path, self.size, self.tail):
+            LOG.debug('hashing %s from the beginning', path)
+            self.path = path
+            self.size = 0
+            self.tail = b''
+            self.digest = hashlib.sha256()
+        with open(path, 'rb') as file:
+            file.seek(self.size)
+            for chunk in iter(lambda: file.read(CHUNK_SIZE), b''):
+                self.digest.update(chunk)
+                self.size += len(chunk)
+                self.tail = (self.tail + chunk[-TAIL_SIZE:])[-TAIL_SIZE:]
+        return self.digest.hexdigest()
+
+
+class ResultsCache:
+    """
+    A class used to represent the cache of the subtitles analysis results on disk.
+
+    Every result is a file named by its key, so the same subtitles with the same options are
+    found again between runs. The files are touched on every hit, and the least recently used
+    ones are removed while the cache is above its maximum size.
+
+    ...
+
+    Attributes
+    ----------
+    directory : str
+        the cache's directory
+    max_size : int
+        the maximum size of the cache in bytes
+    hits : int
+        the number of found results
+    misses : int
+        the number of missing results
+
+    Methods
+    -------
+    get(key)
+        get the subtitles list of a key
+    put(key, subtitles_list)
+        save the subtitles list of a key
+    size()
+        get the size of the cache in bytes
+    evict()
+        remove the least recently used results above the maximum size
+    """
+
+    def __init__(self, max_size, directory=ROOT_DIR):
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def path_of(self, key):
+        """
+        The method to get the path of the file of a key.
+
+        Parameters
+        ----------
+        key : str
+            the hexadecimal key
+
+        Returns
+        -------
+        str
+            the file's path
+        """
+
+        return os.path.join(self.directory, key + EXTENSION)
+
+    def get(self, key):
+        """
+        The method to get the subtitles list of a key.
+
+        Parameters
+        ----------
+        key : str
+            the hexadecimal key
+
+        Returns
+        -------
+        SubtitleTable
+            the cached subtitles table, or None if it is not cached
+        """
+
+        path = self.path_of(key)
+        try:
+            subtitles_list = load(path)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            self.misses += 1
+            LOG.debug('subtitles results %s not cached', key)
+            return None
+        os.utime(path)
+        self.hits += 1
+        LOG.info('subtitles results %s found in cache (%d hits, %d misses)', key, self.hits,
+                 self.misses)
+        return subtitles_list
+
+    def put(self, key, subtitles_list):
+        """
+        The method to save the subtitles list of a key.
+
+        Parameters
+        ----------
+        key : str
+            the hexadecimal key
+        subtitles_list : SubtitleTable
+            the subtitles table, or a subtitles list
+        """
+
+        os.makedirs(self.directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=self.directory, suffix='.tmp',
+                                         delete=False) as table_file:
+            as_table(subtitles_list).write(table_file)
+        os.replace(table_file.name, self.path_of(key))
+        LOG.debug('subtitles results %s cached', key)
+        self.evict()
+
+    def entries(self):
+        """
+        The method to get the cached results from the least to the most recently used.
+
+        Returns
+        -------
+        list
+            a list with the (last use, size, path) of every cached result
+        """
+
+        if not os.path.isdir(self.directory):
+            return []
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(EXTENSION):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        return sorted(entries)
+
+    def size(self):
+        """
+        The method to get the size of the cache in bytes.
+
+        Returns
+        -------
+        int
+            the size of the cached results
+        """
+
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        """ The method to remove the least recently used results above the maximum size."""
+        entries = self.entries()
+        size = sum(size for _, size, _ in entries)
+        for _, entry_size, path in entries:
+            if size <= self.max_size:
+                break
+            os.remove(path)
+            size -= entry_size
+            LOG.debug('subtitles results %s evicted from cache', path)
@@ -0,0 +1,159 @@
+"""The module for the corpus model of the subtitles of a series."""
+
+import json
+
+import numpy as np
+
+from video_summary.subtitles.incremental import TermCounter
+from video_summary.subtitles.term_counts import WEIGHTINGS, weight
+
+# Keys of the binary file
+CORPUS_TERMS = 'terms'
+CORPUS_FREQUENCIES = 'frequencies'
+CORPUS_PHRASES = 'phrases'
+CORPUS_FEATURES = 'features'
+CORPUS_EPISODES = 'episodes'
+CORPUS_OPTIONS = 'options'
+
+# Vectoring types weighted with the corpus statistics (the others only use the phrase counts)
+CORPUS_TYPES = frozenset(vectoring_type for vectoring_type, (use_idf, _, _)
+                         in WEIGHTINGS.items() if use_idf)
+
+
+class CorpusModel:
+    """
+    A class used to represent the vocabulary and the document frequencies of a series.
+
+    The phrases of every episode are counted once, so the inverse document frequencies come
+    from all the episodes of the series, and the later analyses transform their phrases with
+    the known vocabulary instead of building their own. Only the IDF vectoring types
+    (CORPUS_TYPES) use the model, and it counts the words.
+
+    ...
+
+    Attributes
+    ----------
+    counter : TermCounter
+        the running term counts of the phrases of all the episodes
+    episodes : set
+        a set with the digest of the subtitles file of every counted episode
+    options : dict
+        the cleaning options of the counted phrases
+
+    Methods
+    -------
+    add(content_hash, phrases)
+        count the phrases of a new episode
+    transform(phrases, vectoring_type)
+        get the phrase x term matrix of a vectoring type with the corpus statistics
+    save(path)
+        write the model in a binary file
+    """
+
+    def __init__(self, features=0, options=None):
+        self.counter = TermCounter(features)
+        self.episodes = set()
+        self.options = options or {}
+
+    def __len__(self):
+        return len(self.episodes)
+
+    @property
+    def features(self):
+        """ The number of hashed features (0 with a vocabulary)."""
+        return self.counter.features
+
+    @property
+    def documents(self):
+        """ The number of counted phrases."""
+        return self.counter.phrases
+
+    def add(self, content_hash, phrases):
+        """
+        The method to count the phrases of a new episode.
+
+        Parameters
+        ----------
+        content_hash : str
+            the digest of the subtitles file of the episode
+        phrases : list
+            a list of strings with the cleaned phrases of the episode
+
+        Returns
+        -------
+        bool
+            True if the episode was new, False if it was already counted
+        """
+
+        if content_hash in self.episodes:
+            return False
+        self.counter.count(phrases)
+        self.episodes.add(content_hash)
+        return True
+
+    def transform(self, phrases, vectoring_type):
+        """
+        The method to get the phrase x term matrix of a vectoring type with the corpus
+        statistics.
+
+        Parameters
+        ----------
+        phrases : list
+            a list of strings with the cleaned phrases
+        vectoring_type : int
+            the vectoring type (class VectoringType)
+
+        Returns
+        -------
+        csr_matrix
+            a sparse matrix (phrases x corpus terms) with the weights, without the terms
+            unknown to the corpus
+        """
+
+        counts = self.counter.count(phrases, update=False)
+        return weight(counts, vectoring_type, self.counter.frequencies, self.counter.phrases)
+
+    def save(self, path):
+        """
+        The method to write the model in a binary file.
+
+        Parameters
+        ----------
+        path : str
+            the path of the binary file
+        """
+
+        terms = sorted(self.counter.vocabulary, key=self.counter.vocabulary.get)
+        with open(path, 'wb') as file:
+            np.savez_compressed(file, **{
+                CORPUS_TERMS: np.array(terms, dtype=str),
+                CORPUS_FREQUENCIES: self.counter.frequencies,
+                CORPUS_PHRASES: np.int64(self.counter.phrases),
+                CORPUS_FEATURES: np.int64(self.counter.features),
+                CORPUS_EPISODES: np.array(sorted(self.episodes), dtype=str),
+                CORPUS_OPTIONS: np.array(json.dumps(self.options, sort_keys=True))})
+
+
+def load(path):
+    """
+    The method to read a corpus model from a binary file.
+
+    Parameters
+    ----------
+    path : str
+        the path of the binary file
+
+    Returns
+    -------
+    CorpusModel
+        the model with the file data
+    """
+
+    with np.load(path) as data:
+        corpus = CorpusModel(int(data[CORPUS_FEATURES]), json.loads(str(data[CORPUS_OPTIONS])))
+        corpus.counter.vocabulary = {term: column
+                                     for column, term in enumerate(data[CORPUS_TERMS].tolist())}
+        corpus.counter.frequencies = data[CORPUS_FREQUENCIES].astype(np.int64)
+        corpus.counter.phrases = int(data[CORPUS_PHRASES])
+        corpus.episodes = set(data[CORPUS_EPISODES].tolist())
+    return corpus
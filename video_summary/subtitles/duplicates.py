@@ -0,0 +1,161 @@
+"""The module for the detection of the repeated subtitles."""
+
+import numpy as np
+
+# MinHash
+PERMUTATIONS = 64
+BANDS = 16
+SHINGLE_SIZE = 5
+SEED = 0
+SHIFT = np.uint64(32)
+
+
+def shingle_hashes(texts):
+    """
+    Method to get the hashes of the character shingles of every text.
+
+    ...
+
+    Parameters
+    ----------
+    texts : list
+        a list of strings with the normalized texts
+
+    Returns
+    -------
+    array
+        a uint64 numpy array with the polynomial hash of every shingle of every text, text
+        after text (the texts shorter than a shingle are padded)
+    array
+        an int numpy array with the position of the first shingle of every text
+
+    """
+
+    encoded = [text.encode('utf-8').ljust(SHINGLE_SIZE, b'\0') for text in texts]
+    counts = np.array([len(text) - SHINGLE_SIZE + 1 for text in encoded], dtype=np.int64)
+    buffer = np.frombuffer(b''.join(encoded), dtype=np.uint8).astype(np.uint64)
+
+    windows = len(buffer) - SHINGLE_SIZE + 1
+    hashes = np.zeros(max(0, windows), dtype=np.uint64)
+    for offset in range(SHINGLE_SIZE):
+        hashes = hashes * np.uint64(257) + buffer[offset:offset + windows]
+
+    offsets = np.zeros(len(counts), dtype=np.int64)
+    np.cumsum(counts[:-1], out=offsets[1:])
+    gaps = np.repeat(np.arange(len(counts)) * (SHINGLE_SIZE - 1), counts)
+    return hashes[np.arange(counts.sum()) + gaps], offsets
+
+
+def min_hashes(texts):
+    """
+    Method to get the MinHash signature of every text.
+
+    The permutations are multiply-shift hashes of the shingle hashes, which keep the high bits
+    of a random odd multiplier times the hash, so they need no modulo.
+
+    ...
+
+    Parameters
+    ----------
+    texts : list
+        a list of strings with the normalized texts
+
+    Returns
+    -------
+    array
+        a uint64 numpy matrix (texts x PERMUTATIONS) with the minimum 32 bits hash of every
+        permutation
+
+    """
+
+    generator = np.random.default_rng(SEED)
+    multipliers = generator.integers(0, 1 << 63, PERMUTATIONS, dtype=np.uint64) * 2 + 1
+    increments = generator.integers(0, 1 << 63, PERMUTATIONS, dtype=np.uint64)
+
+    signatures = np.empty((len(texts), PERMUTATIONS), dtype=np.uint64)
+    if texts:
+        hashes, offsets = shingle_hashes(texts)
+        for permutation in range(PERMUTATIONS):
+            values = (multipliers[permutation] * hashes + increments[permutation]) >> SHIFT
+            signatures[:, permutation] = np.minimum.reduceat(values, offsets)
+    return signatures
+
+
+def find_root(parents, index):
+    """
+    Method to get the root of the group of an index, compressing the path.
+
+    ...
+
+    Parameters
+    ----------
+    parents : list
+        a list with the parent of every index
+    index : int
+        the index
+
+    Returns
+    -------
+    int
+        the root of the group
+
+    """
+
+    root = index
+    while parents[root] != root:
+        root = parents[root]
+    while parents[index] != root:
+        parents[index], index = root, parents[index]
+    return root
+
+
+def representatives(texts, threshold=1.0):
+    """
+    Method to get the representative of every text among its repetitions.
+
+    The exact repetitions are found by the normalized text. With a threshold below 1, the
+    remaining texts are grouped by the bands of their MinHash signatures, and the candidates of
+    every band whose estimated Jaccard similarity reaches the threshold are joined.
+
+    ...
+
+    Parameters
+    ----------
+    texts : list
+        a list with the texts, which may be None
+    threshold : float
+        the minimum Jaccard similarity of the character shingles of two repetitions (0 - 1)
+
+    Returns
+    -------
+    array
+        an int numpy array with the index of the first text of the group of every text
+
+    """
+
+    keys = [' '.join((text or '').lower().split()) for text in texts]
+    first = {}
+    result = np.array([first.setdefault(key, index) for index, key in enumerate(keys)],
+                      dtype=np.int64)
+    if threshold >= 1 or not len(first):
+        return result
+
+    unique = np.array(sorted(first.values()), dtype=np.int64)
+    signatures = min_hashes([keys[index] for index in unique.tolist()])
+    parents = list(range(len(unique)))
+    rows = PERMUTATIONS // BANDS
+    for band in range(BANDS):
+        band_signatures = np.ascontiguousarray(signatures[:, band * rows:(band + 1) * rows])
+        _, bucket_firsts, buckets = np.unique(
+            band_signatures.view(np.dtype((np.void, rows * 8))).ravel(), return_index=True,
+            return_inverse=True)
+        members = np.flatnonzero(bucket_firsts[buckets] != np.arange(len(buckets)))
+        candidates = bucket_firsts[buckets[members]]
+        similar = np.mean(signatures[members] == signatures[candidates], axis=1) >= threshold
+        for member, candidate in zip(members[similar].tolist(), candidates[similar].tolist()):
+            member_root = find_root(parents, member)
+            candidate_root = find_root(parents, candidate)
+            parents[max(member_root, candidate_root)] = min(member_root, candidate_root)
+
+    roots = unique[[find_root(parents, position) for position in range(len(unique))]]
+    return roots[np.searchsorted(unique, result)]
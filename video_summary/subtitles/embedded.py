@@ -0,0 +1,174 @@
+"""The module for the text subtitles streams embedded in the video containers."""
+
+import io
+import json
+import logging
+import os
+import subprocess
+import tempfile
+
+from video_summary.subtitles.parser import cue_arrays, parse_lines
+
+# Logger
+LOGGER_NAME = 'App.Subtitles.Embedded'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Files
+SUBTITLES_EXTENSIONS = ('.srt', '.vtt')
+CONTAINER_EXTENSIONS = ('.mkv', '.mp4', '.m4v', '.mov', '.webm')
+
+# Codecs of the text subtitles streams, which ffmpeg converts to SRT
+TEXT_CODECS = ('mov_text', 'subrip', 'srt', 'ass', 'ssa', 'webvtt', 'text')
+
+
+def is_container(path):
+    """
+    Method to check if a path is a video container instead of a subtitles file.
+
+    ...
+
+    Parameters
+    ----------
+    path : str
+        the path
+
+    Returns
+    -------
+    bool
+        True if the path has the extension of a video container
+
+    """
+
+    return os.path.splitext(path)[1].lower() in CONTAINER_EXTENSIONS
+
+
+def probe_streams(path):
+    """
+    Method to get the subtitles streams of a video container with ffprobe.
+
+    ...
+
+    Parameters
+    ----------
+    path : str
+        the video container's path
+
+    Returns
+    -------
+    list
+        a list with a dict with the index, the codec and the language tag (None if it is not
+        tagged) of every subtitles stream
+
+    """
+
+    command = ['ffprobe', '-v', 'error', '-select_streams', 's',
+               '-show_entries', 'stream=index,codec_name:stream_tags=language',
+               '-of', 'json', path]
+    proc = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if proc.returncode:
+        raise OSError('ffprobe failed with {}: {}'.format(
+            path, proc.stderr.decode('utf-8', 'replace').strip()))
+    return [{'index': stream['index'], 'codec': stream.get('codec_name'),
+             'language': stream.get('tags', {}).get('language')}
+            for stream in json.loads(proc.stdout.decode('utf-8')).get('streams', [])]
+
+
+def select_stream(streams, language=None):
+    """
+    Method to select the text subtitles stream of a language.
+
+    ...
+
+    Parameters
+    ----------
+    streams : list
+        a list with the subtitles streams, like probe_streams
+    language : str
+        the language tag of the stream, like "eng" (None for the first text stream)
+
+    Returns
+    -------
+    dict
+        the first text stream with the language tag, or the first text stream if no stream has
+        it, or None if there is no text stream
+
+    """
+
+    text_streams = [stream for stream in streams if stream['codec'] in TEXT_CODECS]
+    if language:
+        for stream in text_streams:
+            if (stream['language'] or '').lower() == language.lower():
+                return stream
+        LOG.warning('no text subtitles stream with the language %s', language)
+    return text_streams[0] if text_streams else None
+
+
+def iter_stream_cues(path, index):
+    """
+    Method to read the cues of a subtitles stream, converted by ffmpeg while it is parsed.
+
+    ...
+
+    Parameters
+    ----------
+    path : str
+        the video container's path
+    index : int
+        the index of the stream in the container
+
+    Yields
+    ------
+    tuple
+        the (start, end, text) of every cue, like parser.iter_cues
+
+    """
+
+    command = ['ffmpeg', '-nostdin', '-v', 'error', '-i', path,
+               '-map', '0:{}'.format(index), '-f', 'srt', 'pipe:1']
+    LOG.debug('starting subprocess')
+    with tempfile.TemporaryFile() as errors:  # a pipe could fill up before the end of stdout
+        proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=errors)
+        try:
+            yield from parse_lines(io.TextIOWrapper(proc.stdout, encoding='utf-8',
+                                                    errors='replace'))
+            if proc.wait():
+                errors.seek(0)
+                raise OSError('ffmpeg failed with {}: {}'.format(
+                    path, errors.read().decode('utf-8', 'replace').strip()))
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+    LOG.debug('subprocess finished')
+
+
+def read_stream_cues(path, language=None):
+    """
+    Method to read the cues of the text subtitles stream of a video container into arrays.
+
+    ...
+
+    Parameters
+    ----------
+    path : str
+        the video container's path
+    language : str
+        the language tag of the stream, like "eng" (None for the first text stream)
+
+    Returns
+    -------
+    array
+        an int64 numpy array with the start of every cue in milliseconds
+    array
+        an int64 numpy array with the end of every cue in milliseconds
+    list
+        a list of strings with the text of every cue
+
+    """
+
+    stream = select_stream(probe_streams(path), language)
+    if stream is None:
+        raise ValueError('{} has no text subtitles stream'.format(path))
+    LOG.info('reading the %s subtitles stream %d of %s', stream['codec'], stream['index'], path)
+    return cue_arrays(iter_stream_cues(path, stream['index']))
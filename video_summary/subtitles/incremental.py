@@ -0,0 +1,199 @@
+"""The module for the incremental analysis of growing subtitles."""
+
+from array import array
+
+import numpy as np
+from scipy import sparse
+
+from video_summary.context.subtitles_context import VectoringType
+from video_summary.subtitles.lsa import concepts_number, orient_concepts, rank_phrases, \
+    svd_factors, update_svd
+from video_summary.subtitles.term_counts import hash_terms, ngrams, weight
+from video_summary.subtitles.vectorizers import tokenize
+
+# Maximum number of phrases of every SVD update
+UPDATE_ROWS = 64
+
+# Maximum number of concepts derived from the resume percentage
+MAX_CONCEPTS = 100
+
+
+class TermCounter:
+    """
+    A class used to represent the running term counts of the phrases.
+
+    The vocabulary only grows, and the new terms take the next columns, so the counts of the
+    old phrases keep their columns and are not counted again.
+
+    ...
+
+    Attributes
+    ----------
+    features : int
+        the number of hashed features (0 to build a vocabulary)
+    ngram : bool
+        a boolean to count the n-grams instead of the words
+    vocabulary : dict
+        a dict with the column of every term
+    frequencies : array
+        an int numpy array with the number of phrases with every term
+    phrases : int
+        the number of counted phrases
+
+    Methods
+    -------
+    count(phrases, update)
+        count the terms of new phrases
+    """
+
+    def __init__(self, features=0, ngram=False):
+        self.features = features
+        self.ngram = ngram
+        self.vocabulary = {}
+        self.frequencies = np.zeros(features, dtype=np.int64)
+        self.phrases = 0
+
+    def count(self, phrases, update=True):
+        """
+        The method to count the terms of new phrases.
+
+        Parameters
+        ----------
+        phrases : list
+            a list of strings with the new phrases
+        update : bool
+            a boolean to add the phrases to the vocabulary and the frequencies (without it,
+            the unknown terms are not counted)
+
+        Returns
+        -------
+        csr_matrix
+            a sparse int64 matrix (new phrases x all the terms) with the counts
+        """
+
+        documents = [tokenize(phrase.lower()) for phrase in phrases]
+        if self.ngram:
+            documents = [ngrams(tokens) for tokens in documents]
+
+        if self.features:
+            counts = hash_terms(documents, self.features)
+        else:
+            vocabulary = self.vocabulary
+            columns = array('q')
+            pointers = array('q', [0])
+            for terms in documents:
+                if update:
+                    columns.extend([vocabulary.setdefault(term, len(vocabulary))
+                                    for term in terms])
+                else:
+                    columns.extend([vocabulary[term] for term in terms if term in vocabulary])
+                pointers.append(len(columns))
+            counts = sparse.csr_matrix((np.ones(len(columns), dtype=np.int64),
+                                        np.array(columns, dtype=np.int64),
+                                        np.array(pointers, dtype=np.int64)),
+                                       shape=(len(documents), len(vocabulary)))
+            counts.sum_duplicates()
+
+        if update:
+            frequencies = np.bincount(counts.indices, minlength=counts.shape[1])
+            frequencies[:len(self.frequencies)] += self.frequencies
+            self.frequencies = frequencies
+            self.phrases += len(documents)
+        return counts
+
+
+class IncrementalLsa:
+    """
+    A class used to represent the latent semantic analysis of growing subtitles.
+
+    The first phrases are decomposed with the truncated SVD, and the next ones update the
+    decomposition with the rank-k update of Brand, so the cost of every update grows with the
+    new phrases instead of with the whole transcript. For that, the number of concepts derived
+    from the resume percentage is capped at MAX_CONCEPTS (a configured number of concepts is
+    kept). The weights of every phrase are fixed when it is appended, so the IDF vectoring
+    types use the document frequencies of that moment.
+
+    ...
+
+    Attributes
+    ----------
+    vectoring_type : int
+        the vectoring type (class VectoringType)
+    resume_percentage : float
+        the resume percentage of the phrases (0 - 100)
+    concepts : int
+        the configured number of concepts (0 to derive it from the resume percentage)
+    phrases_per_concept : int
+        the number of best phrases selected from every concept
+    counter : TermCounter
+        the running term counts of the phrases
+    u : array
+        a numpy matrix (phrases x concepts) with the left singular vectors
+    singular_values : array
+        a numpy array with the singular values in decreasing order
+    w : array
+        a numpy matrix (terms x concepts) with the right singular vectors, which is dense, so
+        it takes 8 bytes per term and concept (with hashed features, every feature is a term)
+
+    Methods
+    -------
+    append(phrases)
+        add new phrases to the analysis
+    scores()
+        get the score of every phrase
+    """
+
+    def __init__(self, vectoring_type, resume_percentage=100, concepts=0, phrases_per_concept=1,
+                 features=0):
+        self.vectoring_type = vectoring_type
+        self.resume_percentage = resume_percentage
+        self.concepts = concepts
+        self.phrases_per_concept = phrases_per_concept
+        self.counter = TermCounter(features,
+                                   VectoringType(vectoring_type) == VectoringType.N_GRAM_COUNTERS)
+        self.u = np.zeros((0, 0))
+        self.singular_values = np.zeros(0)
+        self.w = np.zeros((features, 0))
+
+    def __len__(self):
+        return len(self.u)
+
+    def append(self, phrases):
+        """
+        The method to add new phrases to the analysis.
+
+        Parameters
+        ----------
+        phrases : list
+            a list of strings with the new phrases
+        """
+
+        if not phrases:
+            return
+        rows = weight(self.counter.count(phrases), self.vectoring_type,
+                      self.counter.frequencies, self.counter.phrases).astype(np.float64)
+        concepts = concepts_number(self.counter.phrases, self.resume_percentage, self.concepts)
+        if not self.concepts:
+            concepts = min(concepts, MAX_CONCEPTS)
+        if not len(self):
+            self.u, self.singular_values, self.w = svd_factors(rows, concepts)
+            return
+        for start in range(0, rows.shape[0], UPDATE_ROWS):
+            self.u, self.singular_values, self.w = update_svd(
+                self.u, self.singular_values, self.w, rows[start:start + UPDATE_ROWS], concepts)
+
+    def scores(self):
+        """
+        The method to get the score of every phrase.
+
+        Returns
+        -------
+        array
+            a float numpy array with the score of every phrase, like rank_phrases (empty
+            until a phrase is appended)
+        """
+
+        if not len(self):
+            return np.zeros(0)
+        return rank_phrases(orient_concepts(self.u.T.copy()), self.singular_values,
+                            self.phrases_per_concept)
@@ -0,0 +1,322 @@
+"""Module with the latent semantic analysis of the subtitles."""
+
+import math
+
+import numpy as np
+from scipy.sparse.linalg import svds
+from sklearn.utils.extmath import randomized_svd
+
+# Maximum fraction of the smallest dimension computed with ARPACK (the randomized SVD is
+# faster above it)
+SVDS_MAX_FRACTION = 0.05
+
+# Power iterations of the randomized SVD
+RANDOMIZED_ITERATIONS = 4
+
+# Smallest squared singular value of the Gram decompositions, relative to the squared norm of
+# the decomposed matrix
+GRAM_TOLERANCE = 1e-12
+
+
+def concepts_number(phrases, resume_percentage, concepts=0):
+    """
+    Method to get the number of concepts of the analysis.
+
+    ...
+
+    Parameters
+    ----------
+    phrases : int
+        the number of phrases
+    resume_percentage : float
+        the resume percentage of the phrases (0 - 100)
+    concepts : int
+        the configured number of concepts (0 to derive it from the resume percentage)
+
+    Returns
+    -------
+    int
+        the number of concepts
+
+    """
+
+    if not concepts:
+        concepts = math.ceil(phrases * (resume_percentage or 100) / 100)
+    return max(1, concepts)
+
+
+def truncated_svd(matrix, concepts):
+    """
+    Method to get the top singular vectors of the sparse phrase x term matrix.
+
+    ...
+
+    Parameters
+    ----------
+    matrix : sparse matrix
+        the phrase x term matrix
+    concepts : int
+        the number of concepts to compute
+
+    Returns
+    -------
+    array
+        a numpy matrix (concepts x phrases) with the weight of every phrase in every concept
+    array
+        a numpy array with the singular value of every concept
+
+    """
+
+    u, s, _ = svd_factors(matrix, concepts)
+    return orient_concepts(u.T), s
+
+
+def svd_factors(matrix, concepts):
+    """
+    Method to get the truncated SVD factors of the sparse phrase x term matrix.
+
+    A few concepts are computed with ARPACK, the rest with a seeded randomized SVD, because
+    ARPACK is slower than the dense SVD when it computes many concepts, and the full
+    decomposition with the Gram matrix of the smallest side, so the matrix is never dense.
+
+    ...
+
+    Parameters
+    ----------
+    matrix : sparse matrix
+        the phrase x term matrix
+    concepts : int
+        the number of concepts to compute
+
+    Returns
+    -------
+    array
+        a numpy matrix (phrases x concepts) with the left singular vectors
+    array
+        a numpy array with the singular values in decreasing order
+    array
+        a numpy matrix (terms x concepts) with the right singular vectors
+
+    """
+
+    num_rows, num_columns = matrix.shape
+    concepts = min(concepts, num_rows, num_columns)
+    if concepts <= 0 or matrix.nnz == 0:
+        return np.zeros((num_rows, 0)), np.zeros(0), np.zeros((num_columns, 0))
+
+    if concepts <= SVDS_MAX_FRACTION * min(num_rows, num_columns):
+        start = np.ones(min(num_rows, num_columns))  # deterministic ARPACK start vector
+        u, s, wt = svds(matrix.astype(np.float64), k=concepts, v0=start)
+    elif concepts < min(num_rows, num_columns):
+        u, s, wt = randomized_svd(matrix.astype(np.float64), concepts,
+                                  n_iter=RANDOMIZED_ITERATIONS, random_state=0)
+    else:
+        u, s, wt = gram_svd(matrix.astype(np.float64))
+    order = np.argsort(-s)[:concepts]
+    return u[:, order], s[order], wt[order].T
+
+
+def gram_svd(matrix):
+    """
+    Method to get the full SVD of a sparse matrix with the Gram matrix of its smallest side.
+
+    ...
+
+    Parameters
+    ----------
+    matrix : sparse matrix
+        the phrase x term matrix
+
+    Returns
+    -------
+    array
+        a numpy matrix (phrases x rank) with the left singular vectors
+    array
+        a numpy array with the nonzero singular values
+    array
+        a numpy matrix (rank x terms) with the right singular vectors
+
+    """
+
+    transposed = matrix.shape[0] > matrix.shape[1]
+    if transposed:
+        matrix = matrix.T.tocsr()
+    gram = np.asarray((matrix @ matrix.T).todense())
+    values, vectors = np.linalg.eigh(gram)
+    kept = values > GRAM_TOLERANCE * max(gram.trace(), np.finfo(float).tiny)
+    s = np.sqrt(values[kept])
+    vectors = vectors[:, kept]
+    other = np.asarray(matrix.T @ vectors) / s
+    if transposed:
+        return other, s, vectors.T
+    return vectors, s, other.T
+
+
+def update_svd(u, singular_values, w, rows, concepts):
+    """
+    Method to update the truncated SVD of a phrase x term matrix with new phrases.
+
+    It is the rank-k update of Brand: the new rows are split into their projection on the
+    current terms space and an orthogonal residual, and only the small (concepts + rows)
+    square core is decomposed again, so the old phrases are not vectorized again. The basis
+    of the residual comes from its (rows x rows) Gram matrix, so the new rows stay sparse.
+
+    ...
+
+    Parameters
+    ----------
+    u : array
+        a numpy matrix (phrases x concepts) with the left singular vectors
+    singular_values : array
+        a numpy array with the singular values in decreasing order
+    w : array
+        a numpy matrix (terms x concepts) with the right singular vectors
+    rows : sparse matrix
+        the new phrase x term rows, which may have new terms after the old ones
+    concepts : int
+        the number of concepts to keep
+
+    Returns
+    -------
+    array
+        a numpy matrix (phrases x concepts) with the updated left singular vectors
+    array
+        a numpy array with the updated singular values in decreasing order
+    array
+        a numpy matrix (terms x concepts) with the updated right singular vectors
+
+    """
+
+    num_rows, num_terms = rows.shape
+    rank = len(singular_values)
+    w = np.vstack([w, np.zeros((num_terms - len(w), rank))])
+    projection = np.asarray(rows @ w)  # new rows x concepts
+
+    # The residual is rows.T - w @ projection.T, and its Gram matrix needs only the rows
+    gram = np.asarray((rows @ rows.T).todense()) - projection @ projection.T
+    values, vectors = np.linalg.eigh(gram)
+    kept = values > GRAM_TOLERANCE * max(rows.multiply(rows).sum(), np.finfo(float).tiny)
+    values, vectors = values[kept], vectors[:, kept]
+
+    matrix = np.zeros((rank + num_rows, rank + len(values)))
+    matrix[:rank, :rank] = np.diag(singular_values)
+    matrix[rank:, :rank] = projection
+    matrix[rank:, rank:] = vectors * np.sqrt(values)
+    core_u, s, core_wt = np.linalg.svd(matrix, full_matrices=False)
+
+    concepts = min(concepts, len(u) + num_rows, num_terms, len(s))
+    u = np.vstack([u @ core_u[:rank, :concepts], core_u[rank:, :concepts]])
+    residual_weights = (vectors / np.sqrt(values)) @ core_wt[:concepts, rank:].T
+    w = w @ (core_wt[:concepts, :rank].T - projection.T @ residual_weights) + \
+        np.asarray(rows.T @ residual_weights)
+    return u, s[:concepts], w
+
+
+def orient_concepts(vt):
+    """
+    Method to orient every concept so that its largest weight is positive.
+
+    ...
+
+    Parameters
+    ----------
+    vt : array
+        a numpy matrix (concepts x phrases) with the weight of every phrase in every concept
+
+    Returns
+    -------
+    array
+        the same matrix with the sign of every concept fixed
+
+    """
+
+    vt *= np.sign(vt[np.arange(len(vt)), np.argmax(np.abs(vt), axis=1)])[:, np.newaxis]
+    return vt
+
+
+def select_phrases(vt, phrases_per_concept=1):
+    """
+    Method to select the best phrases of every concept.
+
+    ...
+
+    Parameters
+    ----------
+    vt : array
+        a numpy matrix (concepts x phrases) with the weight of every phrase in every concept
+    phrases_per_concept : int
+        the number of phrases to select from every concept
+
+    Returns
+    -------
+    array
+        an int numpy array with the indexes of the selected phrases without duplicates, first
+        the best phrase of every concept, then the second ones, and so on
+
+    """
+
+    num_concepts, num_phrases = vt.shape
+    phrases_per_concept = min(phrases_per_concept, num_phrases)
+    if num_concepts == 0 or phrases_per_concept <= 0:
+        return np.zeros(0, dtype=np.int64)
+
+    top = np.argpartition(-vt, phrases_per_concept - 1, axis=1)[:, :phrases_per_concept]
+    order = np.argsort(-np.take_along_axis(vt, top, axis=1), axis=1, kind='stable')
+    selected = np.take_along_axis(top, order, axis=1).T.ravel()
+    _, first = np.unique(selected, return_index=True)
+    return selected[np.sort(first)]
+
+
+def score_phrases(vt, singular_values):
+    """
+    Method to get the weight of every phrase over all the concepts.
+
+    ...
+
+    Parameters
+    ----------
+    vt : array
+        a numpy matrix (concepts x phrases) with the weight of every phrase in every concept
+    singular_values : array
+        a numpy array with the singular value of every concept
+
+    Returns
+    -------
+    array
+        a float numpy array with the length of every phrase vector weighted by the singular
+        values
+
+    """
+
+    return np.sqrt(np.square(singular_values[:, np.newaxis] * vt).sum(axis=0))
+
+
+def rank_phrases(vt, singular_values, phrases_per_concept=1):
+    """
+    Method to get the score of every phrase.
+
+    ...
+
+    Parameters
+    ----------
+    vt : array
+        a numpy matrix (concepts x phrases) with the weight of every phrase in every concept
+    singular_values : array
+        a numpy array with the singular value of every concept
+    phrases_per_concept : int
+        the number of phrases to select from every concept
+
+    Returns
+    -------
+    array
+        a float numpy array with the score of every phrase, where the selected phrases score
+        above 1 in selection order and the rest score in [0, 1] by their weight
+
+    """
+
+    scores = score_phrases(vt, singular_values)
+    if scores.size and scores.max() > 0:
+        scores /= scores.max()
+    selected = select_phrases(vt, phrases_per_concept)
+    scores[selected] = 1 + np.arange(len(selected), 0, -1)
+    return scores
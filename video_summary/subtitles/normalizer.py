@@ -0,0 +1,182 @@
+"""The module for the text normalization of the subtitles."""
+
+import re
+from functools import lru_cache
+
+import unidecode
+
+from video_summary.subtitles.stemmer import get_stemmer
+
+# Runs of characters which need the accents folding
+NON_ASCII_PATTERN = re.compile(r'[^\x00-\x7f]+')
+
+
+@lru_cache(maxsize=65536)
+def fold_accents(text):
+    """
+    Method to replace the non-ASCII characters with their ASCII transliteration.
+
+    ...
+
+    Parameters
+    ----------
+    text : str
+        the text with non-ASCII characters
+
+    Returns
+    -------
+    str
+        the transliterated text
+
+    """
+
+    return unidecode.unidecode(text)
+
+
+@lru_cache(maxsize=64)
+def punctuation_table(punctuation_signs):
+    """
+    Method to get the translate table which removes the punctuation signs.
+
+    ...
+
+    Parameters
+    ----------
+    punctuation_signs : tuple
+        a tuple of chars with all the punctuation signs to remove
+
+    Returns
+    -------
+    dict
+        the translate table
+
+    """
+
+    return str.maketrans({key: None for key in punctuation_signs})
+
+
+class TextNormalizer:
+    """
+    A class used to represent a text normalization configuration.
+
+    The stop words, the translate table and the patterns are prepared once, so normalizing a
+    text only runs the enabled steps: lowercasing, stop words removal, punctuation removal,
+    stemming and accents folding, in this order.
+
+    ...
+
+    Attributes
+    ----------
+    lowercase : bool
+        a boolean to activate the removal of capital letters
+    stop_words : frozenset
+        the lowercase stop words to remove, or None to keep every word
+    punctuation_table : dict
+        the translate table which removes the punctuation signs, or None to keep them
+    remove_accents : bool
+        a boolean to activate the removal of accents
+    stemmer : callable
+        the function which gets a token with the lowercase stems of its words, or None to keep
+        the words
+
+    Methods
+    -------
+    normalize(text)
+        normalize a text
+    normalize_all(texts)
+        normalize a list of texts
+    """
+
+    def __init__(self, lowercase=False, stop_words=None, punctuation_signs=None,
+                 remove_accents=False, stemmer=None):
+        self.lowercase = lowercase
+        self.stop_words = None if stop_words is None else frozenset(
+            word.lower() for word in stop_words)
+        self.punctuation_table = None if punctuation_signs is None else punctuation_table(
+            tuple(punctuation_signs))
+        self.remove_accents = remove_accents
+        self.stemmer = stemmer
+
+    def normalize(self, text):
+        """
+        The method to normalize a text.
+
+        Parameters
+        ----------
+        text : str
+            the text, or None
+
+        Returns
+        -------
+        str
+            the normalized text, or None
+        """
+
+        if text is None:
+            return None
+        if self.lowercase:
+            text = text.lower()
+        if self.stop_words is not None:
+            stop_words = self.stop_words
+            if self.lowercase:
+                text = ' '.join([word for word in text.split() if word not in stop_words])
+            else:
+                text = ' '.join([word for word in text.split()
+                                 if word.lower() not in stop_words])
+        if self.punctuation_table is not None:
+            text = text.translate(self.punctuation_table)
+        if self.stemmer is not None:
+            text = ' '.join(map(self.stemmer, text.split()))
+        if self.remove_accents and not text.isascii():
+            text = NON_ASCII_PATTERN.sub(lambda match: fold_accents(match.group()), text)
+        return text
+
+    def normalize_all(self, texts):
+        """
+        The method to normalize a list of texts.
+
+        Parameters
+        ----------
+        texts : list
+            a list with the texts, which may be None
+
+        Returns
+        -------
+        list
+            a list with the normalized texts
+        """
+
+        normalize = self.normalize
+        return [normalize(text) for text in texts]
+
+
+@lru_cache(maxsize=16)
+def get_normalizer(lowercase=False, stop_words=None, punctuation_signs=None,
+                   remove_accents=False, stemmer_language=None):
+    """
+    Method to get the normalizer of a configuration, building it on the first request.
+
+    ...
+
+    Parameters
+    ----------
+    lowercase : bool
+        a boolean to activate the removal of capital letters
+    stop_words : tuple
+        a tuple of strings with all the stop words to remove, or None to keep every word
+    punctuation_signs : tuple
+        a tuple of chars with all the punctuation signs to remove, or None to keep them
+    remove_accents : bool
+        a boolean to activate the removal of accents
+    stemmer_language : int
+        the language of the stemming (class Languages), or None to keep the words
+
+    Returns
+    -------
+    TextNormalizer
+        the normalizer of the configuration
+
+    """
+
+    stemmer = None if stemmer_language is None else get_stemmer(stemmer_language)
+    return TextNormalizer(lowercase, stop_words, punctuation_signs, remove_accents, stemmer)
@@ -0,0 +1,270 @@
+"""The module for the streaming parser of the subtitles files (SRT and WebVTT)."""
+
+import codecs
+import io
+import re
+from array import array
+
+import numpy as np
+
+# Timing line ([hours:]minutes:seconds[,.]milliseconds --> ...), the WebVTT settings follow it
+TIMING_PATTERN = re.compile(
+    r'\s*(?:(\d+):)?(\d{1,2}):(\d{1,2})[,.](\d{1,3})\s*-->\s*'
+    r'(?:(\d+):)?(\d{1,2}):(\d{1,2})[,.](\d{1,3})')
+
+# Encodings
+SAMPLE_SIZE = 65536
+BOM_ENCODINGS = ((codecs.BOM_UTF8, 'utf-8-sig'),
+                 (codecs.BOM_UTF16_LE, 'utf-16'),
+                 (codecs.BOM_UTF16_BE, 'utf-16'))
+FALLBACK_ENCODING = 'cp1252'
+BYTE_CODECS = {codecs.BOM_UTF8: 'utf-8',
+               codecs.BOM_UTF16_LE: 'utf-16-le',
+               codecs.BOM_UTF16_BE: 'utf-16-be'}
+
+# Blank line, which ends the cues before it (a carriage return at the end may be half of a CRLF)
+LINE_END = r'(?:\r\n|\r(?=[^\n])|\n)'
+BLANK_LINE_PATTERN = re.compile(LINE_END + r'[^\S\r\n]*' + LINE_END)
+
+
+def detect_encoding(path):
+    """
+    Method to detect the encoding of a subtitles file from its first bytes.
+
+    ...
+
+    Parameters
+    ----------
+    path : str
+        the subtitles' path
+
+    Returns
+    -------
+    str
+        the encoding's name: the BOM's one, utf-8 if the first bytes are valid UTF-8, or cp1252
+
+    """
+
+    with open(path, 'rb') as file:
+        sample = file.read(SAMPLE_SIZE)
+    for bom, encoding in BOM_ENCODINGS:
+        if sample.startswith(bom):
+            return encoding
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return FALLBACK_ENCODING
+    return 'utf-8'
+
+
+def get_milli_secs(hours, minutes, seconds, milli_secs):
+    """
+    Method to get the milliseconds of the groups of a timestamp.
+
+    ...
+
+    Parameters
+    ----------
+    hours : str
+        the hours, or None
+    minutes : str
+        the minutes
+    seconds : str
+        the seconds
+    milli_secs : str
+        the fraction of second (1 to 3 digits)
+
+    Returns
+    -------
+    int
+        the timestamp in milliseconds
+
+    """
+
+    return ((int(hours or 0) * 60 + int(minutes)) * 60 + int(seconds)) * 1000 \
+        + int(milli_secs.ljust(3, '0'))
+
+
+def parse_lines(text_lines):
+    """
+    Method to read the cues of the lines of a subtitles text (SRT or WebVTT).
+
+    ...
+
+    Parameters
+    ----------
+    text_lines : iterable
+        an iterable with the lines of the text, like an open text file or pipe
+
+    Yields
+    ------
+    tuple
+        the (start, end, text) of every cue, with the times in milliseconds and the text lines
+        joined with new lines
+
+    """
+
+    timing = None
+    lines = []
+    for line in text_lines:
+        line = line.rstrip('\r\n')
+        match = TIMING_PATTERN.match(line)
+        if match is not None:
+            if timing is not None:
+                # Cue without a blank line after it, the last line is the next cue's index
+                if lines and lines[-1].strip().isdigit():
+                    lines.pop()
+                yield timing[0], timing[1], '\n'.join(lines)
+            groups = match.groups()
+            timing = (get_milli_secs(*groups[:4]), get_milli_secs(*groups[4:]))
+            lines = []
+        elif not line.strip():
+            if timing is not None:
+                yield timing[0], timing[1], '\n'.join(lines)
+                timing = None
+            lines = []
+        elif timing is not None:
+            lines.append(line)
+    if timing is not None:
+        yield timing[0], timing[1], '\n'.join(lines)
+
+
+def iter_cues(path, encoding=None):
+    """
+    Method to read the cues of a subtitles file (SRT or WebVTT) line by line.
+
+    ...
+
+    Parameters
+    ----------
+    path : str
+        the subtitles' path
+    encoding : str
+        the file's encoding (None to detect it)
+
+    Yields
+    ------
+    tuple
+        the (start, end, text) of every cue, with the times in milliseconds and the text lines
+        joined with new lines
+
+    """
+
+    if encoding is None:
+        encoding = detect_encoding(path)
+
+    with open(path, encoding=encoding, errors='replace', newline=None) as file:
+        yield from parse_lines(file)
+
+
+def cue_arrays(cues):
+    """
+    Method to collect the cues into arrays.
+
+    ...
+
+    Parameters
+    ----------
+    cues : iterable
+        an iterable with the (start, end, text) of every cue
+
+    Returns
+    -------
+    array
+        an int64 numpy array with the start of every cue in milliseconds
+    array
+        an int64 numpy array with the end of every cue in milliseconds
+    list
+        a list of strings with the text of every cue
+
+    """
+
+    starts = array('q')
+    ends = array('q')
+    texts = []
+    for start, end, text in cues:
+        starts.append(start)
+        ends.append(end)
+        texts.append(text)
+    return np.array(starts, dtype=np.int64), np.array(ends, dtype=np.int64), texts
+
+
+def read_cues(path, encoding=None):
+    """
+    Method to read the cues of a subtitles file (SRT or WebVTT) into arrays.
+
+    ...
+
+    Parameters
+    ----------
+    path : str
+        the subtitles' path
+    encoding : str
+        the file's encoding (None to detect it)
+
+    Returns
+    -------
+    array
+        an int64 numpy array with the start of every cue in milliseconds
+    array
+        an int64 numpy array with the end of every cue in milliseconds
+    list
+        a list of strings with the text of every cue
+
+    """
+
+    return cue_arrays(iter_cues(path, encoding))
+
+
+def read_new_cues(path, offset=0, encoding=None):
+    """
+    Method to read the cues of a subtitles file from a byte offset up to its last blank line.
+
+    Only the bytes after the offset are read, so a file which grows is parsed once. The last
+    cue may still be written, so the text after the last blank line waits for the next reading.
+
+    ...
+
+    Parameters
+    ----------
+    path : str
+        the subtitles' path
+    offset : int
+        the byte offset where the reading starts, returned by the last reading (0 for the
+        beginning of the file)
+    encoding : str
+        the file's encoding (None to detect it)
+
+    Returns
+    -------
+    array
+        an int64 numpy array with the start of every read cue in milliseconds
+    array
+        an int64 numpy array with the end of every read cue in milliseconds
+    list
+        a list of strings with the text of every read cue
+    int
+        the byte offset after the last blank line, where the next reading starts
+
+    """
+
+    if encoding is None:
+        encoding = detect_encoding(path)
+
+    with open(path, 'rb') as file:
+        head = file.read(len(codecs.BOM_UTF8))
+        bom = next((bom for bom, _ in BOM_ENCODINGS if head.startswith(bom)), b'')
+        offset = max(offset, len(bom))
+        file.seek(offset)
+        data = file.read()
+
+    # The round-trip decoding gives the exact length in bytes of the complete cues
+    codec = BYTE_CODECS.get(bom, encoding)
+    errors = 'surrogatepass' if codec.startswith('utf-16') else 'surrogateescape'
+    text = codecs.getincrementaldecoder(codec)(errors).decode(data)
+    end = 0
+    for match in BLANK_LINE_PATTERN.finditer(text):
+        end = match.end()
+    size = len(text[:end].encode(codec, errors))
+    text = data[:size].decode(codec, 'replace')
+    return cue_arrays(parse_lines(io.StringIO(text, newline=None))) + (offset + size,)
@@ -0,0 +1,112 @@
+"""The module for the scoring of the cleaned subtitles."""
+
+import logging
+
+import numpy as np
+
+from video_summary.subtitles.corpus import CORPUS_TYPES
+from video_summary.subtitles.duplicates import representatives
+from video_summary.subtitles.summarizers import build_summarizer
+from video_summary.subtitles.term_counts import TermCounts
+
+# Logger
+LOGGER_NAME = 'App.Subtitles.Scoring'
+LOG = logging.getLogger(LOGGER_NAME)
+
+
+class PhraseScorer:
+    """
+    A class used to represent the scoring of the joined and cleaned subtitles.
+
+    The repeated subtitles are collapsed into their first appearance, and only the
+    representatives are vectorized and summarized, so the repetitions keep no score. The term
+    counts are kept, so the same subtitles can be scored again with other weights or another
+    summarizer without counting them again.
+
+    ...
+
+    Attributes
+    ----------
+    subtitles_list : SubtitleTable
+        the table of the joined and cleaned subtitles
+    representatives : array
+        the indexes of the subtitles which represent their repetitions (None to score every
+        subtitle)
+    phrases : list
+        a list with the texts of the represented subtitles
+    term_counts : TermCounts
+        the term counts of the represented subtitles (None until they are weighted without a
+        corpus model)
+
+    Methods
+    -------
+    vectorize(options, corpus)
+        get the phrase x term matrix of the represented subtitles
+    score(options, corpus)
+        get the score of every subtitle
+    """
+
+    def __init__(self, subtitles_list, duplicate_threshold=0):
+        self.subtitles_list = subtitles_list
+        self.representatives = None
+        self.phrases = subtitles_list.texts
+        self.term_counts = None
+        if duplicate_threshold:
+            LOG.debug('collapsing repeated subtitles')
+            groups = representatives(self.phrases, duplicate_threshold)
+            self.representatives = np.flatnonzero(groups == np.arange(len(groups)))
+            self.phrases = [self.phrases[index] for index in self.representatives.tolist()]
+            LOG.debug('%d repeated subtitles collapsed', len(groups) - len(self.phrases))
+
+    def vectorize(self, options, corpus=None):
+        """
+        The method to get the phrase x term matrix of the represented subtitles.
+
+        Parameters
+        ----------
+        options : dict
+            the analysis options
+        corpus : CorpusModel
+            the corpus model whose statistics weight the IDF vectoring types (None to weight
+            the phrases with the statistics of the subtitles)
+
+        Returns
+        -------
+        csr_matrix
+            a sparse matrix (phrases x terms) with the weights of the vectoring type
+        """
+
+        if corpus is not None and options['vectoringType'] in CORPUS_TYPES:
+            return corpus.transform(self.phrases, options['vectoringType'])
+        if self.term_counts is None:
+            LOG.debug('counting subtitles terms')
+            self.term_counts = TermCounts(self.phrases, options['hashingFeatures'])
+        return self.term_counts.weighting(options['vectoringType'])
+
+    def score(self, options, corpus=None):
+        """
+        The method to get the score of every subtitle.
+
+        Parameters
+        ----------
+        options : dict
+            the analysis options
+        corpus : CorpusModel
+            the corpus model whose statistics weight the IDF vectoring types (None to weight
+            the phrases with the statistics of the subtitles)
+
+        Returns
+        -------
+        array
+            a float numpy array with the score of every subtitle (NaN for the repetitions)
+        """
+
+        x = self.vectorize(options, corpus)
+        summarizer = build_summarizer(options['summarizer'], options['resumePercentage'],
+                                      options['concepts'], options['phrasesPerConcept'])
+        scores = summarizer.score(x)
+        if self.representatives is not None:
+            all_scores = np.full(len(self.subtitles_list), np.nan)
+            all_scores[self.representatives] = scores
+            scores = all_scores
+        return scores.astype(float)
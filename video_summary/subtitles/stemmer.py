@@ -0,0 +1,61 @@
+"""The module for the stemming of the subtitles words."""
+
+import logging
+import re
+from functools import lru_cache
+
+from nltk.stem.snowball import SnowballStemmer
+
+from video_summary.context.subtitles_context import Languages
+from video_summary.subtitles.stop_words import SWITCHER_LANGUAGE
+
+# Logger
+LOGGER_NAME = 'App.Subtitles.Stemmer'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Maximum number of memoized tokens of every language
+MEMO_SIZE = 1 << 16
+
+# Words of a token
+WORD_PATTERN = re.compile(r'\w+')
+
+# Languages with a Snowball stemmer
+STEMMER_LANGUAGES = {language: name for language, name in SWITCHER_LANGUAGE.items()
+                     if name in SnowballStemmer.languages}
+
+
+@lru_cache(maxsize=None)
+def get_stemmer(language):
+    """
+    Method to get the memoized stemmer of a language, building it on the first request.
+
+    The stems are memoized by token in every process, so every different token of the subtitles
+    is stemmed once.
+
+    ...
+
+    Parameters
+    ----------
+    language : int
+        the language (class Languages)
+
+    Returns
+    -------
+    callable
+        the function which gets a token (a text without whitespaces) with its words replaced by
+        their lowercase stems, or None if the language has no stemmer
+
+    """
+
+    name = STEMMER_LANGUAGES.get(Languages(language))
+    if name is None:
+        LOG.warning('%s has no stemmer', Languages(language).name)
+        return None
+    stem = SnowballStemmer(name).stem
+
+    @lru_cache(maxsize=MEMO_SIZE)
+    def stem_token(token):
+        return WORD_PATTERN.sub(lambda match: stem(match.group()), token)
+
+    LOG.debug('%s stemmer loaded', name)
+    return stem_token
@@ -0,0 +1,91 @@
+"""The module for the stop words of the subtitles' languages."""
+
+import logging
+import os
+from functools import lru_cache
+
+from video_summary.context.subtitles_context import Languages
+
+# Logger
+LOGGER_NAME = 'App.Subtitles.StopWords'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Paths
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__)) + '/stopwords/'
+
+# Switcher
+SWITCHER_LANGUAGE = {
+    Languages.ARABIC: "arabic",
+    Languages.AZERBAIJANI: "azerbaijani",
+    Languages.DANISH: "danish",
+    Languages.DUTCH: "dutch",
+    Languages.ENGLISH: "english",
+    Languages.FINNISH: "finnish",
+    Languages.FRENCH: "french",
+    Languages.GERMAN: "german",
+    Languages.GREEK: "greek",
+    Languages.HUNGARIAN: "hungarian",
+    Languages.INDONESIAN: "indonesian",
+    Languages.ITALIAN: "italian",
+    Languages.KAZAKH: "kazakh",
+    Languages.NEPALI: "nepali",
+    Languages.NORWEGIAN: "norwegian",
+    Languages.PORTUGUESE: "portuguese",
+    Languages.ROMANIAN: "romanian",
+    Languages.RUSSIAN: "russian",
+    Languages.SPANISH: "spanish",
+    Languages.SWEDISH: "swedish",
+    Languages.TURKISH: "turkish"
+}
+
+
+def load_stop_words(language):
+    """
+    Method to get the stop words of a language.
+
+    ...
+
+    Parameters
+    ----------
+    language : int
+        the subtitles language (class Languages)
+
+    Returns
+    -------
+    frozenset
+        the stop words of the language
+
+    """
+
+    return read_stop_words(SWITCHER_LANGUAGE[Languages(language)])
+
+
+@lru_cache(maxsize=None)
+def read_stop_words(name):
+    """
+    Method to read a stop words list on its first request.
+
+    The lists ship with the app (one lowercase word per line), so no download is needed. They
+    are the MIT licensed spaCy lists (see stopwords/README.md), which differ from the nltk
+    lists used before (English has 305 words instead of 179), so the configurations which
+    remove the stop words get different scores than with nltk.
+
+    ...
+
+    Parameters
+    ----------
+    name : str
+        the list's name
+
+    Returns
+    -------
+    frozenset
+        the stop words of the list
+
+    """
+
+    path = os.path.join(ROOT_DIR, name + '.txt')
+    with open(path, encoding='utf-8') as file:
+        stop_words = frozenset(file.read().split())
+    LOG.debug('%d stop words loaded from %s', len(stop_words), path)
+    return stop_words
@@ -0,0 +1,260 @@
+"""The module for the summarizers which score the subtitles."""
+
+import numpy as np
+from scipy import sparse
+from sklearn.preprocessing import normalize
+
+from video_summary.context.subtitles_context import SummarizerType
+from video_summary.subtitles.lsa import concepts_number, rank_phrases, truncated_svd
+
+# Maximum number of similarities computed at once by the neighbours graph
+BLOCK_SIZE = 1 << 22
+
+
+def unit_rows(matrix):
+    """
+    Method to scale every phrase vector to unit length.
+
+    ...
+
+    Parameters
+    ----------
+    matrix : sparse matrix
+        the phrase x term matrix
+
+    Returns
+    -------
+    csr_matrix
+        a sparse float matrix with the L2 normalized rows (the empty rows stay empty)
+
+    """
+
+    matrix = sparse.csr_matrix(matrix, dtype=np.float64)
+    return normalize(matrix, copy=False) if matrix.shape[0] else matrix
+
+
+class LsaSummarizer:
+    """
+    A class used to represent the summarizer of the latent semantic analysis.
+
+    ...
+
+    Attributes
+    ----------
+    resume_percentage : float
+        the resume percentage of the phrases (0 - 100)
+    concepts : int
+        the configured number of concepts (0 to derive it from the resume percentage)
+    phrases_per_concept : int
+        the number of best phrases selected from every concept
+
+    Methods
+    -------
+    score(matrix)
+        get the score of every phrase
+    """
+
+    def __init__(self, resume_percentage=100, concepts=0, phrases_per_concept=1):
+        self.resume_percentage = resume_percentage
+        self.concepts = concepts
+        self.phrases_per_concept = phrases_per_concept
+
+    def score(self, matrix):
+        """
+        The method to get the score of every phrase.
+
+        Parameters
+        ----------
+        matrix : sparse matrix
+            the phrase x term matrix
+
+        Returns
+        -------
+        array
+            a float numpy array with the score of every phrase
+        """
+
+        vt, singular_values = truncated_svd(matrix, concepts_number(
+            matrix.shape[0], self.resume_percentage, self.concepts))  # concept x phrase matrix
+        return rank_phrases(vt, singular_values, self.phrases_per_concept)
+
+
+class CentroidSummarizer:
+    """
+    A class used to represent the summarizer of the similarity to the centroid.
+
+    Every phrase scores the cosine similarity between its vector and the mean vector of all
+    the phrases, so the cost is linear in the number of terms of the transcript.
+
+    ...
+
+    Methods
+    -------
+    score(matrix)
+        get the score of every phrase
+    """
+
+    @staticmethod
+    def score(matrix):
+        """
+        The method to get the score of every phrase.
+
+        Parameters
+        ----------
+        matrix : sparse matrix
+            the phrase x term matrix
+
+        Returns
+        -------
+        array
+            a float numpy array with the cosine similarity of every phrase to the centroid
+        """
+
+        matrix = unit_rows(matrix)
+        centroid = np.asarray(matrix.sum(axis=0)).ravel()
+        norm = np.linalg.norm(centroid)
+        if not norm:
+            return np.zeros(matrix.shape[0])
+        return matrix @ (centroid / norm)
+
+
+class TextRankSummarizer:
+    """
+    A class used to represent the summarizer of TextRank over the nearest neighbours.
+
+    The phrases are the nodes of a sparse graph where every phrase is linked to its most
+    similar phrases by cosine similarity, and every phrase scores its PageRank in that graph.
+
+    ...
+
+    Attributes
+    ----------
+    neighbours : int
+        the number of most similar phrases linked to every phrase
+    damping : float
+        the damping factor of the PageRank
+    iterations : int
+        the maximum number of iterations of the PageRank
+    tolerance : float
+        the L1 change of the ranks which stops the iterations
+
+    Methods
+    -------
+    graph(matrix)
+        get the similarity graph of the phrases
+    score(matrix)
+        get the score of every phrase
+    """
+
+    def __init__(self, neighbours=10, damping=0.85, iterations=100, tolerance=1e-8):
+        self.neighbours = neighbours
+        self.damping = damping
+        self.iterations = iterations
+        self.tolerance = tolerance
+
+    def graph(self, matrix):
+        """
+        The method to get the similarity graph of the phrases.
+
+        Parameters
+        ----------
+        matrix : sparse matrix
+            the phrase x term matrix
+
+        Returns
+        -------
+        csr_matrix
+            a symmetric sparse matrix (phrases x phrases) with the cosine similarity of every
+            phrase and its most similar phrases
+        """
+
+        matrix = unit_rows(matrix)
+        num_phrases = matrix.shape[0]
+        neighbours = min(self.neighbours, num_phrases - 1)
+        if neighbours <= 0:
+            return sparse.csr_matrix((num_phrases, num_phrases))
+
+        rows, columns, values = [], [], []
+        transposed = matrix.T.tocsc()
+        block = max(1, BLOCK_SIZE // num_phrases)
+        for start in range(0, num_phrases, block):
+            similarities = (matrix[start:start + block] @ transposed).toarray()
+            indexes = np.arange(len(similarities))
+            similarities[indexes, start + indexes] = 0
+            top = np.argpartition(-similarities, neighbours - 1, axis=1)[:, :neighbours]
+            top_values = np.take_along_axis(similarities, top, axis=1)
+            linked = top_values > 0
+            rows.append(np.repeat(start + indexes, neighbours)[linked.ravel()])
+            columns.append(top[linked])
+            values.append(top_values[linked])
+
+        graph = sparse.csr_matrix((np.concatenate(values),
+                                   (np.concatenate(rows), np.concatenate(columns))),
+                                  shape=(num_phrases, num_phrases))
+        return graph.maximum(graph.T).tocsr()
+
+    def score(self, matrix):
+        """
+        The method to get the score of every phrase.
+
+        Parameters
+        ----------
+        matrix : sparse matrix
+            the phrase x term matrix
+
+        Returns
+        -------
+        array
+            a float numpy array with the PageRank of every phrase
+        """
+
+        graph = self.graph(matrix)
+        num_phrases = graph.shape[0]
+        if not num_phrases:
+            return np.zeros(0)
+
+        degrees = np.asarray(graph.sum(axis=1)).ravel()
+        dangling = degrees == 0
+        inverse = np.divide(1, degrees, out=np.zeros(num_phrases), where=~dangling)
+        transition = (sparse.diags(inverse) @ graph).T.tocsr()
+        ranks = np.full(num_phrases, 1 / num_phrases)
+        for _ in range(self.iterations):
+            updated = (1 - self.damping) / num_phrases + self.damping * (
+                transition @ ranks + ranks[dangling].sum() / num_phrases)
+            change = np.abs(updated - ranks).sum()
+            ranks = updated
+            if change < self.tolerance:
+                break
+        return ranks
+
+
+def build_summarizer(summarizer_type, resume_percentage=100, concepts=0, phrases_per_concept=1):
+    """
+    Method to build the summarizer of a summarizer type.
+
+    ...
+
+    Parameters
+    ----------
+    summarizer_type : int
+        the summarizer type (class SummarizerType)
+    resume_percentage : float
+        the resume percentage of the phrases (0 - 100)
+    concepts : int
+        the configured number of concepts of the LSA (0 to derive it from the resume percentage)
+    phrases_per_concept : int
+        the number of best phrases selected from every concept of the LSA
+
+    Returns
+    -------
+    object
+        the summarizer, with a score(matrix) method
+
+    """
+
+    summarizer_type = SummarizerType(summarizer_type)
+    if summarizer_type == SummarizerType.CENTROID:
+        return CentroidSummarizer()
+    if summarizer_type == SummarizerType.TEXT_RANK:
+        return TextRankSummarizer()
+    return LsaSummarizer(resume_percentage, concepts, phrases_per_concept)
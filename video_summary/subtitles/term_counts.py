@@ -0,0 +1,269 @@
+"""The module for the term counts of the subtitles."""
+
+from array import array
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction import FeatureHasher
+from sklearn.preprocessing import normalize
+
+from video_summary.context.subtitles_context import VectoringType
+from video_summary.subtitles.vectorizers import tokenize
+
+# Weightings derived from the counts (use idf, smooth idf, norm)
+WEIGHTINGS = {
+    VectoringType.TF_WITH_NORMALIZATION_L1: (False, False, 'l1'),
+    VectoringType.TF_WITH_NORMALIZATION_L2: (False, False, 'l2'),
+    VectoringType.TF_IDF: (True, False, None),
+    VectoringType.TF_IDF_WITH_SMOOTHING_IDF: (True, True, None),
+    VectoringType.TF_IDF_WITH_SMOOTHING_IDF_AND_NORMALIZATION_L1: (True, True, 'l1'),
+    VectoringType.TF_IDF_WITH_SMOOTHING_IDF_AND_NORMALIZATION_L2: (True, True, 'l2')
+}
+
+# N-grams of the N-gram counters
+NGRAM_RANGE = (1, 4)
+
+
+def count_terms(documents):
+    """
+    Method to count the terms of every document.
+
+    ...
+
+    Parameters
+    ----------
+    documents : iterable
+        an iterable with the list of terms of every document
+
+    Returns
+    -------
+    csr_matrix
+        a sparse int64 matrix (documents x terms) with the counts
+    array
+        a numpy array with the sorted terms
+
+    """
+
+    vocabulary = {}
+    columns = array('q')
+    pointers = array('q', [0])
+    for terms in documents:
+        columns.extend([vocabulary.setdefault(term, len(vocabulary)) for term in terms])
+        pointers.append(len(columns))
+
+    terms = list(vocabulary)
+    order = np.array(sorted(range(len(terms)), key=terms.__getitem__), dtype=np.int64)
+    ranks = np.empty(len(terms), dtype=np.int64)
+    ranks[order] = np.arange(len(terms))
+    counts = sparse.csr_matrix((np.ones(len(columns), dtype=np.int64),
+                                ranks[np.array(columns, dtype=np.int64)],
+                                np.array(pointers, dtype=np.int64)),
+                               shape=(len(pointers) - 1, len(terms)))
+    counts.sum_duplicates()
+    return counts, np.array([terms[index] for index in order], dtype=str)
+
+
+def hash_terms(documents, features):
+    """
+    Method to count the hashed terms of every document.
+
+    ...
+
+    Parameters
+    ----------
+    documents : iterable
+        an iterable with the list of terms of every document
+    features : int
+        the number of hashed features
+
+    Returns
+    -------
+    csr_matrix
+        a sparse int64 matrix (documents x features) with the counts
+
+    """
+
+    hasher = FeatureHasher(n_features=features, input_type='string', alternate_sign=False,
+                           dtype=np.int64)
+    counts = hasher.transform(documents).tocsr()
+    counts.sum_duplicates()
+    return counts
+
+
+def ngrams(tokens):
+    """
+    Method to get the n-grams of the tokens of a document.
+
+    ...
+
+    Parameters
+    ----------
+    tokens : list
+        a list of strings with the tokens of the document
+
+    Returns
+    -------
+    list
+        a list of strings with the n-grams, by size and position
+
+    """
+
+    min_n, max_n = NGRAM_RANGE
+    return [' '.join(tokens[start:start + size])
+            for size in range(min_n, min(max_n, len(tokens)) + 1)
+            for start in range(len(tokens) - size + 1)]
+
+
+def weight(counts, vectoring_type, frequencies=None, phrases=0):
+    """
+    Method to get the weights of a vectoring type from the counts.
+
+    ...
+
+    Parameters
+    ----------
+    counts : csr_matrix
+        a sparse int64 matrix (phrases x terms) with the counts
+    vectoring_type : int
+        the vectoring type (class VectoringType)
+    frequencies : array
+        an int numpy array with the document frequency of every term over all the phrases
+        (None to take it from the counts)
+    phrases : int
+        the number of phrases of the frequencies
+
+    Returns
+    -------
+    csr_matrix
+        a sparse matrix (phrases x terms) with the weights of the vectoring type
+
+    """
+
+    vectoring_type = VectoringType(vectoring_type)
+    if vectoring_type in (VectoringType.COUNTERS, VectoringType.N_GRAM_COUNTERS):
+        return counts.copy()
+    if vectoring_type == VectoringType.BINARIES_COUNTERS:
+        matrix = counts.copy()
+        matrix.data[:] = 1
+        return matrix
+
+    use_idf, smooth_idf, norm = WEIGHTINGS[vectoring_type]
+    matrix = counts.astype(np.float64)
+    if use_idf:
+        if frequencies is None:
+            frequencies = np.bincount(counts.indices, minlength=counts.shape[1])
+            phrases = counts.shape[0]
+        frequencies = frequencies[matrix.indices] + int(smooth_idf)
+        matrix.data *= np.log((phrases + int(smooth_idf)) / frequencies) + 1
+    if norm and matrix.nnz:
+        matrix = normalize(matrix, norm=norm, copy=False)
+    return matrix
+
+
+class TermCounts:
+    """
+    A class used to represent the term counts of the phrases.
+
+    The phrases are tokenized once, and every vectoring type is derived from the counts with
+    sparse operations, so changing the vectoring type does not process the phrases again. The
+    n-gram counts are built on their first request from the kept tokens. With a number of
+    hashed features, the terms are hashed into that number of columns instead of building a
+    vocabulary, so the memory does not grow with the number of different terms.
+
+    ...
+
+    Attributes
+    ----------
+    tokens : list
+        a list with the list of tokens of every phrase
+    counts : csr_matrix
+        a sparse int64 matrix (phrases x terms) with the counts of the terms
+    vocabulary : array
+        a numpy array with the sorted terms, or None with hashed features
+    features : int
+        the number of hashed features (0 to build a vocabulary)
+
+    Methods
+    -------
+    ngram_counts()
+        get the counts of the n-grams
+    document_frequencies()
+        get the number of phrases with every term
+    weighting(vectoring_type)
+        get the phrase x term matrix of a vectoring type
+    """
+
+    def __init__(self, phrases, features=0):
+        self.features = features
+        self.tokens = [tokenize(phrase.lower()) for phrase in phrases]
+        self.counts, self.vocabulary = self.count(self.tokens)
+        self.ngrams = None
+
+    def __len__(self):
+        return len(self.tokens)
+
+    def count(self, documents):
+        """
+        The method to count the terms of every document.
+
+        Parameters
+        ----------
+        documents : iterable
+            an iterable with the list of terms of every document
+
+        Returns
+        -------
+        csr_matrix
+            a sparse int64 matrix (documents x terms) with the counts
+        array
+            a numpy array with the sorted terms, or None with hashed features
+        """
+
+        if self.features:
+            return hash_terms(documents, self.features), None
+        return count_terms(documents)
+
+    def ngram_counts(self):
+        """
+        The method to get the counts of the n-grams.
+
+        Returns
+        -------
+        csr_matrix
+            a sparse int64 matrix (phrases x n-grams) with the counts of the n-grams
+        """
+
+        if self.ngrams is None:
+            self.ngrams = self.count(ngrams(tokens) for tokens in self.tokens)[0]
+        return self.ngrams
+
+    def document_frequencies(self):
+        """
+        The method to get the number of phrases with every term.
+
+        Returns
+        -------
+        array
+            an int numpy array with the document frequency of every term
+        """
+
+        return np.bincount(self.counts.indices, minlength=self.counts.shape[1])
+
+    def weighting(self, vectoring_type):
+        """
+        The method to get the phrase x term matrix of a vectoring type.
+
+        Parameters
+        ----------
+        vectoring_type : int
+            the vectoring type (class VectoringType)
+
+        Returns
+        -------
+        csr_matrix
+            a sparse matrix (phrases x terms) with the weights of the vectoring type
+        """
+
+        if VectoringType(vectoring_type) == VectoringType.N_GRAM_COUNTERS:
+            return self.ngram_counts().copy()
+        return weight(self.counts, vectoring_type)
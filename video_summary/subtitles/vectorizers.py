@@ -0,0 +1,85 @@
+"""The module for the vectorizers of the subtitles."""
+
+import re
+
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer, \
+    HashingVectorizer, TfidfTransformer
+from sklearn.pipeline import make_pipeline
+
+from video_summary.context.subtitles_context import VectoringType
+
+# Tokenizer (the scikit-learn default pattern, compiled once for every job)
+TOKEN_PATTERN = re.compile(r'(?u)\b\w\w+\b')
+
+# Vectorizers' specifications (the reference of TermCounts)
+VECTORING_SPECS = {
+    VectoringType.COUNTERS: (CountVectorizer, {}),
+    VectoringType.BINARIES_COUNTERS: (CountVectorizer, {'binary': True}),
+    VectoringType.N_GRAM_COUNTERS: (CountVectorizer, {'ngram_range': (1, 4)}),
+    VectoringType.TF_WITH_NORMALIZATION_L1: (TfidfVectorizer, {'norm': 'l1', 'use_idf': False}),
+    VectoringType.TF_WITH_NORMALIZATION_L2: (TfidfVectorizer, {'norm': 'l2', 'use_idf': False}),
+    VectoringType.TF_IDF: (TfidfVectorizer, {'norm': None, 'smooth_idf': False}),
+    VectoringType.TF_IDF_WITH_SMOOTHING_IDF: (TfidfVectorizer, {'norm': None, 'smooth_idf': True}),
+    VectoringType.TF_IDF_WITH_SMOOTHING_IDF_AND_NORMALIZATION_L1:
+        (TfidfVectorizer, {'norm': 'l1', 'smooth_idf': True}),
+    VectoringType.TF_IDF_WITH_SMOOTHING_IDF_AND_NORMALIZATION_L2: (TfidfVectorizer, {})
+}
+
+
+def tokenize(text):
+    """
+    Method to split a text into its tokens.
+
+    ...
+
+    Parameters
+    ----------
+    text : str
+        the lowercase text
+
+    Returns
+    -------
+    list
+        a list of strings with the tokens of two or more word characters
+
+    """
+
+    return TOKEN_PATTERN.findall(text)
+
+
+def build_vectorizer(vectoring_type, features=0):
+    """
+    Method to build the scikit-learn vectorizer of a vectoring type.
+
+    The analysis derives every vectoring type from TermCounts, so this vectorizer is not used
+    by the app: it is the reference which the tests and the vectorizers benchmark compare
+    TermCounts against. With a number of hashed features, the terms are hashed instead of
+    building a vocabulary, and the TF-IDF weights are applied afterwards.
+
+    ...
+
+    Parameters
+    ----------
+    vectoring_type : int
+        the vectoring type (class VectoringType)
+    features : int
+        the number of hashed features (0 to build a vocabulary)
+
+    Returns
+    -------
+    vectorizer
+        the unfitted scikit-learn vectorizer
+
+    """
+
+    vectorizer_class, parameters = VECTORING_SPECS[VectoringType(vectoring_type)]
+    if not features:
+        return vectorizer_class(tokenizer=tokenize, token_pattern=None, **parameters)
+
+    if vectorizer_class is CountVectorizer:
+        return HashingVectorizer(tokenizer=tokenize, token_pattern=None, n_features=features,
+                                 alternate_sign=False, norm=None, **parameters)
+    return make_pipeline(HashingVectorizer(tokenizer=tokenize, token_pattern=None,
+                                           n_features=features, alternate_sign=False,
+                                           norm=None),
+                         TfidfTransformer(**parameters))
@@ -0,0 +1,79 @@
+"""Unit tests that test that the assembly of the subtitles into sentences works."""
+
+import logging
+import random
+import unittest
+
+from video_summary.objects.subtitle import Subtitle
+from video_summary.subtitles.assembler import SentenceAssembler
+from video_summary.utils import fuse_subtitles
+
+# Logger
+LOGGER_NAME = 'Test.Assembler'
+LOG = logging.getLogger(LOGGER_NAME)
+
+
+def fused_sentences(subtitles_list):
+    """Method with the sentences made by fusing every subtitle into the previous ones."""
+    actual_sub = None
+    result = []
+    for sub in subtitles_list:
+        if sub is not None:
+            actual_sub = sub if actual_sub is None else fuse_subtitles(actual_sub, sub)
+            if actual_sub.text and actual_sub.text[-1] in '¡!.¿?':
+                result.append(actual_sub)
+                actual_sub = None
+    return result
+
+
+class AssemblerTest(unittest.TestCase):
+    """Class with all the sentence assembler test methods."""
+
+    def test_assemble(self):
+        """Unit test that test that the sentences match the fused subtitles."""
+        LOG.info('starting assemble\' test')
+        generator = random.Random(7)
+        words = ['hello', 'world!', 'this', 'is', 'a', 'test.', 'why?', None]
+        subtitles_list = []
+        for index in range(500):
+            start = generator.choice([None, index * 100])
+            subtitles_list.append(generator.choice([None, Subtitle(
+                generator.choice(words), start, None if start is None else start + 150,
+                generator.choice([None, 1, 2.5]))]))
+
+        expected = fused_sentences(subtitles_list)
+        result = SentenceAssembler().assemble(subtitles_list)
+        self.assertEqual(len(expected), len(result))
+        for expected_sub, sub in zip(expected, result):
+            self.assertEqual(expected_sub.text, sub.text)
+            self.assertEqual(expected_sub.get_times(), sub.get_times())
+            self.assertEqual(expected_sub.score, sub.score)
+        LOG.info('ending assemble\' test')
+
+    def test_limits(self):
+        """Unit test that test that the sentences end at the maximum length or duration."""
+        LOG.info('starting limits\' test')
+        subtitles_list = [Subtitle("la la", index * 1000, index * 1000 + 900, 1)
+                          for index in range(10)] + [Subtitle("end.", 10000, 10500, 1)]
+
+        self.assertEqual(1, len(SentenceAssembler().assemble(subtitles_list)))
+
+        result = SentenceAssembler(max_length=15).assemble(subtitles_list)
+        self.assertEqual(["la la la la la la"] * 3 + ["la la end."],
+                         [sub.text for sub in result])
+        self.assertEqual([[0, 2900], [3000, 5900], [6000, 8900], [9000, 10500]],
+                         [sub.get_times() for sub in result])
+        self.assertEqual([3, 3, 3, 2], [sub.score for sub in result])
+
+        result = SentenceAssembler(max_duration=1500).assemble(subtitles_list)
+        self.assertEqual([[0, 1900], [2000, 3900], [4000, 5900], [6000, 7900], [8000, 9900],
+                          [10000, 10500]], [sub.get_times() for sub in result])
+        LOG.info('ending limits\' test')
+
+    def test_single_subtitle(self):
+        """Unit test that test that a sentence of one subtitle is that subtitle."""
+        LOG.info('starting single subtitle\' test')
+        subtitle = Subtitle("Hello world!", 10, 20, 2)
+        self.assertIs(subtitle, SentenceAssembler().assemble([None, subtitle])[0])
+        self.assertEqual([], SentenceAssembler().assemble([Subtitle("", 0, 10, 1)]))
+        LOG.info('ending single subtitle\' test')
@@ -0,0 +1,85 @@
+"""Unit tests that test that the analysis of a batch of subtitles files works."""
+
+import logging
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from video_summary.context.subtitles_context import SubtitlesContext
+from video_summary.objects.subtitle_table import load
+from video_summary.processes.subtitles_analysis_process import read_options
+from video_summary.subtitles.batch import analyse_batch, output_paths, score_subtitles
+
+# Logger
+LOGGER_NAME = 'Test.Batch'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Files
+PHRASES = ["The cat eats fish.", "The dog eats meat.", "A cat and a dog.",
+           "Fish swim in the river.", "The river is cold.", "Dogs and cats play.",
+           "The cat sleeps.", "Meat and fish for dinner."]
+
+
+def srt(phrases):
+    """Method to get the SRT content of some phrases, one second each."""
+    return ''.join('{}\n00:00:{:02d},000 --> 00:00:{:02d},500\n{}\n\n'.format(
+        index + 1, index, index, phrase) for index, phrase in enumerate(phrases))
+
+
+class BatchTest(unittest.TestCase):
+    """Class with all the batch analysis test methods."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.paths = []
+        for index in range(3):
+            path = os.path.join(self.directory.name, 'episode{}.srt'.format(index))
+            with open(path, 'w') as file:
+                file.write(srt(PHRASES[index:] + PHRASES[:index]))
+            self.paths.append(path)
+        with SubtitlesContext(read_only=True, test=True) as manager:
+            self.options = read_options(manager)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_output_paths(self):
+        """Unit test that test that every file has its own result path."""
+        LOG.info('starting output paths\' test')
+        self.assertEqual([os.path.join('out', 'a.npz'), os.path.join('out', 'b.npz'),
+                          os.path.join('out', 'a-1.npz')],
+                         output_paths(['x/a.srt', 'x/b.vtt', 'y/a.srt'], 'out'))
+        LOG.info('ending output paths\' test')
+
+    def test_analyse_batch(self):
+        """Unit test that test that the pool writes the result of every file."""
+        LOG.info('starting analyse batch\' test')
+        paths = self.paths + [os.path.join(self.directory.name, 'missing.srt')]
+        for workers in (1, 2):
+            output_dir = os.path.join(self.directory.name, 'out{}'.format(workers))
+            report = analyse_batch(paths, output_dir, self.options, workers=workers)
+            self.assertEqual(workers, report['workers'])
+            self.assertEqual(paths, [result['path'] for result in report['files']])
+            for path, result in zip(self.paths, report['files']):
+                self.assertIsNone(result['error'])
+                self.assertEqual(len(PHRASES), result['phrases'])
+                np.testing.assert_allclose(score_subtitles(path, self.options).scores,
+                                           load(result['output']).scores)
+            self.assertIsNone(report['files'][-1]['output'])
+            self.assertIsNotNone(report['files'][-1]['error'])
+        LOG.info('ending analyse batch\' test')
+
+    def test_failed_files(self):
+        """Unit test that test that any error of a file is reported instead of raised."""
+        LOG.info('starting failed files\' test')
+        options = dict(self.options)
+        del options['vectoringType']  # every file fails with a KeyError while it is scored
+        report = analyse_batch(self.paths, os.path.join(self.directory.name, 'out'), options,
+                               workers=1)
+        self.assertEqual(len(self.paths), len(report['files']))
+        for result in report['files']:
+            self.assertIsNone(result['output'])
+            self.assertIn('vectoringType', result['error'])
+        LOG.info('ending failed files\' test')
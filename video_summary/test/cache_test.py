@@ -0,0 +1,127 @@
+"""Unit tests that test that the cache of the subtitles analysis results works."""
+
+import logging
+import os
+import tempfile
+import unittest
+
+from video_summary.objects.subtitle import Subtitle
+from video_summary.subtitles.cache import FileDigest, ResultsCache, content_digest, file_hash, \
+    is_grown, results_key
+
+# Logger
+LOGGER_NAME = 'Test.Cache'
+LOG = logging.getLogger(LOGGER_NAME)
+
+
+class CacheTest(unittest.TestCase):
+    """Class with all the results cache test methods."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_results_key(self):
+        """Unit test that test that the keys depend on the content and every option."""
+        LOG.info('starting results key\' test')
+        path = os.path.join(self.directory.name, 'a.srt')
+        with open(path, 'wb') as file:
+            file.write(b'1\n00:00:01,000 --> 00:00:02,000\nHello!\n')
+        content_hash = file_hash(path)
+        self.assertEqual(64, len(content_hash))
+        self.assertEqual(file_hash(path), file_hash(path, 10 ** 6))
+        self.assertNotEqual(content_hash, file_hash(path, 10))
+
+        key = results_key(content_hash, {'language': 4, 'vectoringType': 0})
+        self.assertEqual(key, results_key(content_hash, {'vectoringType': 0, 'language': 4}))
+        self.assertNotEqual(key, results_key(content_hash, {'language': 4, 'vectoringType': 1}))
+        self.assertNotEqual(key, results_key(content_hash[::-1],
+                                             {'language': 4, 'vectoringType': 0}))
+        LOG.info('ending results key\' test')
+
+    def test_content_digest(self):
+        """Unit test that test that the containers are identified without hashing them."""
+        LOG.info('starting content digest\' test')
+        path = os.path.join(self.directory.name, 'a.srt')
+        with open(path, 'wb') as file:
+            file.write(b'1\n00:00:01,000 --> 00:00:02,000\nHello!\n')
+        self.assertEqual(file_hash(path), content_digest(path))
+
+        path = os.path.join(self.directory.name, 'a.mkv')
+        with open(path, 'wb') as file:
+            file.write(b'video')
+        digest = content_digest(path)
+        self.assertNotEqual(file_hash(path), digest)
+        self.assertEqual(digest, content_digest(path))
+        os.utime(path, ns=(0, 10 ** 9))
+        self.assertNotEqual(digest, content_digest(path))
+        LOG.info('ending content digest\' test')
+
+    def test_file_digest(self):
+        """Unit test that test that a growing file is hashed in its new bytes only."""
+        LOG.info('starting file digest\' test')
+        path = os.path.join(self.directory.name, 'a.srt')
+        digest = FileDigest()
+        with open(path, 'wb') as file:
+            file.write(b'1\n00:00:01,000 --> 00:00:02,000\nHello!\n')
+        self.assertEqual(file_hash(path), digest.hexdigest(path))
+        size, tail = digest.size, digest.tail
+
+        with open(path, 'ab') as file:
+            file.write(b'\n2\n00:00:03,000 --> 00:00:04,000\nBye!\n' * 2000)
+        self.assertTrue(is_grown(path, size, tail))
+        self.assertEqual(file_hash(path), digest.hexdigest(path))
+        self.assertEqual(os.path.getsize(path), digest.size)
+
+        with open(path, 'r+b') as file:
+            file.seek(digest.size - 3)
+            file.write(b'Hi!')
+        self.assertFalse(is_grown(path, digest.size, digest.tail))
+        self.assertEqual(file_hash(path), digest.hexdigest(path))
+        with open(path, 'wb') as file:
+            file.write(b'new')
+        self.assertFalse(is_grown(path, size, tail))
+        self.assertEqual(file_hash(path), digest.hexdigest(path))
+        LOG.info('ending file digest\' test')
+
+    def test_get_and_put(self):
+        """Unit test that test that the cached results are found again."""
+        LOG.info('starting get and put\' test')
+        cache = ResultsCache(2 ** 20, self.directory.name)
+        self.assertIsNone(cache.get('a'))
+        cache.put('a', [Subtitle("Hello world!", 10, 20, 2.5), Subtitle("Bye.", 30, 40, 0)])
+
+        subtitles_list = ResultsCache(2 ** 20, self.directory.name).get('a')
+        self.assertEqual(["Hello world!", "Bye."], [sub.text for sub in subtitles_list])
+        self.assertEqual([[10, 20], [30, 40]], [sub.get_times() for sub in subtitles_list])
+        self.assertEqual([2.5, 0], [sub.score for sub in subtitles_list])
+
+        cache.get('a')
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+
+        with open(cache.path_of('broken'), 'w') as file:
+            file.write('[{"text": ')
+        self.assertIsNone(cache.get('broken'))
+        LOG.info('ending get and put\' test')
+
+    def test_evict(self):
+        """Unit test that test that the least recently used results are evicted."""
+        LOG.info('starting evict\' test')
+        subtitles_list = [Subtitle("word " * 40, index, index + 1, 1) for index in range(5)]
+        cache = ResultsCache(2 ** 20, self.directory.name)
+        for index, key in enumerate(['a', 'b', 'c']):
+            cache.put(key, subtitles_list)
+            os.utime(cache.path_of(key), ns=(index * 10 ** 9, index * 10 ** 9))
+        entry_size = os.path.getsize(cache.path_of('a'))
+        self.assertEqual(3 * entry_size, cache.size())
+
+        os.utime(cache.path_of('a'))  # most recently used
+        cache.max_size = 2 * entry_size
+        cache.evict()
+        self.assertFalse(os.path.exists(cache.path_of('b')))
+        self.assertTrue(os.path.exists(cache.path_of('a')))
+        self.assertTrue(os.path.exists(cache.path_of('c')))
+        self.assertEqual(2 * entry_size, cache.size())
+        LOG.info('ending evict\' test')
@@ -0,0 +1,55 @@
+"""Unit tests that test that the detection cascade works."""
+
+import logging
+import unittest
+
+import numpy as np
+
+from video_summary.detection.cascade import DetectionCascade
+
+# Logger
+LOGGER_NAME = 'Test.Cascade'
+LOG = logging.getLogger(LOGGER_NAME)
+
+
+def fake_detector(frames):
+    """Method that build a detector which returns the given detections of every frame."""
+    def detector(frame):
+        class_ids, confidences = frames[frame]
+        return (np.array(class_ids), np.array(confidences),
+                np.full((len(class_ids), 4), 0.5))
+    return detector
+
+
+class CascadeTest(unittest.TestCase):
+    """Class with all the detection cascade test methods."""
+
+    def test_cascade(self):
+        """Unit test that test that the cascade only runs the full detector on the hits."""
+        LOG.info('starting cascade\' test')
+        screen = fake_detector({0: ([1], [0.1]), 1: ([1], [0.3]), 2: ([2], [0.9]),
+                                3: ([1, 2], [0.5, 0.5])})
+        full_calls = []
+        full = fake_detector({1: ([1], [0.8]), 3: ([2], [0.7])})
+
+        def full_detector(frame):
+            full_calls.append(frame)
+            return full(frame)
+
+        cascade = DetectionCascade(screen, full_detector, [1], 0.2)
+        results = [cascade.detect(frame) for frame in range(4)]
+
+        self.assertEqual([1, 3], full_calls)
+        self.assertEqual(0, len(results[0][0]))
+        self.assertEqual([1], results[1][0].tolist())
+        self.assertEqual(0, len(results[2][0]))
+        self.assertEqual([2], results[3][0].tolist())
+        self.assertEqual(2, cascade.hits)
+        self.assertEqual(2, cascade.misses)
+        self.assertEqual(1, cascade.confirmed)
+        cascade.log_statistics()
+        LOG.info('ending cascade\' test')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""Unit tests that test that the corpus model of a series works."""
+
+import logging
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from video_summary.context.subtitles_context import SubtitlesContext, VectoringType
+from video_summary.processes.subtitles_analysis_process import build_corpus, read_options, \
+    read_phrases_options
+from video_summary.subtitles.corpus import CORPUS_TYPES, CorpusModel, load
+from video_summary.subtitles.incremental import TermCounter
+from video_summary.subtitles.term_counts import weight
+
+# Logger
+LOGGER_NAME = 'Test.Corpus'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Test constants
+FIRST_EPISODE = ["the cat eats fish", "the dog eats meat", "a cat and a dog",
+                 "fish swim in the river"]
+SECOND_EPISODE = ["the river is cold", "dogs and cats play", "the cat sleeps"]
+OPTIONS = {'removeStopWords': False, 'punctuationSigns': ['.', ',']}
+
+
+def write_srt(path, phrases):
+    """Method to write the phrases in a SRT file, one second each."""
+    with open(path, 'w') as file:
+        file.write(''.join('{}\n00:00:{:02d},000 --> 00:00:{:02d},500\n{}.\n\n'.format(
+            index + 1, index, index, phrase) for index, phrase in enumerate(phrases)))
+
+
+class CorpusTest(unittest.TestCase):
+    """Class with all the corpus model test methods."""
+
+    def test_add(self):
+        """Unit test that test that every episode is counted once."""
+        LOG.info('starting add\' test')
+        corpus = CorpusModel()
+        self.assertTrue(corpus.add('first', FIRST_EPISODE))
+        self.assertTrue(corpus.add('second', SECOND_EPISODE))
+        self.assertFalse(corpus.add('first', FIRST_EPISODE))
+        self.assertEqual(2, len(corpus))
+        self.assertEqual(7, corpus.documents)
+        self.assertEqual(2, corpus.counter.frequencies[corpus.counter.vocabulary['river']])
+        LOG.info('ending add\' test')
+
+    def test_transform(self):
+        """Unit test that test that the transform weights with the statistics of the corpus."""
+        LOG.info('starting transform\' test')
+        corpus = CorpusModel()
+        corpus.add('first', FIRST_EPISODE)
+        corpus.add('second', SECOND_EPISODE)
+        counter = TermCounter()
+        counts = counter.count(FIRST_EPISODE + SECOND_EPISODE)
+        for vectoring_type in VectoringType:
+            if vectoring_type == VectoringType.N_GRAM_COUNTERS:
+                continue
+            expected = weight(counts, vectoring_type)[len(FIRST_EPISODE):]
+            result = corpus.transform(SECOND_EPISODE, vectoring_type)
+            np.testing.assert_allclose(expected.toarray(), result.toarray())
+
+        result = corpus.transform(["the cat rides the unicorn"], VectoringType.COUNTERS)
+        self.assertEqual(3, result.sum())
+        self.assertEqual(7, corpus.documents)
+        self.assertNotIn('unicorn', corpus.counter.vocabulary)
+        self.assertEqual(4, len(CORPUS_TYPES))
+        self.assertNotIn(VectoringType.COUNTERS, CORPUS_TYPES)
+        self.assertIn(VectoringType.TF_IDF, CORPUS_TYPES)
+        LOG.info('ending transform\' test')
+
+    def test_save_and_load(self):
+        """Unit test that test that the model is kept by its binary file."""
+        LOG.info('starting save and load\' test')
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'corpus.npz')
+            for features in (0, 32):
+                corpus = CorpusModel(features, OPTIONS)
+                corpus.add('first', FIRST_EPISODE)
+                corpus.save(path)
+                loaded = load(path)
+                self.assertEqual(corpus.counter.vocabulary, loaded.counter.vocabulary)
+                self.assertEqual(corpus.counter.frequencies.tolist(),
+                                 loaded.counter.frequencies.tolist())
+                self.assertEqual((4, features, {'first'}, OPTIONS),
+                                 (loaded.documents, loaded.features, loaded.episodes,
+                                  loaded.options))
+
+                loaded.add('second', SECOND_EPISODE)
+                corpus.add('second', SECOND_EPISODE)
+                np.testing.assert_allclose(
+                    corpus.transform(SECOND_EPISODE, VectoringType.TF_IDF).toarray(),
+                    loaded.transform(SECOND_EPISODE, VectoringType.TF_IDF).toarray())
+        LOG.info('ending save and load\' test')
+
+    def test_build_corpus(self):
+        """Unit test that test that a batch of files builds the corpus without repetitions."""
+        LOG.info('starting build corpus\' test')
+        with SubtitlesContext(read_only=True, test=True) as manager:
+            options = dict(read_options(manager), duplicateThreshold=0.9)
+            phrases_options = dict(read_phrases_options(manager), duplicateThreshold=0.9)
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, name) for name in ('first.srt', 'second.srt')]
+            write_srt(paths[0], FIRST_EPISODE + FIRST_EPISODE[:2])  # two repetitions
+            write_srt(paths[1], SECOND_EPISODE)
+            corpus_path = os.path.join(directory, 'series.npz')
+
+            corpus = build_corpus(paths[:1], corpus_path, options, phrases_options)
+            self.assertEqual(len(FIRST_EPISODE), corpus.documents)
+            corpus = build_corpus(paths, corpus_path, options, phrases_options)
+            self.assertEqual(2, len(corpus))
+            self.assertEqual(len(FIRST_EPISODE) + len(SECOND_EPISODE), corpus.documents)
+            self.assertEqual(corpus.documents, load(corpus_path).documents)
+
+            with self.assertRaises(ValueError):
+                build_corpus(paths, corpus_path, options,
+                             dict(phrases_options, removeAccents=not options['removeAccents']))
+        LOG.info('ending build corpus\' test')
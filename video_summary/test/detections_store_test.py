@@ -0,0 +1,85 @@
+"""Unit tests that test that the detections store works."""
+
+import logging
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from video_summary.context.objects_context import ObjectsContext
+from video_summary.objects import objects_timeline
+from video_summary.objects.detections_store import from_samples, load
+
+# Logger
+LOGGER_NAME = 'Test.DetectionsStore'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Test constants
+CLASSES = ['person', 'dog', 'cat']
+
+
+def get_store():
+    """Method that build a store with three samples."""
+    detections_list = [
+        (np.array([1, 0]), np.array([0.9, 0.02]), np.array([[.5, .5, .5, .5], [.1, .1, .1, .1]])),
+        (np.array([1]), np.array([0.3]), np.array([[.5, .5, .1, .1]])),
+        (np.array([2, 1]), np.array([0.8, 0.6]), np.array([[.5, .5, .9, .9], [.2, .2, .8, .8]]))
+    ]
+    return from_samples([100, 200, 300], detections_list, CLASSES, min_confidence=0.05)
+
+
+class DetectionsStoreTest(unittest.TestCase):
+    """Class with all the detections store test methods."""
+
+    def test_from_samples(self):
+        """Unit test that test that the store is built from the samples."""
+        LOG.info('starting from samples\' test')
+        store = get_store()
+        self.assertEqual(4, len(store))
+        self.assertEqual([100, 200, 300, 300], store.times.tolist())
+        self.assertEqual([1, 1, 2, 1], store.class_ids.tolist())
+        self.assertEqual((4, 4), store.boxes.shape)
+        self.assertEqual(0, len(from_samples([], [], CLASSES)))
+        LOG.info('ending from samples\' test')
+
+    def test_filters(self):
+        """Unit test that test that the store filters the detections."""
+        LOG.info('starting filters\' test')
+        store = get_store()
+        self.assertEqual([100, 200, 300], store.times_of(['dog']).tolist())
+        self.assertEqual([100, 300], store.times_of(['dog'], min_confidence=0.5).tolist())
+        self.assertEqual([100, 300], store.times_of(['dog'], min_area=0.2).tolist())
+        self.assertEqual([300], store.times_of(['dog', 'cat'], min_area=0.5).tolist())
+        self.assertEqual([], store.times_of(['person']).tolist())
+        LOG.info('ending filters\' test')
+
+    def test_save_and_load(self):
+        """Unit test that test that the store is written and read from a binary file."""
+        LOG.info('starting save and load\' test')
+        store = get_store()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'detections.npz')
+            store.save(path)
+            result = load(path)
+        self.assertEqual(CLASSES, result.classes)
+        self.assertEqual(store.confidences.tolist(), result.confidences.tolist())
+        self.assertEqual(store.boxes.tolist(), result.boxes.tolist())
+        LOG.info('ending save and load\' test')
+
+    def test_objects_context(self):
+        """Unit test that test that the objects context keeps the store with the timeline."""
+        LOG.info('starting objects context\' test')
+        with ObjectsContext(test=True) as manager:
+            manager.objects_timeline = objects_timeline.from_samples([0, 10], [['dog'], []])
+            manager.detections_store = get_store()
+
+        with ObjectsContext(test=True) as manager:
+            self.assertEqual([0], manager.objects_timeline.times_of(['dog']).tolist())
+            self.assertEqual(len(get_store()), len(manager.detections_store))
+            self.assertEqual(CLASSES, manager.detections_store.classes)
+        LOG.info('ending objects context\' test')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+"""Unit tests that test that the repeated subtitles are found."""
+
+import logging
+import random
+import unittest
+
+import numpy as np
+
+from video_summary.subtitles.duplicates import PERMUTATIONS, min_hashes, representatives, \
+    shingle_hashes
+
+# Logger
+LOGGER_NAME = 'Test.Duplicates'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Test constants
+TEXTS = ["music", "the cat sleeps on the warm sofa", "Music", "the cat sleeps on the  warm sofa",
+         None, "", "the dog barks at the postman", "the cat sleeps on the warm sofa today",
+         "rivers run into the sea"]
+
+
+class DuplicatesTest(unittest.TestCase):
+    """Class with all the repeated subtitles test methods."""
+
+    def test_shingle_hashes(self):
+        """Unit test that test that every text gets the hashes of its own shingles."""
+        LOG.info('starting shingle hashes\' test')
+        hashes, offsets = shingle_hashes(["abcdef", "ab", "abcde", "xabcde"])
+        self.assertEqual([0, 2, 3, 4], offsets.tolist())
+        self.assertEqual(6, len(hashes))
+        self.assertEqual(hashes[0], hashes[3])
+        self.assertEqual(hashes[0], hashes[5])
+        self.assertNotEqual(hashes[0], hashes[2])
+        LOG.info('ending shingle hashes\' test')
+
+    def test_min_hashes(self):
+        """Unit test that test that the signatures estimate the Jaccard similarity."""
+        LOG.info('starting min hashes\' test')
+        signatures = min_hashes(["the cat sleeps on the warm sofa",
+                                 "the cat sleeps on the warm sofa",
+                                 "the cat sleeps on the warm sofa today",
+                                 "rivers run into the sea"])
+        self.assertEqual((4, PERMUTATIONS), signatures.shape)
+        np.testing.assert_array_equal(signatures[0], signatures[1])
+        self.assertGreater(np.mean(signatures[0] == signatures[2]), 0.6)
+        self.assertLess(np.mean(signatures[0] == signatures[3]), 0.2)
+        self.assertEqual((0, PERMUTATIONS), min_hashes([]).shape)
+        LOG.info('ending min hashes\' test')
+
+    def test_representatives(self):
+        """Unit test that test that the repetitions point to their first text."""
+        LOG.info('starting representatives\' test')
+        self.assertEqual([0, 1, 0, 1, 4, 4, 6, 7, 8], representatives(TEXTS).tolist())
+        self.assertEqual([0, 1, 0, 1, 4, 4, 6, 1, 8], representatives(TEXTS, 0.6).tolist())
+        self.assertEqual([], representatives([], 0.6).tolist())
+
+        generator = random.Random(0)
+        words = ['word{}'.format(index) for index in range(1000)]
+        texts = [' '.join(generator.choices(words, k=8)) for _ in range(200)]
+        result = representatives(texts + [text + "!" for text in texts], 0.8)
+        self.assertEqual(list(range(200)) * 2, result.tolist())
+        LOG.info('ending representatives\' test')
@@ -0,0 +1,99 @@
+"""Unit tests that test that the subtitles streams of the video containers are read."""
+
+import io
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from video_summary.subtitles.embedded import is_container, iter_stream_cues, read_stream_cues, \
+    select_stream
+from video_summary.subtitles.parser import parse_lines
+
+# Logger
+LOGGER_NAME = 'Test.Embedded'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Streams
+STREAMS = [{'index': 1, 'codec': 'hdmv_pgs_subtitle', 'language': 'spa'},
+           {'index': 2, 'codec': 'subrip', 'language': 'eng'},
+           {'index': 3, 'codec': 'ass', 'language': 'SPA'},
+           {'index': 4, 'codec': 'mov_text', 'language': None}]
+SRT = ("1\n00:00:01,000 --> 00:00:02,500\nHello world!\n\n"
+       "2\n00:00:03,250 --> 00:00:05,000\nThis is my\nsubtitle\n")
+CUES = [(1000, 2500, "Hello world!"), (3250, 5000, "This is my\nsubtitle")]
+
+# Fake ffmpeg, which writes more errors than a pipe holds before the subtitles
+FAKE_FFMPEG = """#!{}
+import sys
+sys.stderr.write('damaged packet\\n' * 65536)
+sys.stderr.flush()
+sys.stdout.write({!r})
+sys.exit(int(sys.argv[sys.argv.index('-i') + 1] == 'fail.mkv'))
+"""
+
+
+class EmbeddedTest(unittest.TestCase):
+    """Class with all the embedded subtitles test methods."""
+
+    def test_is_container(self):
+        """Unit test that test that the video containers are told from the subtitles files."""
+        LOG.info('starting is container\' test')
+        self.assertTrue(is_container('a/video.MKV'))
+        self.assertTrue(is_container('video.mp4'))
+        self.assertFalse(is_container('video.srt'))
+        self.assertFalse(is_container('video.vtt'))
+        LOG.info('ending is container\' test')
+
+    def test_select_stream(self):
+        """Unit test that test that the text stream of the language is selected."""
+        LOG.info('starting select stream\' test')
+        self.assertEqual(2, select_stream(STREAMS)['index'])
+        self.assertEqual(3, select_stream(STREAMS, 'spa')['index'])
+        self.assertEqual(2, select_stream(STREAMS, 'eng')['index'])
+        self.assertEqual(2, select_stream(STREAMS, 'fre')['index'])
+        self.assertIsNone(select_stream(STREAMS[:1]))
+        LOG.info('ending select stream\' test')
+
+    def test_parse_lines(self):
+        """Unit test that test that the cues of a text stream are read."""
+        LOG.info('starting parse lines\' test')
+        self.assertEqual(CUES, list(parse_lines(io.StringIO(SRT))))
+        LOG.info('ending parse lines\' test')
+
+    @unittest.skipIf(shutil.which('ffmpeg') is None or shutil.which('ffprobe') is None,
+                     'ffmpeg not found')
+    def test_read_stream_cues(self):
+        """Unit test that test that the subtitles stream of a container is read."""
+        LOG.info('starting read stream cues\' test')
+        with tempfile.TemporaryDirectory() as directory:
+            subtitles_path = os.path.join(directory, 'a.srt')
+            video_path = os.path.join(directory, 'a.mkv')
+            with open(subtitles_path, 'w') as file:
+                file.write(SRT)
+            subprocess.run(['ffmpeg', '-v', 'error', '-f', 'lavfi', '-i',
+                            'color=size=32x32:duration=6', '-i', subtitles_path,
+                            '-metadata:s:s:0', 'language=eng', video_path], check=True)
+            starts, ends, texts = read_stream_cues(video_path, 'eng')
+            self.assertEqual(CUES, list(zip(starts.tolist(), ends.tolist(), texts)))
+        LOG.info('ending read stream cues\' test')
+
+    @unittest.skipIf(os.name != 'posix', 'the fake ffmpeg is a script')
+    def test_noisy_stream(self):
+        """Unit test that test that a stream with many errors is read without blocking."""
+        LOG.info('starting noisy stream\' test')
+        with tempfile.TemporaryDirectory() as directory:
+            script = os.path.join(directory, 'ffmpeg')
+            with open(script, 'w') as file:
+                file.write(FAKE_FFMPEG.format(sys.executable, SRT))
+            os.chmod(script, 0o755)
+            path = directory + os.pathsep + os.environ.get('PATH', '')
+            with mock.patch.dict(os.environ, {'PATH': path}):
+                self.assertEqual(CUES, list(iter_stream_cues('a.mkv', 2)))
+                with self.assertRaisesRegex(OSError, 'damaged packet'):
+                    list(iter_stream_cues('fail.mkv', 2))
+        LOG.info('ending noisy stream\' test')
@@ -0,0 +1,83 @@
+"""Unit tests that test that the shared memory frame ring works."""
+
+import logging
+import unittest
+
+import numpy as np
+
+from video_summary.detection.frame_ring import CONTEXT, FRAME_SHAPE, FrameRing, stop_decoders
+
+# Logger
+LOGGER_NAME = 'Test.FrameRing'
+LOG = logging.getLogger(LOGGER_NAME)
+
+
+def write_frames(ring, total):
+    """Method that write frames filled with their position into the ring."""
+    for position in range(total):
+        index = ring.acquire()
+        if index is None:
+            break
+        ring.frames[index].fill(position)
+        ring.publish(index, position)
+    ring.close()
+
+
+class FrameRingTest(unittest.TestCase):
+    """Class with all the frame ring test methods."""
+
+    def test_slots(self):
+        """Unit test that test that the slots are views over the shared memory."""
+        LOG.info('starting slots\' test')
+        ring = FrameRing(2)
+        self.assertEqual((2,) + FRAME_SHAPE, ring.frames.shape)
+
+        index = ring.acquire()
+        ring.frames[index][0, 0] = [1, 2, 3]
+        ring.publish(index, 7)
+        received, position = ring.receive()
+        self.assertEqual((index, 7), (received, position))
+        self.assertTrue(np.shares_memory(ring.frames[received], ring.frames))
+        self.assertEqual([1, 2, 3], ring.frames[received][0, 0].tolist())
+        ring.release(received)
+        ring.close()
+        LOG.info('ending slots\' test')
+
+    def test_processes(self):
+        """Unit test that test that a writer process fills the slots in place."""
+        LOG.info('starting processes\' test')
+        ring = FrameRing(3, shape=(4, 4, 3))
+        total = 10
+        writer = CONTEXT.Process(target=write_frames, args=(ring, total))
+        writer.start()
+
+        positions = []
+        for _ in range(total):
+            index, position = ring.receive(timeout=30)
+            self.assertTrue(np.all(ring.frames[index] == position))
+            positions.append(position)
+            ring.release(index)
+
+        writer.join()
+        ring.close()
+        self.assertEqual(list(range(total)), positions)
+        self.assertEqual(0, writer.exitcode)
+        LOG.info('ending processes\' test')
+
+    def test_stop(self):
+        """Unit test that test that a writer waiting for a free slot stops."""
+        LOG.info('starting stop\' test')
+        ring = FrameRing(2, shape=(4, 4, 3))
+        writer = CONTEXT.Process(target=write_frames, args=(ring, 100))
+        writer.start()
+        ring.receive(timeout=30)
+
+        stop_decoders(ring, [writer], timeout=30)
+        ring.close()
+        self.assertTrue(ring.is_stopped())
+        self.assertEqual(0, writer.exitcode)
+        LOG.info('ending stop\' test')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+"""Unit tests that test that the incremental analysis of growing subtitles works."""
+
+import logging
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from scipy import sparse
+
+from video_summary.context.subtitles_context import SubtitlesContext, SummarizerType, \
+    VectoringType
+from video_summary.processes.subtitles_analysis_process import SubtitlesAnalysis, read_options
+from video_summary.subtitles.incremental import IncrementalLsa, TermCounter
+from video_summary.subtitles.lsa import rank_phrases, svd_factors, truncated_svd, update_svd
+from video_summary.subtitles.term_counts import TermCounts
+
+# Logger
+LOGGER_NAME = 'Test.Incremental'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Test constants
+PHRASES = ["the cat eats fish", "the dog eats meat", "a cat and a dog", "fish swim in the river",
+           "the river is cold", "dogs and cats play", "the cat sleeps", "meat and fish for dinner",
+           "a cold night by the river", "the dog sleeps by the cat"]
+CUES = ['1\n00:00:01,000 --> 00:00:02,000\nThe cat eats\n\n',
+        '2\n00:00:02,500 --> 00:00:03,000\nfish in the river.\n\n',
+        '3\n00:00:04,000 --> 00:00:05,000\nThe dog sleeps.\n\n']
+
+
+class IncrementalTest(unittest.TestCase):
+    """Class with all the incremental analysis test methods."""
+
+    def test_term_counter(self):
+        """Unit test that test that the running counts keep the columns of the old terms."""
+        LOG.info('starting term counter\' test')
+        counter = TermCounter()
+        first = counter.count(["bb aa bb", "cc"])
+        second = counter.count(["aa dd"])
+        self.assertEqual({'bb': 0, 'aa': 1, 'cc': 2, 'dd': 3}, counter.vocabulary)
+        self.assertEqual([[2, 1, 0], [0, 0, 1]], first.toarray().tolist())
+        self.assertEqual([[0, 1, 0, 1]], second.toarray().tolist())
+        self.assertEqual([1, 2, 1, 1], counter.frequencies.tolist())
+        self.assertEqual(3, counter.phrases)
+
+        counter = TermCounter(features=16)
+        counter.count(["bb aa bb", "cc"])
+        counter.count(["aa dd"])
+        self.assertEqual((16,), counter.frequencies.shape)
+        self.assertEqual(5, counter.frequencies.sum())
+        LOG.info('ending term counter\' test')
+
+    def test_update_svd(self):
+        """Unit test that test that the updated SVD matches the SVD of all the rows."""
+        LOG.info('starting update SVD\' test')
+        matrix = sparse.random(30, 50, density=0.1, format='lil', random_state=2)
+        matrix[:10, 40:] = 0  # terms which only appear in the new rows
+        matrix = matrix.tocsr()
+        u, s, w = svd_factors(matrix[:10, :40], 30)
+        u, s, w = update_svd(u, s, w, matrix[10:], 30)
+        expected = np.linalg.svd(matrix.toarray(), compute_uv=False)
+        expected = expected[expected > 1e-10]  # a zero first row has no concept
+        np.testing.assert_allclose(expected, s, atol=1e-10)
+        np.testing.assert_allclose(matrix.toarray(), (u * s) @ w.T, atol=1e-10)
+
+        u, s, w = svd_factors(matrix[:10], 3)
+        u, s, w = update_svd(u, s, w, matrix[10:], 3)
+        self.assertEqual(((30, 3), (3,), (50, 3)), (u.shape, s.shape, w.shape))
+        np.testing.assert_allclose(np.eye(3), u.T @ u, atol=1e-10)
+        LOG.info('ending update SVD\' test')
+
+    def test_incremental_lsa(self):
+        """Unit test that test that the incremental scores match the full analysis."""
+        LOG.info('starting incremental LSA\' test')
+        for vectoring_type in (VectoringType.COUNTERS, VectoringType.N_GRAM_COUNTERS,
+                               VectoringType.TF_WITH_NORMALIZATION_L2):
+            lsa = IncrementalLsa(vectoring_type, concepts=len(PHRASES))
+            for start, end in ((0, 4), (4, 5), (5, 5), (5, 10)):
+                lsa.append(PHRASES[start:end])
+            self.assertEqual(len(PHRASES), len(lsa))
+
+            vt, singular_values = truncated_svd(TermCounts(PHRASES).weighting(vectoring_type),
+                                                len(PHRASES))
+            np.testing.assert_allclose(singular_values, lsa.singular_values, atol=1e-10)
+            np.testing.assert_allclose(rank_phrases(vt, singular_values), lsa.scores(),
+                                       atol=1e-10)
+        LOG.info('ending incremental LSA\' test')
+
+    def test_process(self):
+        """Unit test that test that the process analyses a file without complete sentences."""
+        LOG.info('starting process\' test')
+        with SubtitlesContext(read_only=True, test=True) as manager:
+            options = dict(read_options(manager), incrementalAnalysis=True,
+                           summarizer=SummarizerType.LSA, duplicateThreshold=0)
+        process = SubtitlesAnalysis()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'growing.srt')
+            half = len(CUES[2]) // 2
+            for text, phrases in (('', 0), (CUES[0], 0), (CUES[1], 1), (CUES[2][:half], 1),
+                                  (CUES[2][half:], 2)):
+                with open(path, 'a', encoding='utf-8') as file:
+                    file.write(text)
+                subtitles_list, scores = process.analyse_incremental(path, options)
+                self.assertEqual(phrases, len(subtitles_list))
+                self.assertEqual(phrases, len(scores))
+            self.assertEqual(os.path.getsize(path), process.cues_offset)
+
+            # A file which does not only grow is analysed again
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(CUES[2])
+            subtitles_list, _ = process.analyse_incremental(path, options)
+            self.assertEqual([[4000, 5000]], subtitles_list.times().tolist())
+        LOG.info('ending process\' test')
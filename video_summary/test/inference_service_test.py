@@ -0,0 +1,127 @@
+"""Unit tests that test that the inference service works."""
+
+import logging
+import threading
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from video_summary.detection import inference_service
+from video_summary.detection.inference_service import InferenceService, get_service, \
+    release_service
+
+# Logger
+LOGGER_NAME = 'Test.InferenceService'
+LOG = logging.getLogger(LOGGER_NAME)
+
+
+class FakeNet:
+    """Class with a net which detects the mean color of every frame as its class."""
+
+    def __init__(self):
+        self.blob = None
+        self.batch_sizes = []
+
+    def setInput(self, blob):
+        """Method that set the batch blob."""
+        self.blob = blob
+
+    def forward(self, _):
+        """Method that return one detection per frame with the class of its mean color."""
+        batch_size = self.blob.shape[0]
+        self.batch_sizes.append(batch_size)
+        output = np.zeros((batch_size, 1, 15), dtype=np.float32)
+        for index in range(batch_size):
+            output[index, 0, 5 + int(round(self.blob[index].mean() / 0.00392 / 30))] = 1.0
+        return [output]
+
+
+class BrokenNet(FakeNet):
+    """Class with a net which fails the batches with a frame of a given color."""
+
+    def forward(self, _):
+        """Method that raise a non OpenCV error for the broken color."""
+        if np.any(np.isclose(self.blob.mean(axis=(1, 2, 3)) / 0.00392, 90, atol=1)):
+            raise RuntimeError('broken frame')
+        return FakeNet.forward(self, _)
+
+
+class InferenceServiceTest(unittest.TestCase):
+    """Class with all the inference service test methods."""
+
+    def test_batches(self):
+        """Unit test that test that the service batches the frames of concurrent jobs."""
+        LOG.info('starting batches\' test')
+        net = FakeNet()
+        service = InferenceService(net, ['output'], [str(i) for i in range(10)],
+                                   max_batch=4, max_latency=0.5)
+        results = {}
+
+        def job(color):
+            frame = np.full((100, 100, 3), color * 30, dtype=np.uint8)
+            results[color] = service.detect(frame)
+
+        threads = [threading.Thread(target=job, args=(color,)) for color in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        service.close()
+
+        for color in range(8):
+            self.assertEqual([color], results[color][0].tolist())
+        self.assertEqual(8, service.frames)
+        self.assertEqual(8, sum(net.batch_sizes))
+        self.assertLess(len(net.batch_sizes), 8)
+        LOG.info('ending batches\' test')
+
+    def test_errors(self):
+        """Unit test that test that the service keeps serving after a failed batch."""
+        LOG.info('starting errors\' test')
+        service = InferenceService(BrokenNet(), ['output'], [str(i) for i in range(10)],
+                                   max_batch=1, max_latency=0.0)
+        broken = service.submit(np.full((100, 100, 3), 90, dtype=np.uint8))
+        with self.assertRaises(RuntimeError):
+            broken.result(timeout=5)
+        result = service.submit(np.full((100, 100, 3), 60, dtype=np.uint8)).result(timeout=5)
+        self.assertEqual([2], result[0].tolist())
+        service.close()
+        self.assertEqual(1, service.frames)
+        LOG.info('ending errors\' test')
+
+    def test_get_service(self):
+        """Unit test that test that the shared service takes new options and is released."""
+        LOG.info('starting get service\' test')
+        nets = []
+
+        def load_yolo(*_):
+            nets.append(FakeNet())
+            return nets[-1], [str(i) for i in range(10)], ['output']
+
+        frames = [np.full((100, 100, 3), color * 30, dtype=np.uint8) for color in range(4)]
+        with mock.patch.object(inference_service, 'load_yolo', load_yolo):
+            service = get_service('a.weights', 'a.cfg', 'a.names', max_batch=2, max_latency=1.0)
+            for future in [service.submit(frame) for frame in frames]:
+                future.result(timeout=5)
+            self.assertIs(service, get_service('a.weights', 'a.cfg', 'a.names', max_batch=4,
+                                               max_latency=1.0))
+            for future in [service.submit(frame) for frame in frames]:
+                future.result(timeout=5)
+            self.assertEqual([2, 2, 4], nets[0].batch_sizes)
+
+            release_service(service)
+            self.assertTrue(service.thread.is_alive())
+            release_service(service)
+            self.assertFalse(service.thread.is_alive())
+            self.assertEqual({}, inference_service.SERVICES)
+            reloaded = get_service('a.weights', 'a.cfg', 'a.names')
+            self.assertIsNot(service, reloaded)
+            self.assertEqual(2, len(nets))
+            release_service(reloaded)
+        self.assertEqual({}, inference_service.SERVICES)
+        LOG.info('ending get service\' test')
+
+
+if __name__ == '__main__':
+    unittest.main()
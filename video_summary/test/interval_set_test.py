@@ -0,0 +1,82 @@
+"""Unit tests that test that the set of time intervals works."""
+
+import logging
+import unittest
+
+import numpy as np
+
+from video_summary.objects.interval_set import IntervalSet, from_times
+
+# Logger
+LOGGER_NAME = 'Test.IntervalSet'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Test constants
+TIMES = [[18, 25], [0, 5], None, [10, 12], [5, 9], [20, 30], [32, 40]]
+OTHER_TIMES = [[3, 11], [24, 34], [50, 60]]
+DURATION = 64
+
+
+def covered(times):
+    """Method with the boolean timeline of the milliseconds covered by some times."""
+    timeline = np.zeros(DURATION, dtype=bool)
+    for start, end in times:
+        timeline[start:end] = True
+    return timeline
+
+
+def random_times(generator, count):
+    """Method with random times of the test duration."""
+    starts = generator.integers(0, DURATION - 1, count)
+    return np.stack([starts, starts + generator.integers(1, 10, count)], axis=1).clip(
+        0, DURATION).tolist()
+
+
+class IntervalSetTest(unittest.TestCase):
+    """Class with all the interval set test methods."""
+
+    def test_from_times(self):
+        """Unit test that test that the missing times are skipped."""
+        LOG.info('starting from times\' test')
+        intervals = from_times(TIMES)
+        self.assertEqual(6, len(intervals))
+        self.assertEqual([0, 5], intervals.to_list()[1])
+        self.assertEqual(0, len(from_times(None)))
+        self.assertEqual([[1, 2]], from_times(np.array([[1, 2]])).to_list())
+        LOG.info('ending from times\' test')
+
+    def test_union(self):
+        """Unit test that test that the times are sorted and merged with the gap."""
+        LOG.info('starting union\' test')
+        intervals = from_times(TIMES)
+        self.assertEqual([[0, 9], [10, 12], [18, 30], [32, 40]], intervals.union().to_list())
+        self.assertEqual([[0, 12], [18, 30], [32, 40]], intervals.union(gap=1).to_list())
+        self.assertEqual([[0, 12], [18, 40]], intervals.union(gap=2).to_list())
+        self.assertEqual([[0, 12], [18, 40], [50, 60]],
+                         intervals.union(from_times(OTHER_TIMES)).to_list())
+        self.assertEqual([], IntervalSet().union().to_list())
+        LOG.info('ending union\' test')
+
+    def test_intersection_and_subtract(self):
+        """Unit test that test that the operations match the covered milliseconds."""
+        LOG.info('starting intersection and subtract\' test')
+        intervals = from_times(TIMES)
+        other = from_times(OTHER_TIMES)
+        self.assertEqual([[3, 9], [10, 11], [24, 30], [32, 34]],
+                         intervals.intersection(other).to_list())
+        self.assertEqual([[0, 3], [11, 12], [18, 24], [34, 40]],
+                         intervals.subtract(other).to_list())
+
+        generator = np.random.default_rng(0)
+        for _ in range(20):
+            first = random_times(generator, 8)
+            second = random_times(generator, 8)
+            expected = covered(first) & covered(second)
+            result = from_times(first).intersection(from_times(second))
+            np.testing.assert_array_equal(expected, covered(result.to_list()))
+            self.assertEqual(expected.sum(), result.duration())
+            expected = covered(first) & ~covered(second)
+            result = from_times(first).subtract(from_times(second))
+            np.testing.assert_array_equal(expected, covered(result.to_list()))
+            self.assertEqual(covered(first).sum(), from_times(first).duration())
+        LOG.info('ending intersection and subtract\' test')
@@ -0,0 +1,111 @@
+"""Unit tests that test that the latent semantic analysis works."""
+
+import logging
+import unittest
+from unittest import mock
+
+import numpy as np
+from scipy import sparse
+
+from video_summary.context.subtitles_context import VectoringType
+from video_summary.subtitles.lsa import concepts_number, truncated_svd, select_phrases, \
+    rank_phrases
+from video_summary.subtitles.summarizers import LsaSummarizer
+from video_summary.subtitles.term_counts import TermCounts
+
+# Logger
+LOGGER_NAME = 'Test.Lsa'
+LOG = logging.getLogger(LOGGER_NAME)
+
+
+# Test constants
+PHRASES = ["the cat eats fish", "the dog eats meat", "a cat and a dog", "fish swim in the river",
+           "the river is cold", "dogs and cats play", "the cat sleeps", "meat and fish"]
+
+
+class LsaTest(unittest.TestCase):
+    """Class with all the latent semantic analysis test methods."""
+
+    def test_concepts_number(self):
+        """Unit test that test that the number of concepts is derived from the percentage."""
+        LOG.info('starting concepts number\' test')
+        self.assertEqual(3, concepts_number(10, 30))
+        self.assertEqual(4, concepts_number(10, 31))
+        self.assertEqual(1, concepts_number(1, 10))
+        self.assertEqual(5, concepts_number(10, 30, concepts=5))
+        LOG.info('ending concepts number\' test')
+
+    def test_truncated_svd(self):
+        """Unit test that test that the truncated SVD matches the full SVD."""
+        LOG.info('starting truncated SVD\' test')
+        matrix = sparse.random(120, 200, density=0.05, format='csr', random_state=1)
+        u, s, _ = np.linalg.svd(matrix.toarray(), full_matrices=False)
+
+        vt, singular_values = truncated_svd(matrix, 5)
+        self.assertEqual((5, 120), vt.shape)
+        np.testing.assert_allclose(s[:5], singular_values, rtol=1e-6)
+        np.testing.assert_allclose(np.abs(u[:, :5].T), np.abs(vt), atol=1e-6)
+
+        vt, singular_values = truncated_svd(matrix, 60)
+        self.assertEqual((60, 120), vt.shape)
+        np.testing.assert_allclose(s[:5], singular_values[:5], rtol=1e-2)
+        self.assertTrue(np.all(np.diff(singular_values) <= 0))
+        np.testing.assert_array_equal(vt, truncated_svd(matrix, 60)[0])
+
+        vt, singular_values = truncated_svd(sparse.csr_matrix((3, 4)), 2)
+        self.assertEqual((0, 3), vt.shape)
+        self.assertEqual(0, len(singular_values))
+        LOG.info('ending truncated SVD\' test')
+
+    def test_full_decomposition(self):
+        """Unit test that test that all the concepts are computed without a dense matrix."""
+        LOG.info('starting full decomposition\' test')
+        matrix = TermCounts(PHRASES).weighting(VectoringType.N_GRAM_COUNTERS)
+        expected = np.linalg.svd(matrix.toarray(), compute_uv=False)
+        toarray = sparse.csr_matrix.toarray
+
+        def small_toarray(self, *args, **kwargs):
+            if sorted(self.shape) == sorted(matrix.shape):
+                raise AssertionError('dense phrase x term matrix')
+            return toarray(self, *args, **kwargs)
+
+        with mock.patch.object(sparse.csr_matrix, 'toarray', small_toarray), \
+                mock.patch.object(sparse.csc_matrix, 'toarray', small_toarray):
+            vt, singular_values = truncated_svd(matrix, len(PHRASES))
+            scores = LsaSummarizer(resume_percentage=100).score(matrix)
+        np.testing.assert_allclose(expected, singular_values, atol=1e-10)
+        self.assertEqual((len(PHRASES), len(PHRASES)), vt.shape)
+        self.assertEqual(len(PHRASES), len(scores))
+        LOG.info('ending full decomposition\' test')
+
+    def test_select_phrases(self):
+        """Unit test that test that the best phrases of every concept are selected."""
+        LOG.info('starting select phrases\' test')
+        vt = np.array([[0.9, 0.1, 0.5, 0.2],
+                       [0.8, 0.3, 0.1, 0.7],
+                       [0.1, 0.2, 0.6, 0.0]])
+        self.assertEqual([0, 2], select_phrases(vt).tolist())
+        self.assertEqual([0, 2, 3, 1], select_phrases(vt, phrases_per_concept=2).tolist())
+        self.assertEqual([0, 2, 3, 1], select_phrases(vt, phrases_per_concept=9).tolist())
+        self.assertEqual([], select_phrases(np.zeros((0, 4))).tolist())
+        LOG.info('ending select phrases\' test')
+
+    def test_rank_phrases(self):
+        """Unit test that test that every phrase gets a score with a total ordering."""
+        LOG.info('starting rank phrases\' test')
+        vt = np.array([[0.9, 0.1, 0.5, 0.2],
+                       [0.8, 0.3, 0.1, 0.7]])
+        scores = rank_phrases(vt, np.array([2.0, 1.0]))
+        self.assertEqual([0, 2, 3, 1], np.argsort(-scores).tolist())
+        self.assertGreater(scores[0], 1)
+        self.assertLessEqual(scores[2], 1)
+
+        scores = rank_phrases(vt, np.array([2.0, 1.0]), phrases_per_concept=2)
+        self.assertEqual([0, 2, 3, 1], np.argsort(-scores).tolist())
+        self.assertGreater(scores[3], 1)
+        self.assertLessEqual(scores[1], 1)
+        LOG.info('ending rank phrases\' test')
+
+
+if __name__ == '__main__':
+    unittest.main()
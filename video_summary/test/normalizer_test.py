@@ -0,0 +1,91 @@
+"""Unit tests that test that the text normalization of the subtitles works."""
+
+import itertools
+import logging
+import unittest
+
+import unidecode
+
+from video_summary.context.subtitles_context import Languages
+from video_summary.subtitles.normalizer import TextNormalizer, get_normalizer
+from video_summary.subtitles.stemmer import get_stemmer
+
+# Logger
+LOGGER_NAME = 'Test.Normalizer'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Texts
+TEXTS = ["Hello world! This is my test subtitle.",
+         "In this á subtitle  there are ó accented characters.",
+         "ÁRBOL, Ñandú y CAFÉ... ¿Qué tal?",
+         "  My   spaced\ttext\n",
+         "",
+         None]
+STOP_WORDS = ['my', 'this', 'is', 'are', 'there', 'Y']
+PUNCTUATION_SIGNS = ['!', '.', ',', '¿', '?']
+
+
+def reference_normalize(text, lowercase, stop_words, punctuation_signs, remove_accents):
+    """Method with the step by step normalization of a text."""
+    if lowercase:
+        text = text.lower()
+    if stop_words is not None:
+        text = ' '.join([word for word in text.split()
+                         if word.lower() not in [stop.lower() for stop in stop_words]])
+    if punctuation_signs is not None:
+        text = text.translate(str.maketrans({key: None for key in punctuation_signs}))
+    if remove_accents:
+        text = unidecode.unidecode(text)
+    return text
+
+
+class NormalizerTest(unittest.TestCase):
+    """Class with all the normalizer test methods."""
+
+    def test_normalize(self):
+        """Unit test that test that every configuration matches the step by step result."""
+        LOG.info('starting normalize\' test')
+        for lowercase, remove_stop_words, remove_punctuation, remove_accents in \
+                itertools.product([False, True], repeat=4):
+            stop_words = STOP_WORDS if remove_stop_words else None
+            punctuation_signs = PUNCTUATION_SIGNS if remove_punctuation else None
+            normalizer = TextNormalizer(lowercase, stop_words, punctuation_signs, remove_accents)
+            for text in TEXTS:
+                expected = None if text is None else reference_normalize(
+                    text, lowercase, stop_words, punctuation_signs, remove_accents)
+                self.assertEqual(expected, normalizer.normalize(text))
+        LOG.info('ending normalize\' test')
+
+    def test_normalize_all(self):
+        """Unit test that test that a list of texts is normalized in order."""
+        LOG.info('starting normalize all\' test')
+        normalizer = TextNormalizer(lowercase=True, stop_words=STOP_WORDS, remove_accents=True)
+        self.assertEqual(["hello world! test subtitle.", "arbol, nandu cafe... ?que tal?", None],
+                         normalizer.normalize_all([TEXTS[0], TEXTS[2], None]))
+        self.assertEqual([], normalizer.normalize_all([]))
+        LOG.info('ending normalize all\' test')
+
+    def test_get_normalizer(self):
+        """Unit test that test that the normalizers are built once per configuration."""
+        LOG.info('starting get normalizer\' test')
+        normalizer = get_normalizer(True, ('my', 'this'), ('!',), False)
+        self.assertIs(normalizer, get_normalizer(True, ('my', 'this'), ('!',), False))
+        self.assertIsNot(normalizer, get_normalizer(True, ('my',), ('!',), False))
+        self.assertEqual(frozenset(['my', 'this']), normalizer.stop_words)
+        self.assertIs(get_stemmer(Languages.ENGLISH),
+                      get_normalizer(True, None, None, False, Languages.ENGLISH).stemmer)
+        LOG.info('ending get normalizer\' test')
+
+    def test_stemming(self):
+        """Unit test that test that the words are replaced by their memoized stems."""
+        LOG.info('starting stemming\' test')
+        stemmer = get_stemmer(Languages.ENGLISH)
+        normalizer = TextNormalizer(stop_words=['the'], stemmer=stemmer)
+        self.assertEqual("run run, run! dog", normalizer.normalize("Run runs, the running! dogs"))
+        self.assertEqual(["run", "run"], normalizer.normalize_all(["runs", "runs"]))
+        self.assertGreater(stemmer.cache_info().hits, 0)
+
+        normalizer = TextNormalizer(stemmer=get_stemmer(Languages.SPANISH), remove_accents=True)
+        self.assertEqual("cancion cancion", normalizer.normalize("canción canciones"))
+        self.assertIsNone(get_stemmer(Languages.GREEK))
+        LOG.info('ending stemming\' test')
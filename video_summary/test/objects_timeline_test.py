@@ -0,0 +1,71 @@
+"""Unit tests that test that the objects timeline works."""
+
+import logging
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from video_summary.context.objects_context import ObjectsContext
+from video_summary.objects.objects_timeline import from_dict, from_samples, load
+
+# Logger
+LOGGER_NAME = 'Test.ObjectsTimeline'
+LOG = logging.getLogger(LOGGER_NAME)
+
+
+class ObjectsTimelineTest(unittest.TestCase):
+    """Class with all the objects timeline test methods."""
+
+    def test_from_samples(self):
+        """Unit test that test that the timeline is built from the samples."""
+        LOG.info('starting from samples\' test')
+        timeline = from_samples([30, 10, 20.4, 40], [{'dog'}, {'cat', 'dog'}, set(), {'car'}])
+        self.assertEqual([10, 20, 30, 40], timeline.times.tolist())
+        self.assertEqual(['car', 'cat', 'dog'], timeline.classes)
+        self.assertEqual([10, 30], timeline.times_of(['dog']).tolist())
+        self.assertEqual([10, 40], timeline.times_of(['cat', 'car']).tolist())
+        self.assertEqual([], timeline.times_of(['tree']).tolist())
+        self.assertEqual([False, False, False, True], timeline.mask_of(['car']).tolist())
+        LOG.info('ending from samples\' test')
+
+    def test_dict(self):
+        """Unit test that test that the timeline is converted from and to a dict."""
+        LOG.info('starting dict\' test')
+        dictionary = {"dog": [10, 23, 45], "cat": [5, 41], "tree": []}
+        timeline = from_dict(dictionary)
+        self.assertEqual([5, 10, 23, 41, 45], timeline.times.tolist())
+        self.assertEqual(dictionary, timeline.to_dict())
+        self.assertIsNone(from_dict(None))
+        LOG.info('ending dict\' test')
+
+    def test_save_and_load(self):
+        """Unit test that test that the timeline is written and read from a binary file."""
+        LOG.info('starting save and load\' test')
+        times = np.arange(0, 100000, 7)
+        timeline = from_samples(times, [{'dog'} if time % 3 else set() for time in times])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'timeline.npz')
+            timeline.save(path)
+            result = load(path)
+        self.assertEqual(np.int32, result.times.dtype)
+        self.assertEqual(timeline.times.tolist(), result.times.tolist())
+        self.assertEqual(timeline.times_of(['dog']).tolist(), result.times_of(['dog']).tolist())
+        LOG.info('ending save and load\' test')
+
+    def test_context(self):
+        """Unit test that test that the objects context persists the timeline."""
+        LOG.info('starting context\' test')
+        with ObjectsContext(test=True) as manager:
+            manager.objects_timeline = from_samples([10, 20, 30], [{'dog'}, set(), {'dog'}])
+
+        with ObjectsContext(test=True) as manager:
+            self.assertEqual([10, 30], manager.objects_timeline.times_of(['dog']).tolist())
+            self.assertEqual({'dog': [10, 30]}, manager.objects_dict)
+            self.assertNotIn("objectsDict", manager.config)
+        LOG.info('ending context\' test')
+
+
+if __name__ == '__main__':
+    unittest.main()
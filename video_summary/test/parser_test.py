@@ -0,0 +1,110 @@
+"""Unit tests that test that the streaming parser of the subtitles files works."""
+
+import codecs
+import logging
+import os
+import tempfile
+import unittest
+
+from video_summary.subtitles.parser import detect_encoding, iter_cues, read_cues, \
+    read_new_cues
+from video_summary.utils import load_subtitles
+
+# Logger
+LOGGER_NAME = 'Test.Parser'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Files
+SRT = ("1\n00:00:01,000 --> 00:00:02,500\nHello world!\n\n"
+       "2\n00:00:03,250 --> 00:00:05,000\nThis is my\nsubtitle, ¿sí?\n\n\n"
+       "3\n01:02:03,004 --> 01:02:04,005\n<i>Last</i> one.\n")
+VTT = ("WEBVTT - a test\n\nNOTE a comment\n-->\n\n"
+       "intro\n00:01.000 --> 00:02.500 align:start position:10%\nHello world!\n\n"
+       "00:00:03.250 --> 00:00:05.000\nThis is my\nsubtitle, ¿sí?\n\n"
+       "01:02:03.004 --> 01:02:04.005\n<i>Last</i> one.")
+CUES = [(1000, 2500, "Hello world!"), (3250, 5000, "This is my\nsubtitle, ¿sí?"),
+        (3723004, 3724005, "<i>Last</i> one.")]
+
+
+class ParserTest(unittest.TestCase):
+    """Class with all the parser test methods."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, data):
+        """Method to write a file in the test directory."""
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'wb') as file:
+            file.write(data)
+        return path
+
+    def test_iter_cues(self):
+        """Unit test that test that the SRT and WebVTT cues are read."""
+        LOG.info('starting iter cues\' test')
+        self.assertEqual(CUES, list(iter_cues(self.write('a.srt', SRT.encode('utf-8')))))
+        self.assertEqual(CUES, list(iter_cues(self.write('a.vtt', VTT.encode('utf-8')))))
+        self.assertEqual(CUES, list(iter_cues(self.write(
+            'crlf.srt', SRT.replace('\n', '\r\n').encode('utf-8')))))
+        self.assertEqual(CUES, list(iter_cues(self.write(
+            'packed.srt', SRT.replace('\n\n\n', '\n').replace('\n\n', '\n').encode('utf-8')))))
+        self.assertEqual([], list(iter_cues(self.write('empty.srt', b''))))
+        LOG.info('ending iter cues\' test')
+
+    def test_detect_encoding(self):
+        """Unit test that test that the encodings are detected."""
+        LOG.info('starting detect encoding\' test')
+        cases = {'utf-8': SRT.encode('utf-8'),
+                 'utf-8-sig': codecs.BOM_UTF8 + SRT.encode('utf-8'),
+                 'utf-16': SRT.encode('utf-16'),
+                 'cp1252': SRT.encode('cp1252')}
+        for encoding, data in cases.items():
+            path = self.write(encoding + '.srt', data)
+            self.assertEqual(encoding, detect_encoding(path))
+            self.assertEqual(CUES, list(iter_cues(path)))
+        LOG.info('ending detect encoding\' test')
+
+    def test_read_cues(self):
+        """Unit test that test that the cues are read into arrays."""
+        LOG.info('starting read cues\' test')
+        starts, ends, texts = read_cues(self.write('a.srt', SRT.encode('utf-8')))
+        self.assertEqual([1000, 3250, 3723004], starts.tolist())
+        self.assertEqual([2500, 5000, 3724005], ends.tolist())
+        self.assertEqual([text for _, _, text in CUES], texts)
+        self.assertEqual((0,), read_cues(self.write('empty.srt', b''))[0].shape)
+
+        subtitles_list = load_subtitles(self.write('a.vtt', VTT.encode('utf-8')))
+        self.assertEqual([[1000, 2500], [3250, 5000], [3723004, 3724005]],
+                         [sub.get_times() for sub in subtitles_list])
+        self.assertEqual([-1] * 3, [sub.score for sub in subtitles_list])
+        LOG.info('ending read cues\' test')
+
+    def test_read_new_cues(self):
+        """Unit test that test that a growing file is read in its complete new cues."""
+        LOG.info('starting read new cues\' test')
+        text = SRT + '\n'
+        cases = {'utf-8': text.encode('utf-8'),
+                 'crlf': text.replace('\n', '\r\n').encode('utf-8'),
+                 'utf-8-sig': codecs.BOM_UTF8 + text.encode('utf-8'),
+                 'utf-16': text.encode('utf-16'),
+                 'cp1252': text.encode('cp1252')}
+        for name, data in cases.items():
+            path = self.write(name + '.srt', b'')
+            cues = []
+            offset = 0
+            for size in range(1, len(data) + 1):
+                with open(path, 'ab') as file:
+                    file.write(data[size - 1:size])
+                starts, ends, texts, offset = read_new_cues(path, offset)
+                cues.extend(zip(starts.tolist(), ends.tolist(), texts))
+            self.assertEqual(CUES, cues)
+            self.assertEqual(len(data), offset)
+
+        # The last cue waits for its blank line
+        starts, _, _, offset = read_new_cues(self.write('a.srt', SRT.encode('utf-8')))
+        self.assertEqual([1000, 3250], starts.tolist())
+        self.assertEqual(SRT.encode('utf-8').index(b'\n3\n01:'), offset)
+        LOG.info('ending read new cues\' test')
@@ -0,0 +1,37 @@
+"""Unit tests that test that the resume selects the best subtitles."""
+
+import logging
+import unittest
+
+import numpy as np
+
+from video_summary.objects.subtitle import Subtitle
+from video_summary.objects.subtitle_table import SubtitleTable, from_subtitles
+from video_summary.processes.resume_video_process import subtitles_times
+
+# Logger
+LOGGER_NAME = 'Test.Resume'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Test constants (the repetitions have no score)
+SCORES = [0.9, np.nan, 0.1, np.nan, 0.7, np.nan, 0.3, np.nan]
+
+
+def get_table():
+    """Method to get the table of the test scores, one second each."""
+    return from_subtitles([Subtitle(str(index), index * 1000, index * 1000 + 500, score)
+                           for index, score in enumerate(SCORES)])
+
+
+class ResumeTest(unittest.TestCase):
+    """Class with all the resume test methods."""
+
+    def test_subtitles_times(self):
+        """Unit test that test that the percentage is applied to the scored subtitles."""
+        LOG.info('starting subtitles times\' test')
+        self.assertEqual([[0, 500], [4000, 4500]], subtitles_times(get_table(), 50).tolist())
+        self.assertEqual([[0, 500]], subtitles_times(get_table(), 25).tolist())
+        self.assertEqual(4, len(subtitles_times(get_table(), 100)))
+        self.assertEqual(0, len(subtitles_times(get_table(), 0)))
+        self.assertEqual(0, len(subtitles_times(SubtitleTable(), 50)))
+        LOG.info('ending subtitles times\' test')
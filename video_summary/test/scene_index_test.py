@@ -0,0 +1,74 @@
+"""Unit tests that test that the index of the detected scenes works."""
+
+import logging
+import unittest
+
+import numpy as np
+
+from video_summary.context.general_context import SnapPolicy
+from video_summary.objects.scene_index import SceneIndex, from_scenes
+
+# Logger
+LOGGER_NAME = 'Test.SceneIndex'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Test constants
+SCENES = [[1001, 5000], [0, 1000], [5001, 9000], [9001, 20000]]
+TIMES = [[1500, 2000], [900, 5100], [8800, 8900], [19000, 25000], [30000, 31000]]
+
+
+def reference_expand(scenes_list, times):
+    """Method with the scan of the scenes of every time of the resume process."""
+    result = []
+    for time in times:
+        after = [scene for scene in scenes_list if time[0] <= scene[1]]
+        start = after[0][0] if after else time[0]
+        after = [scene for scene in scenes_list if time[1] <= scene[1]]
+        end = after[0][1] if after else time[1]
+        result.append([start, end])
+    return result
+
+
+class SceneIndexTest(unittest.TestCase):
+    """Class with all the scene index test methods."""
+
+    def test_from_scenes(self):
+        """Unit test that test that the scenes are sorted by their start."""
+        LOG.info('starting from scenes\' test')
+        scene_index = from_scenes(SCENES)
+        self.assertEqual([0, 1001, 5001, 9001], scene_index.starts.tolist())
+        self.assertEqual([1000, 5000, 9000, 20000], scene_index.ends.tolist())
+        self.assertEqual(0, len(from_scenes(None)))
+        LOG.info('ending from scenes\' test')
+
+    def test_expand(self):
+        """Unit test that test that the intervals are expanded like the scan of the scenes."""
+        LOG.info('starting expand\' test')
+        scene_index = from_scenes(SCENES)
+        self.assertEqual(reference_expand(sorted(SCENES), TIMES),
+                         scene_index.snap(TIMES).tolist())
+
+        generator = np.random.default_rng(0)
+        bounds = np.unique(generator.integers(1, 100000, 300))
+        scenes = np.stack([np.concatenate([[0], bounds[:-1] + 1]), bounds], axis=1).tolist()
+        times = np.sort(generator.integers(0, 110000, (500, 2)), axis=1).tolist()
+        self.assertEqual(reference_expand(scenes, times),
+                         from_scenes(scenes).snap(times).tolist())
+        LOG.info('ending expand\' test')
+
+    def test_snap_policies(self):
+        """Unit test that test that every snapping policy moves the times as configured."""
+        LOG.info('starting snap policies\' test')
+        scene_index = from_scenes(SCENES)
+        self.assertEqual([[1001, 5000], [1001, 5000], [5001, 9000], [9001, 25000],
+                          [30000, 31000]],
+                         scene_index.snap(TIMES, SnapPolicy.NEAREST).tolist())
+        self.assertEqual([[1001, 5000], [5001, 9000]],
+                         scene_index.snap([[4900, 4950], [8000, 8900]],
+                                          SnapPolicy.NEAREST).tolist())
+        self.assertEqual([[1001, 2000], [900, 5100], [8800, 9000], [19000, 25000],
+                          [30000, 31000]],
+                         scene_index.snap(TIMES, SnapPolicy.LIMITED_EXPAND, 600).tolist())
+        self.assertEqual(TIMES, SceneIndex().snap(TIMES, SnapPolicy.NEAREST).tolist())
+        self.assertEqual((0, 2), scene_index.snap([]).shape)
+        LOG.info('ending snap policies\' test')
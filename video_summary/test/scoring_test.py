@@ -0,0 +1,76 @@
+"""Unit tests that test that the scoring of the cleaned subtitles works."""
+
+import logging
+import unittest
+
+import numpy as np
+
+from video_summary.context.subtitles_context import SubtitlesContext, SummarizerType, \
+    VectoringType
+from video_summary.objects.subtitle import Subtitle
+from video_summary.objects.subtitle_table import from_subtitles
+from video_summary.processes.subtitles_analysis_process import read_options
+from video_summary.subtitles.corpus import CorpusModel
+from video_summary.subtitles.scoring import PhraseScorer
+
+# Logger
+LOGGER_NAME = 'Test.Scoring'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Test constants
+PHRASES = ["the cat eats fish", "the dog eats meat", "the cat eats fish", "fish swim in rivers",
+           "the river is cold", "the cat eats fish", "dogs and cats play"]
+
+
+def get_table():
+    """Method to get the table of the test phrases, one second each."""
+    return from_subtitles([Subtitle(phrase, index * 1000, index * 1000 + 500, 0)
+                           for index, phrase in enumerate(PHRASES)])
+
+
+class ScoringTest(unittest.TestCase):
+    """Class with all the scoring test methods."""
+
+    def setUp(self):
+        with SubtitlesContext(read_only=True, test=True) as manager:
+            self.options = dict(read_options(manager), summarizer=SummarizerType.LSA,
+                                vectoringType=VectoringType.TF_IDF, hashingFeatures=0)
+
+    def test_repetitions(self):
+        """Unit test that test that the repetitions are scored once."""
+        LOG.info('starting repetitions\' test')
+        scorer = PhraseScorer(get_table(), duplicate_threshold=0.9)
+        self.assertEqual([0, 1, 3, 4, 6], scorer.representatives.tolist())
+        scores = scorer.score(self.options)
+        self.assertEqual(len(PHRASES), len(scores))
+        self.assertEqual([2, 5], np.flatnonzero(np.isnan(scores)).tolist())
+
+        unique = PhraseScorer(get_table()[scorer.representatives]).score(self.options)
+        np.testing.assert_allclose(unique, scores[scorer.representatives])
+        LOG.info('ending repetitions\' test')
+
+    def test_term_counts(self):
+        """Unit test that test that the term counts are kept between the scores."""
+        LOG.info('starting term counts\' test')
+        scorer = PhraseScorer(get_table())
+        self.assertIsNone(scorer.representatives)
+        scorer.score(self.options)
+        term_counts = scorer.term_counts
+        scorer.score(dict(self.options, vectoringType=VectoringType.COUNTERS))
+        self.assertIs(term_counts, scorer.term_counts)
+        LOG.info('ending term counts\' test')
+
+    def test_corpus(self):
+        """Unit test that test that only the IDF vectoring types use the corpus model."""
+        LOG.info('starting corpus\' test')
+        corpus = CorpusModel()
+        corpus.add('other', ["the unicorn flies", "a unicorn and a dragon", "the dragon sleeps"])
+        scorer = PhraseScorer(get_table())
+        self.assertEqual(len(corpus.counter.vocabulary),
+                         scorer.vectorize(self.options, corpus).shape[1])
+        self.assertIsNone(scorer.term_counts)
+
+        options = dict(self.options, vectoringType=VectoringType.COUNTERS)
+        np.testing.assert_array_equal(scorer.vectorize(options).toarray(),
+                                      scorer.vectorize(options, corpus).toarray())
+        LOG.info('ending corpus\' test')
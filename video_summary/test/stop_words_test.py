@@ -0,0 +1,36 @@
+"""Unit tests that test that the stop words of the subtitles' languages work."""
+
+import logging
+import unittest
+
+from video_summary.context.subtitles_context import Languages
+from video_summary.subtitles.stop_words import load_stop_words
+
+# Logger
+LOGGER_NAME = 'Test.StopWords'
+LOG = logging.getLogger(LOGGER_NAME)
+
+
+class StopWordsTest(unittest.TestCase):
+    """Class with all the stop words test methods."""
+
+    def test_load_stop_words(self):
+        """Unit test that test that every language has its lowercase stop words."""
+        LOG.info('starting load stop words\' test')
+        for language in Languages:
+            stop_words = load_stop_words(language)
+            self.assertIsInstance(stop_words, frozenset)
+            self.assertGreater(len(stop_words), 50)
+            self.assertEqual(stop_words, frozenset(word.lower() for word in stop_words))
+
+        self.assertTrue({'the', 'and', 'is', 'this'} <= load_stop_words(Languages.ENGLISH))
+        self.assertTrue({'el', 'la', 'de', 'que'} <= load_stop_words(Languages.SPANISH))
+        self.assertNotIn('subtitle', load_stop_words(Languages.ENGLISH))
+        LOG.info('ending load stop words\' test')
+
+    def test_loaded_once(self):
+        """Unit test that test that every list is read once per process."""
+        LOG.info('starting loaded once\' test')
+        self.assertIs(load_stop_words(Languages.FRENCH), load_stop_words(Languages.FRENCH))
+        self.assertIs(load_stop_words(Languages.FRENCH), load_stop_words(int(Languages.FRENCH)))
+        LOG.info('ending loaded once\' test')
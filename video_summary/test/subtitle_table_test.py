@@ -0,0 +1,103 @@
+"""Unit tests that test that the subtitle table works."""
+
+import logging
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from video_summary.objects.subtitle import Subtitle
+from video_summary.objects.subtitle_table import SubtitleTable, from_subtitles, load
+from video_summary.utils import clean_phrases, join_phrases
+
+# Logger
+LOGGER_NAME = 'Test.SubtitleTable'
+LOG = logging.getLogger(LOGGER_NAME)
+
+
+def get_table():
+    """Method that build a table with four subtitles."""
+    return from_subtitles([Subtitle("Hello,", 0, 900, 1.5),
+                           Subtitle("world!", 1000, 1900, None),
+                           Subtitle("¿Qué tal?", 2000, None, 3),
+                           Subtitle(None, None, 3900, 0.5)])
+
+
+class SubtitleTableTest(unittest.TestCase):
+    """Class with all the subtitle table test methods."""
+
+    def test_rows(self):
+        """Unit test that test that the rows read and write the columns."""
+        LOG.info('starting rows\' test')
+        table = get_table()
+        self.assertEqual(4, len(table))
+        self.assertEqual("world!", table[1].text)
+        self.assertIsNone(table[1].score)
+        self.assertEqual([2000, None], table[2].get_times())
+        self.assertEqual([None, 3900], table[-1].get_times())
+        self.assertRaises(IndexError, lambda: table[4])
+
+        table[1].score = 8
+        table[3].set_times(3000, 3950)
+        self.assertEqual(8.0, table.scores[1])
+        self.assertEqual([3000, 3950], table.times()[3].tolist())
+
+        subtitle = table.pop(0)
+        self.assertEqual(("Hello,", 0, 900, 1.5),
+                         (subtitle.text, subtitle.start, subtitle.end, subtitle.score))
+        table.append(Subtitle("Bye.", 4000, 4900, None))
+        self.assertEqual(["world!", "¿Qué tal?", None, "Bye."], table.texts)
+        self.assertTrue(np.isnan(table.scores[-1]))
+
+        table.extend(get_table()[:2])
+        self.assertEqual(6, len(table))
+        self.assertEqual([[0, 900], [1000, 1900]], table.times()[4:].tolist())
+        LOG.info('ending rows\' test')
+
+    def test_sort_slice_and_filter(self):
+        """Unit test that test that the table is sorted, sliced and filtered in bulk."""
+        LOG.info('starting sort, slice and filter\' test')
+        table = get_table()
+        ordered = table.sorted_by('scores', reverse=True)
+        self.assertEqual([2, 0, 3, 1], [table.texts.index(text) for text in ordered.texts])
+        self.assertEqual([[2000, None], [0, 900]], [row.get_times() for row in ordered[:2]])
+        self.assertEqual(["Hello,", "¿Qué tal?"], table[table.scores > 1].texts)
+        self.assertEqual(["¿Qué tal?", "Hello,"], table[[2, 0]].texts)
+        self.assertRaises(ValueError, table.sorted_by, 'texts')
+        LOG.info('ending sort, slice and filter\' test')
+
+    def test_save_and_load(self):
+        """Unit test that test that the table is read again from its binary file."""
+        LOG.info('starting save and load\' test')
+        table = get_table()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'table.npz')
+            table.save(path)
+            result = load(path)
+            SubtitleTable().save(path)
+            empty = load(path)
+        self.assertEqual(table.texts, result.texts)
+        self.assertEqual(table.starts.tolist(), result.starts.tolist())
+        self.assertEqual(table.ends.tolist(), result.ends.tolist())
+        np.testing.assert_array_equal(table.scores, result.scores)
+        self.assertEqual(0, len(empty))
+        LOG.info('ending save and load\' test')
+
+    def test_utils(self):
+        """Unit test that test that the utils functions accept the table."""
+        LOG.info('starting utils\' test')
+        subtitles_list = [Subtitle("Hello,", 0, 900, 1), Subtitle("World!", 1000, 1900, 2),
+                          Subtitle("Bye.", 2000, 2900, 3), Subtitle("and", 3000, 3900, 4)]
+        expected = join_phrases(subtitles_list)
+        result = join_phrases(from_subtitles(subtitles_list))
+        self.assertIsInstance(result, SubtitleTable)
+        self.assertEqual([sub.text for sub in expected], result.texts)
+        self.assertEqual([sub.get_times() for sub in expected], result.times().tolist())
+        self.assertEqual([sub.score for sub in expected], result.scores.tolist())
+
+        result = clean_phrases(result, remove_capital_letters=True, remove_punctuation=True,
+                               punctuation_signs=[',', '!', '.'])
+        self.assertEqual(["hello world", "bye"], result.texts)
+        LOG.info('ending utils\' test')
+
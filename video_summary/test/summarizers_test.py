@@ -0,0 +1,81 @@
+"""Unit tests that test that the summarizers of the subtitles work."""
+
+import logging
+import unittest
+
+import numpy as np
+from scipy import sparse
+
+from video_summary.context.subtitles_context import SummarizerType
+from video_summary.subtitles.lsa import rank_phrases, truncated_svd
+from video_summary.subtitles.summarizers import CentroidSummarizer, LsaSummarizer, \
+    TextRankSummarizer, build_summarizer
+
+# Logger
+LOGGER_NAME = 'Test.Summarizers'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Test constants (phrase x term counts)
+MATRIX = sparse.csr_matrix(np.array([
+    [2, 1, 0, 0, 0],
+    [1, 1, 0, 0, 0],
+    [1, 1, 1, 0, 0],
+    [0, 0, 0, 1, 1],
+    [0, 0, 0, 0, 0]
+]))
+
+
+class SummarizersTest(unittest.TestCase):
+    """Class with all the summarizers test methods."""
+
+    def test_build_summarizer(self):
+        """Unit test that test that every summarizer type is built."""
+        LOG.info('starting build summarizer\' test')
+        self.assertIsInstance(build_summarizer(SummarizerType.LSA), LsaSummarizer)
+        self.assertIsInstance(build_summarizer(1), CentroidSummarizer)
+        self.assertIsInstance(build_summarizer(SummarizerType.TEXT_RANK), TextRankSummarizer)
+        self.assertRaises(ValueError, build_summarizer, 3)
+        LOG.info('ending build summarizer\' test')
+
+    def test_lsa(self):
+        """Unit test that test that the LSA summarizer ranks like the LSA functions."""
+        LOG.info('starting LSA\' test')
+        vt, singular_values = truncated_svd(MATRIX, 2)
+        np.testing.assert_allclose(rank_phrases(vt, singular_values),
+                                   LsaSummarizer(40).score(MATRIX))
+        LOG.info('ending LSA\' test')
+
+    def test_centroid(self):
+        """Unit test that test that the centroid scores are the similarities to the mean."""
+        LOG.info('starting centroid\' test')
+        rows = MATRIX.toarray().astype(float)
+        norms = np.linalg.norm(rows, axis=1)
+        rows[norms > 0] /= norms[norms > 0, np.newaxis]
+        centroid = rows.mean(axis=0)
+        expected = rows @ centroid / np.linalg.norm(centroid)
+
+        scores = CentroidSummarizer().score(MATRIX)
+        np.testing.assert_allclose(expected, scores)
+        self.assertEqual(1, np.argmax(scores))
+        self.assertEqual(0, scores[4])
+        np.testing.assert_array_equal(np.zeros(2), CentroidSummarizer().score(
+            sparse.csr_matrix((2, 3))))
+        LOG.info('ending centroid\' test')
+
+    def test_text_rank(self):
+        """Unit test that test that TextRank ranks the phrases of the biggest cluster first."""
+        LOG.info('starting TextRank\' test')
+        summarizer = TextRankSummarizer(neighbours=1)
+        graph = summarizer.graph(MATRIX)
+        self.assertEqual(0, (graph != graph.T).nnz)
+        self.assertEqual([[1], [0, 2], [1], [], []], [row.indices.tolist() for row in graph])
+
+        scores = summarizer.score(MATRIX)
+        self.assertAlmostEqual(1, scores.sum())
+        self.assertEqual(1, np.argmax(scores))
+        self.assertAlmostEqual(scores[3], scores[4])
+
+        scores = TextRankSummarizer().score(MATRIX)
+        self.assertEqual(3, len(set(np.argsort(-scores)[:3]) & {0, 1, 2}))
+        self.assertEqual(0, len(TextRankSummarizer().score(sparse.csr_matrix((0, 3)))))
+        LOG.info('ending TextRank\' test')
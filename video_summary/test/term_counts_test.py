@@ -0,0 +1,74 @@
+"""Unit tests that test that the term counts of the subtitles work."""
+
+import logging
+import unittest
+
+import numpy as np
+
+from video_summary.context.subtitles_context import VectoringType
+from video_summary.subtitles.term_counts import TermCounts
+from video_summary.subtitles.vectorizers import build_vectorizer
+
+# Logger
+LOGGER_NAME = 'Test.TermCounts'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Phrases
+PHRASES = ["The cat sat on the mat", "a dog ate the cat's food", "the dog and the cat",
+           "Ünïcode wörds, and a b c", ""]
+
+
+class TermCountsTest(unittest.TestCase):
+    """Class with all the term counts test methods."""
+
+    def test_weighting(self):
+        """Unit test that test that every weighting matches its scikit-learn vectorizer."""
+        LOG.info('starting weighting\' test')
+        term_counts = TermCounts(PHRASES)
+        for vectoring_type in VectoringType:
+            expected = build_vectorizer(vectoring_type).fit_transform(PHRASES).toarray()
+            result = term_counts.weighting(vectoring_type)
+            self.assertEqual(expected.shape, result.shape)
+            np.testing.assert_allclose(expected, result.toarray(), err_msg=vectoring_type.name)
+        LOG.info('ending weighting\' test')
+
+    def test_hashing(self):
+        """Unit test that test that the hashed weightings match the hashing vectorizers."""
+        LOG.info('starting hashing\' test')
+        term_counts = TermCounts(PHRASES, features=64)
+        self.assertIsNone(term_counts.vocabulary)
+        for vectoring_type in VectoringType:
+            with np.errstate(divide='ignore'):  # the transformer divides by the empty columns
+                expected = build_vectorizer(vectoring_type, features=64).fit_transform(PHRASES)
+            result = term_counts.weighting(vectoring_type)
+            self.assertEqual((5, 64), result.shape)
+            np.testing.assert_allclose(expected.toarray(), result.toarray(),
+                                       err_msg=vectoring_type.name)
+        self.assertEqual(TermCounts(PHRASES).counts.sum(), term_counts.counts.sum())
+        self.assertEqual((2, 8), TermCounts(["", "a"], features=8).weighting(
+            VectoringType.TF_IDF).shape)
+        LOG.info('ending hashing\' test')
+
+    def test_counts(self):
+        """Unit test that test that the counts are kept between weightings."""
+        LOG.info('starting counts\' test')
+        term_counts = TermCounts(PHRASES)
+        self.assertEqual(5, len(term_counts))
+        self.assertEqual(['and', 'ate', 'cat', 'dog', 'food', 'mat', 'on', 'sat', 'the',
+                          'wörds', 'ünïcode'], term_counts.vocabulary.tolist())
+        self.assertEqual([2, 1, 3, 2, 1, 1, 1, 1, 3, 1, 1],
+                         term_counts.document_frequencies().tolist())
+
+        term_counts.weighting(VectoringType.BINARIES_COUNTERS).data[:] = 7
+        self.assertEqual(2, term_counts.counts[0, 8])
+        self.assertIs(term_counts.ngram_counts(), term_counts.ngram_counts())
+        LOG.info('ending counts\' test')
+
+    def test_empty(self):
+        """Unit test that test that phrases without terms give an empty matrix."""
+        LOG.info('starting empty\' test')
+        term_counts = TermCounts(["", "a"])
+        for vectoring_type in VectoringType:
+            self.assertEqual((2, 0), term_counts.weighting(vectoring_type).shape)
+        self.assertEqual((0, 0), TermCounts([]).weighting(VectoringType.TF_IDF).shape)
+        LOG.info('ending empty\' test')
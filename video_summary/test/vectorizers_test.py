@@ -0,0 +1,65 @@
+"""Unit tests that test that the subtitles' vectorizers work."""
+
+import logging
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+
+from video_summary.context.subtitles_context import VectoringType
+from video_summary.subtitles.vectorizers import build_vectorizer, tokenize
+
+# Logger
+LOGGER_NAME = 'Test.Vectorizers'
+LOG = logging.getLogger(LOGGER_NAME)
+
+# Phrases
+PHRASES = ["the cat sat on the mat", "a dog ate the cat's food", "Ünïcode wörds, and a b c"]
+
+
+class VectorizersTest(unittest.TestCase):
+    """Class with all the vectorizers test methods."""
+
+    def test_tokenize(self):
+        """Unit test that test that the tokenizer matches the scikit-learn default one."""
+        LOG.info('starting tokenize\' test')
+        analyzer = CountVectorizer(lowercase=False).build_tokenizer()
+        for phrase in PHRASES:
+            self.assertEqual(analyzer(phrase), tokenize(phrase))
+        LOG.info('ending tokenize\' test')
+
+    def test_build_vectorizer(self):
+        """Unit test that test that every job gets a new vectorizer with the same results."""
+        LOG.info('starting build vectorizer\' test')
+        expected = {
+            VectoringType.COUNTERS: CountVectorizer(),
+            VectoringType.N_GRAM_COUNTERS: CountVectorizer(ngram_range=(1, 4)),
+            VectoringType.TF_IDF: TfidfVectorizer(norm=None, smooth_idf=False),
+            VectoringType.TF_IDF_WITH_SMOOTHING_IDF_AND_NORMALIZATION_L2: TfidfVectorizer()
+        }
+        for vectoring_type, vectorizer in expected.items():
+            self.assertIsNot(build_vectorizer(vectoring_type), build_vectorizer(vectoring_type))
+            self.assertEqual((vectorizer.fit_transform(PHRASES)
+                              != build_vectorizer(vectoring_type).fit_transform(PHRASES)).nnz, 0)
+        for vectoring_type in VectoringType:
+            self.assertEqual(len(PHRASES),
+                             build_vectorizer(vectoring_type).fit_transform(PHRASES).shape[0])
+        LOG.info('ending build vectorizer\' test')
+
+    def test_concurrent_jobs(self):
+        """Unit test that test that concurrent jobs keep their own vocabularies."""
+        LOG.info('starting concurrent jobs\' test')
+        corpora = [["word{} text{}".format(job, index) for index in range(50)]
+                   for job in range(8)]
+
+        def vocabulary(corpus):
+            vectorizer = build_vectorizer(VectoringType.COUNTERS)
+            vectorizer.fit_transform(corpus)
+            return sorted(vectorizer.vocabulary_)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(vocabulary, corpora))
+        for job, result in enumerate(results):
+            self.assertEqual(51, len(result))
+            self.assertIn('word{}'.format(job), result)
+        LOG.info('ending concurrent jobs\' test')
@@ -4,33 +4,25 @@ from copy import copy
 
 import cv2
 import numpy as np
-import pysrt
-import unidecode
 from moviepy.editor import VideoFileClip
-from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
 
-from video_summary.context.general_context import ResumeMode
-from video_summary.context.subtitles_context import VectoringType, Languages
+from video_summary.context.general_context import ResumeMode, SnapPolicy
+from video_summary.context.subtitles_context import VectoringType, Languages, SummarizerType
+from video_summary.objects.interval_set import from_times
 from video_summary.objects.subtitle import Subtitle
+from video_summary.objects.subtitle_table import SubtitleTable, from_subtitles
+from video_summary.subtitles.assembler import SentenceAssembler
+from video_summary.subtitles.embedded import is_container, read_stream_cues
+from video_summary.subtitles.normalizer import get_normalizer
+from video_summary.subtitles.parser import iter_cues, read_cues, read_new_cues
 
 # String constants
 TAB = "     -  "
 END_LINE = '\n'
 LINE = "--------------------------------------------"
 
-# Switcher
-VECTORING_SWITCHER = {
-    VectoringType.COUNTERS: CountVectorizer(),
-    VectoringType.BINARIES_COUNTERS: CountVectorizer(binary=True),
-    VectoringType.N_GRAM_COUNTERS: CountVectorizer(ngram_range=(1, 4)),
-    VectoringType.TF_WITH_NORMALIZATION_L1: TfidfVectorizer(norm='l1', use_idf=False),
-    VectoringType.TF_WITH_NORMALIZATION_L2: TfidfVectorizer(norm='l2', use_idf=False),
-    VectoringType.TF_IDF: TfidfVectorizer(norm=None, smooth_idf=False),
-    VectoringType.TF_IDF_WITH_SMOOTHING_IDF: TfidfVectorizer(norm=None, smooth_idf=True),
-    VectoringType.TF_IDF_WITH_SMOOTHING_IDF_AND_NORMALIZATION_L1:
-        TfidfVectorizer(norm='l1', smooth_idf=True),
-    VectoringType.TF_IDF_WITH_SMOOTHING_IDF_AND_NORMALIZATION_L2: TfidfVectorizer()
-}
+# Detector input
+DETECTOR_INPUT_SIZE = (320, 320)
 
 # Translate
 TRANSLATE_RESUME_MODE = {
@@ -39,6 +31,12 @@ TRANSLATE_RESUME_MODE = {
     ResumeMode.SUBTITLES_AND_OBJECTS: "Subtitles and objects"
 }
 
+TRANSLATE_SNAP_POLICY = {
+    SnapPolicy.EXPAND: "Expand to scenes",
+    SnapPolicy.NEAREST: "Nearest scene boundary",
+    SnapPolicy.LIMITED_EXPAND: "Expand to scenes with a limit"
+}
+
 TRANSLATE_VECTORING = {
     VectoringType.COUNTERS: "Counters",
     VectoringType.BINARIES_COUNTERS: "Binaries counters",
@@ -53,6 +51,12 @@ TRANSLATE_VECTORING = {
         "TF-IDF with smoothing IDF and normalization L2"
 }
 
+TRANSLATE_SUMMARIZER = {
+    SummarizerType.LSA: "LSA",
+    SummarizerType.CENTROID: "Centroid",
+    SummarizerType.TEXT_RANK: "TextRank"
+}
+
 TRANSLATE_LANGUAGE = {
     Languages.ARABIC: "Arabic",
     Languages.AZERBAIJANI: "Azerbaijani",
@@ -119,27 +123,6 @@ def get_sec_from_string(time_str):
     return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
 
 
-def get_milli_sec_from_sub(time_sub):
-    """
-    Method to get seconds from SubRipTime.
-
-    ...
-
-    Parameters
-    ----------
-    time_sub : SubRipTime
-        the SubRipTime object with the time
-
-    Returns
-    -------
-    float
-        the time_sub in seconds
-    """
-
-    return float((time_sub.hours * 3600 + time_sub.minutes * 60 + time_sub.seconds)
-                 * 1000 + time_sub.milliseconds)
-
-
 def get_time_from_line(string):
     """
     Method to get the time from a ffmpeg output string.
@@ -198,6 +181,110 @@ def load_yolo(weights_path, cfg_path, names_path):
     return net, classes, output_layers
 
 
+def prepare_frame(frame):
+    """
+    Method to reduce a frame before the objects detection.
+
+    ...
+
+    Parameters
+    ----------
+    frame : array
+        a numpy array representing the RGB picture of the clip
+
+    Returns
+    -------
+    array
+        a numpy array representing the reduced RGB picture
+
+    """
+
+    return cv2.resize(frame, None, fx=0.4, fy=0.4)
+
+
+def blob_from_frames(frames):
+    """
+    Method to get the Yolo's input blob of a batch of reduced frames.
+
+    ...
+
+    Parameters
+    ----------
+    frames : list
+        a list of numpy arrays representing the reduced RGB pictures
+
+    Returns
+    -------
+    array
+        the numpy blob with the frames
+
+    """
+
+    return cv2.dnn.blobFromImages(frames, scalefactor=0.00392, size=DETECTOR_INPUT_SIZE,
+                                  mean=(0, 0, 0), swapRB=True, crop=False)
+
+
+def read_detections(outputs):
+    """
+    Method to read the detections of a frame from the Yolo's outputs.
+
+    ...
+
+    Parameters
+    ----------
+    outputs : list
+        a list of numpy matrices with the output layers' results of the frame
+
+    Returns
+    -------
+    array
+        an int numpy array with the class id of every detection
+    array
+        a float numpy array with the confidence of every detection
+    array
+        a float numpy matrix (detections x 4) with the normalized box of every detection
+
+    """
+
+    detects = np.concatenate([output.reshape(-1, output.shape[-1]) for output in outputs])
+    scores = detects[:, 5:]
+    class_ids = np.argmax(scores, axis=1)
+    confidences = scores[np.arange(len(class_ids)), class_ids]
+    return class_ids, confidences, detects[:, :4]
+
+
+def locate_objects(frame, net, output_layers, prepared=False):
+    """
+    Method to locate the objects in a frame.
+
+    ...
+
+    Parameters
+    ----------
+    frame : array
+        a numpy array representing the RGB picture of the clip
+    net : net
+        the Yolo's net
+    output_layers : list
+        a list of strings with the layers names
+    prepared : bool
+        a boolean to indicate that the frame is already reduced
+
+    Returns
+    -------
+    array
+        an int numpy array with the class id of every detection
+    array
+        a float numpy array with the confidence of every detection
+    array
+        a float numpy matrix (detections x 4) with the normalized box of every detection
+
+    """
+
+    net.setInput(blob_from_frames([frame if prepared else prepare_frame(frame)]))
+    return read_detections(net.forward(output_layers))
+
+
 def detect_objects(frame, net, output_layers, classes):
     """
     Method to detect the objects in a frame.
@@ -222,18 +309,8 @@ def detect_objects(frame, net, output_layers, classes):
 
     """
 
-    frame = cv2.resize(frame, None, fx=0.4, fy=0.4)
-    blob = cv2.dnn.blobFromImage(frame, scalefactor=0.00392, size=(320, 320),
-                                 mean=(0, 0, 0), swapRB=True, crop=False)
-    net.setInput(blob)
-    outputs = net.forward(output_layers)
-    result = []
-    for output in outputs:
-        for detect in output:
-            scores = detect[5:]
-            class_id = np.argmax(scores)
-            result.append(classes[class_id])
-    return set(result)
+    class_ids, _, _ = locate_objects(frame, net, output_layers)
+    return {classes[class_id] for class_id in np.unique(class_ids)}
 
 
 def fuse_subtitles(first_sub, second_sub):
@@ -286,7 +363,7 @@ def fuse_subtitles(first_sub, second_sub):
     return result
 
 
-def join_phrases(subtitles_list):
+def join_phrases(subtitles_list, max_length=0, max_duration=0):
     """
     Method to join the text of the successive subtitles.
 
@@ -295,36 +372,31 @@ def join_phrases(subtitles_list):
     Parameters
     ----------
     subtitles_list : list
-        a subtitles list
+        a subtitles list or a SubtitleTable
+    max_length : int
+        the maximum number of characters of a joined subtitle (0 for no limit)
+    max_duration : int
+        the maximum duration in milliseconds of a joined subtitle (0 for no limit)
 
     Returns
     -------
     list
-        a new subtitles list with the successive subtitles joined
+        a new subtitles list (or SubtitleTable) with the successive subtitles joined
 
     """
 
     if subtitles_list is None:
         return None
 
-    actual_sub = None
-    result = []
-    for sub in subtitles_list:
-        if sub is not None:
-            if actual_sub is None:
-                actual_sub = sub
-            else:
-                actual_sub = fuse_subtitles(actual_sub, sub)
-
-            if actual_sub.text is not None and actual_sub.text[-1] in '¡!.¿?':
-                result.append(actual_sub)
-                actual_sub = None
+    result = SentenceAssembler(max_length, max_duration).assemble(subtitles_list)
+    if isinstance(subtitles_list, SubtitleTable):
+        return from_subtitles(result)
     return result
 
 
 def clean_phrases(subtitles_list, remove_capital_letters=False, remove_stop_words=False,
                   remove_punctuation=False, remove_accents=False, remove_all=False, stop_words=None,
-                  punctuation_signs=None):
+                  punctuation_signs=None, stemmer_language=None):
     """
     Method to clean the text of the subtitles.
 
@@ -333,7 +405,7 @@ def clean_phrases(subtitles_list, remove_capital_letters=False, remove_stop_word
     Parameters
     ----------
     subtitles_list : list
-        a subtitles list
+        a subtitles list or a SubtitleTable
     remove_capital_letters : bool
         a boolean to activate the removal of capital letters
     remove_stop_words : bool
@@ -348,36 +420,36 @@ def clean_phrases(subtitles_list, remove_capital_letters=False, remove_stop_word
         a list of strings with all the stop words to remove
     punctuation_signs : list
         a list of chars with all the punctuation signs to remove
+    stemmer_language : int
+        the language of the stemming of the words (class Languages), or None to keep the words
 
     Returns
     -------
     list
-        a new subtitles list with the text of the subtitles cleaned
+        a new subtitles list with the text of the subtitles cleaned (the same SubtitleTable
+        with its texts cleaned)
 
     """
 
     if subtitles_list is None:
         return None
 
-    result = []
-    if punctuation_signs is None:
-        punctuation_signs = []
-    punctuation_table = str.maketrans(
-        {key: None for key in punctuation_signs})
-
-    for sub in subtitles_list:
-        if sub is not None:
-            if sub.text is not None:
-                if remove_capital_letters or remove_all:
-                    sub.text = sub.text.lower()
-                if remove_stop_words or remove_all:
-                    sub.text = ' '.join([word for word in sub.text.split()
-                                         if word.lower() not in stop_words])
-                if remove_punctuation or remove_all:
-                    sub.text = sub.text.translate(punctuation_table)
-                if remove_accents or remove_all:
-                    sub.text = unidecode.unidecode(sub.text)
-            result.append(sub)
+    remove_stop_words = remove_stop_words or remove_all
+    remove_punctuation = remove_punctuation or remove_all
+    normalizer = get_normalizer(
+        lowercase=remove_capital_letters or remove_all,
+        stop_words=tuple(stop_words or ()) if remove_stop_words else None,
+        punctuation_signs=tuple(punctuation_signs or ()) if remove_punctuation else None,
+        remove_accents=remove_accents or remove_all,
+        stemmer_language=stemmer_language)
+
+    if isinstance(subtitles_list, SubtitleTable):
+        subtitles_list.texts = normalizer.normalize_all(subtitles_list.texts)
+        return subtitles_list
+
+    result = [sub for sub in subtitles_list if sub is not None]
+    for sub, text in zip(result, normalizer.normalize_all([sub.text for sub in result])):
+        sub.text = text
     return result
 
 
@@ -390,7 +462,7 @@ def load_subtitles(path):
     Parameters
     ----------
     path : str
-        the subtitles' path
+        the subtitles' path (SRT or WebVTT)
 
     Returns
     -------
@@ -399,13 +471,62 @@ def load_subtitles(path):
 
     """
 
-    subtitles = pysrt.open(path)
-    subtitles_list = []
-    for sub in subtitles:
-        sub_start = get_milli_sec_from_sub(sub.start)
-        sub_end = get_milli_sec_from_sub(sub.end)
-        subtitles_list.append(Subtitle(sub.text, sub_start, sub_end, -1))
-    return subtitles_list
+    return [Subtitle(text, start, end, -1) for start, end, text in iter_cues(path)]
+
+
+def load_subtitle_table(path, stream_language=None):
+    """
+    Method to load the subtitles as a SubtitleTable.
+
+    ...
+
+    Parameters
+    ----------
+    path : str
+        the subtitles' path (SRT or WebVTT), or the path of a video container with a text
+        subtitles stream
+    stream_language : str
+        the language tag of the subtitles stream of a video container (None for the first text
+        stream)
+
+    Returns
+    -------
+    SubtitleTable
+        a table with the subtitles
+
+    """
+
+    if is_container(path):
+        starts, ends, texts = read_stream_cues(path, stream_language)
+    else:
+        starts, ends, texts = read_cues(path)
+    return SubtitleTable(texts, starts, ends, np.full(len(texts), -1.0))
+
+
+def load_new_subtitles(path, offset=0):
+    """
+    Method to load the subtitles of a growing subtitles file from a byte offset.
+
+    ...
+
+    Parameters
+    ----------
+    path : str
+        the subtitles' path (SRT or WebVTT)
+    offset : int
+        the byte offset where the reading starts, returned by the last reading
+
+    Returns
+    -------
+    SubtitleTable
+        a table with the subtitles which end with a blank line after the offset
+    int
+        the byte offset where the next reading starts
+
+    """
+
+    starts, ends, texts, offset = read_new_cues(path, offset)
+    return SubtitleTable(texts, starts, ends, np.full(len(texts), -1.0)), offset
 
 
 def normalize_times(times):
@@ -417,30 +538,19 @@ def normalize_times(times):
     Parameters
     ----------
     times : list
-        the times' list with int pairs (start, end)
+        the times' list with int pairs (start, end), which may contain None
 
     Returns
     -------
     list
-        the times' list with int pairs (start, end) normalized
+        a new times' list with int pairs (start, end) sorted and merged (the times one
+        millisecond apart are merged)
 
     """
 
     if times is None:
         return None
-
-    result = []
-    last = -99
-    for time in times:
-        if time is not None:
-            if last + 1 < time[0]:
-                result.append(time)
-            else:
-                last = max(last, time[1])
-                result[-1][1] = last
-            last = result[-1][1]
-
-    return result
+    return from_times(times).union(gap=1).to_list()
 
 
 def print_config(config):
@@ -470,6 +580,11 @@ def print_config(config):
     if config["General"]["detectScenes"]:
         result += TAB + "Scenes difference: " + str(int(
             config["General"]["scenesDifference"] * 100)) + "%" + END_LINE
+        result += TAB + "Snap policy: " + TRANSLATE_SNAP_POLICY.get(
+            config["General"].get("snapPolicy", SnapPolicy.EXPAND)) + END_LINE
+        if config["General"].get("snapPolicy") == SnapPolicy.LIMITED_EXPAND:
+            result += TAB + "Max snap extension: " + str(
+                config["General"]["maxSnapExtension"]) + " ms" + END_LINE
 
     if config["General"]["resumeMode"] in (ResumeMode.OBJECTS, ResumeMode.SUBTITLES_AND_OBJECTS):
         result += LINE + END_LINE
@@ -484,18 +599,63 @@ def print_config(config):
         else:
             result += TAB + "Analysis periodicity: each " + str(
                 config["Objects"]["millisecondsPeriodicity"]) + " milliseconds" + END_LINE
+        if config["Objects"].get("minConfidence"):
+            result += TAB + "Minimum confidence: " + str(int(
+                config["Objects"]["minConfidence"] * 100)) + "%" + END_LINE
+        if config["Objects"].get("minArea"):
+            result += TAB + "Minimum area: " + str(int(
+                config["Objects"]["minArea"] * 100)) + "%" + END_LINE
         result += TAB + "Yolo weights path: " + config["Objects"]["yoloWeightsPath"] + END_LINE
         result += TAB + "Yolo cfg path: " + config["Objects"]["yoloCfgPath"] + END_LINE
         result += TAB + "Yolo names path: " + config["Objects"]["yoloNamesPath"] + END_LINE
+        result += TAB + "Shared inference: " + str(
+            config["Objects"].get("sharedInference", False)) + END_LINE
+        result += TAB + "Screening cascade: " + str(
+            config["Objects"].get("cascade", False)) + END_LINE
+        if config["Objects"].get("cascade"):
+            result += TAB + "Screen weights path: " + str(
+                config["Objects"]["screenWeightsPath"]) + END_LINE
+            result += TAB + "Screen cfg path: " + str(
+                config["Objects"]["screenCfgPath"]) + END_LINE
+            result += TAB + "Screen threshold: " + str(int(
+                config["Objects"]["screenThreshold"] * 100)) + "%" + END_LINE
 
     if config["General"]["resumeMode"] in (ResumeMode.SUBTITLES, ResumeMode.SUBTITLES_AND_OBJECTS):
         result += LINE + END_LINE
         result += "Subtitles:" + END_LINE
         result += TAB + "Subtitles path: " + config["Subtitles"]["subtitlesPath"] + END_LINE
+        if config["Subtitles"].get("streamLanguage"):
+            result += TAB + "Subtitles stream language: " + config["Subtitles"][
+                "streamLanguage"] + END_LINE
         result += TAB + "Resume percentage: " + str(
             config["Subtitles"]["resumePercentage"]) + "%" + END_LINE
         result += TAB + "Vectoring type: " + TRANSLATE_VECTORING.get(
             config["Subtitles"]["vectoringType"]) + END_LINE
+        result += TAB + "Summarizer: " + TRANSLATE_SUMMARIZER.get(
+            config["Subtitles"].get("summarizer", SummarizerType.LSA)) + END_LINE
+        if config["Subtitles"].get("hashingFeatures"):
+            result += TAB + "Hashing features: " + str(
+                config["Subtitles"]["hashingFeatures"]) + END_LINE
+        if config["Subtitles"].get("concepts"):
+            result += TAB + "Concepts: " + str(config["Subtitles"]["concepts"]) + END_LINE
+        if config["Subtitles"].get("phrasesPerConcept", 1) > 1:
+            result += TAB + "Phrases per concept: " + str(
+                config["Subtitles"]["phrasesPerConcept"]) + END_LINE
+        if config["Subtitles"].get("maxSentenceLength"):
+            result += TAB + "Max sentence length: " + str(
+                config["Subtitles"]["maxSentenceLength"]) + END_LINE
+        if config["Subtitles"].get("maxSentenceDuration"):
+            result += TAB + "Max sentence duration: " + str(
+                config["Subtitles"]["maxSentenceDuration"]) + " ms" + END_LINE
+        if config["Subtitles"].get("duplicateThreshold"):
+            result += TAB + "Duplicate threshold: " + str(int(
+                config["Subtitles"]["duplicateThreshold"] * 100)) + "%" + END_LINE
+        if config["Subtitles"].get("incrementalAnalysis"):
+            result += TAB + "Incremental analysis: True" + END_LINE
+        if config["Subtitles"].get("corpusPath"):
+            result += TAB + "Corpus path: " + config["Subtitles"]["corpusPath"] + END_LINE
+            result += TAB + "Update corpus: " + str(
+                config["Subtitles"].get("updateCorpus", False)) + END_LINE
         result += TAB + "Remove punctuation: " + str(
             config["Subtitles"]["removePunctuation"]) + END_LINE
         if config["Subtitles"]["removePunctuation"]:
@@ -506,6 +666,9 @@ def print_config(config):
         if config["Subtitles"]["removeStopWords"]:
             result += TAB + "Stop words language: " + TRANSLATE_LANGUAGE.get(
                 config["Subtitles"]["language"]) + END_LINE
+        if config["Subtitles"].get("stemWords"):
+            result += TAB + "Stemming language: " + TRANSLATE_LANGUAGE.get(
+                config["Subtitles"]["language"]) + END_LINE
         result += TAB + "Remove capital letters: " + str(
             config["Subtitles"]["removeCapitalLetters"]) + END_LINE
         result += TAB + "Remove accents: " + str(config["Subtitles"]["removeAccents"]) + END_LINE